@@ -0,0 +1,289 @@
+import json
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from .essentials import Console
+from .graphics.textures import TextureAtlas
+
+
+class AssetLoader:
+    """
+    How one kind of asset is loaded. decode(path) runs on a worker thread and must not touch GL; upload(name, data)
+    runs on the context thread inside the per-frame upload budget and returns the asset's value (the decoded data
+    when there is no upload step). unload(name, value) is called when the asset is evicted.
+    """
+    __slots__ = ("kind", "extensions", "decode", "upload", "unload", "size")
+
+    def __init__(self, kind: str, extensions: tuple[str, ...], decode: Callable[[str], Any],
+                 upload: Optional[Callable[[str, Any], Any]] = None, unload: Optional[Callable[[str, Any], None]] = None,
+                 size: Optional[Callable[[Any], int]] = None):
+        self.kind = kind
+        self.extensions = extensions
+        self.decode = decode
+        self.upload = upload
+        self.unload = unload
+        self.size = size
+
+
+class AssetHandle:
+    """
+    A loaded or loading asset. The same handle is returned for every load of one path, each adding a reference;
+    call release() once per load. Unreferenced assets stay cached until the memory budget needs their space.
+    """
+    __slots__ = ("path", "kind", "future", "state", "value", "error", "refCount", "size")
+
+    LOADING = "loading"
+    LOADED = "loaded"
+    FAILED = "failed"
+    EVICTED = "evicted"
+
+    def __init__(self, path: str, kind: str):
+        self.path = path
+        self.kind = kind
+        self.future: Future = Future()
+        self.state: str = AssetHandle.LOADING
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.refCount: int = 0
+        self.size: int = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.state == AssetHandle.LOADED
+
+    def wait(self, timeout: Optional[float] = None) -> Any:
+        """
+        Blocks until the asset is loaded and returns its value. On the context thread the pending uploads are applied
+        while waiting, ignoring the frame budget; waiting on future.result() there would never finish.
+        """
+        if threading.get_ident() == Assets._uploadThread:
+            deadline = None if timeout is None else time.perf_counter() + timeout
+            while not self.future.done():
+                if deadline is not None and time.perf_counter() > deadline:
+                    raise TimeoutError(f"Asset {self.path} did not load within {timeout} s")
+                try:
+                    Assets._apply(Assets._decoded.get(timeout=0.01))
+                except queue.Empty:
+                    pass
+        return self.future.result(timeout)
+
+    def release(self) -> None:
+        if self.refCount <= 0:
+            Console.warn(f"Asset {self.path} was released more often than it was loaded.")
+            return
+        self.refCount -= 1
+        if self.refCount == 0:
+            Assets._evict()
+
+    def __repr__(self) -> str:
+        return f"AssetHandle({self.path!r}, {self.kind}, {self.state}, refs={self.refCount})"
+
+
+class Assets:
+    """
+    Loads files on a worker thread pool so reading and decoding never stall the frame. Requests for a path already
+    loading or loaded share one handle. Results that need GL are uploaded on the context thread by processUploads(),
+    which Window.mainloop calls once a frame and which stops after uploadBudget seconds; the rest wait for the next
+    frame. Loaded assets are cached with reference counts, and unreferenced ones are evicted least recently used
+    first once their total size exceeds memoryBudget.
+    """
+
+    workers: int = min(4, os.cpu_count() or 1)
+    memoryBudget: int = 256 * 1024 * 1024  # Bytes of cached assets before unreferenced ones are evicted
+    uploadBudget: float = 0.002  # Seconds of uploads per frame; at least one upload is applied every frame
+
+    # Cache lookups served by an existing handle, loads started, evictions, and uploads applied in the last frame
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    lastFrameUploads: int = 0
+    memoryUsed: int = 0
+
+    _loaders: dict[str, AssetLoader] = {}
+    _assets: "OrderedDict[str, AssetHandle]" = OrderedDict()  # Least recently used first
+    _decoded: "queue.SimpleQueue[tuple[AssetHandle, Any, Optional[BaseException]]]" = queue.SimpleQueue()
+    _pool: Optional[ThreadPoolExecutor] = None
+    _uploadThread: Optional[int] = threading.main_thread().ident
+
+    @staticmethod
+    def registerLoader(loader: AssetLoader) -> None:
+        Assets._loaders[loader.kind] = loader
+
+    @staticmethod
+    def load(path: str, kind: Optional[str] = None) -> AssetHandle:
+        """Starts loading path, or returns the handle of the load already started, adding a reference either way."""
+        path = os.path.abspath(path)
+        handle = Assets._assets.get(path)
+        if handle is not None and handle.state in (AssetHandle.LOADING, AssetHandle.LOADED):
+            Assets._assets.move_to_end(path)
+            handle.refCount += 1
+            Assets.hits += 1
+            return handle
+
+        loader = Assets._loader(path, kind)
+        handle = AssetHandle(path, loader.kind)
+        handle.refCount = 1
+        handle.future.set_running_or_notify_cancel()
+        Assets._assets[path] = handle
+        Assets.misses += 1
+        if Assets._pool is None:
+            Assets._pool = ThreadPoolExecutor(Assets.workers, thread_name_prefix="Assets")
+        Assets._pool.submit(Assets._decode, handle, loader)
+        return handle
+
+    @staticmethod
+    def loadAll(paths: list[str]) -> list[AssetHandle]:
+        """Starts every load at once, e.g. all assets of a level behind a loading screen."""
+        return [Assets.load(path) for path in paths]
+
+    @staticmethod
+    def allLoaded(handles: list[AssetHandle]) -> bool:
+        return all(handle.state != AssetHandle.LOADING for handle in handles)
+
+    @staticmethod
+    def get(path: str) -> Optional[AssetHandle]:
+        """The handle of path if it was requested and not evicted, without adding a reference."""
+        return Assets._assets.get(os.path.abspath(path))
+
+    @staticmethod
+    def processUploads() -> None:
+        """Applies finished decodes on the context thread until uploadBudget is used up."""
+        Assets._uploadThread = threading.get_ident()
+        uploads = 0
+        deadline = time.perf_counter() + Assets.uploadBudget
+        while uploads == 0 or time.perf_counter() < deadline:
+            try:
+                item = Assets._decoded.get_nowait()
+            except queue.Empty:
+                break
+            Assets._apply(item)
+            uploads += 1
+        Assets.lastFrameUploads = uploads
+
+    @staticmethod
+    def pending() -> int:
+        return sum(1 for handle in Assets._assets.values() if handle.state == AssetHandle.LOADING)
+
+    @staticmethod
+    def unloadUnused() -> None:
+        """Evicts every unreferenced asset now, regardless of the memory budget."""
+        for handle in [handle for handle in Assets._assets.values() if handle.refCount == 0 and handle.state != AssetHandle.LOADING]:
+            Assets._remove(handle)
+
+    @staticmethod
+    def shutdown() -> None:
+        """Waits for the running decodes and stops the worker threads. Loading again starts a new pool."""
+        if Assets._pool is not None:
+            Assets._pool.shutdown(wait=True, cancel_futures=True)
+            Assets._pool = None
+
+    @staticmethod
+    def _loader(path: str, kind: Optional[str]) -> AssetLoader:
+        if kind is not None:
+            loader = Assets._loaders.get(kind)
+            if loader is None:
+                raise ValueError(f"No asset loader for kind {kind}")
+            return loader
+        extension = os.path.splitext(path)[1].lower()
+        for loader in Assets._loaders.values():
+            if extension in loader.extensions:
+                return loader
+        return Assets._loaders["bytes"]
+
+    @staticmethod
+    def _decode(handle: AssetHandle, loader: AssetLoader) -> None:
+        # Worker thread: only file I/O and CPU decoding, the result goes to the context thread
+        try:
+            Assets._decoded.put((handle, loader.decode(handle.path), None))
+        except BaseException as error:
+            Assets._decoded.put((handle, None, error))
+
+    @staticmethod
+    def _apply(item: tuple[AssetHandle, Any, Optional[BaseException]]) -> None:
+        handle, data, error = item
+        loader = Assets._loaders[handle.kind]
+        if error is None:
+            try:
+                handle.value = loader.upload(handle.path, data) if loader.upload is not None else data
+                handle.size = loader.size(data) if loader.size is not None else Assets._sizeOf(data)
+            except BaseException as upload_error:
+                error = upload_error
+        if error is not None:
+            handle.state = AssetHandle.FAILED
+            handle.error = error
+            # A failed path is loaded again by the next request
+            if Assets._assets.get(handle.path) is handle:
+                del Assets._assets[handle.path]
+            Console.error(f"Failed to load asset {handle.path}: {error}")
+            handle.future.set_exception(error)
+            return
+
+        handle.state = AssetHandle.LOADED
+        Assets.memoryUsed += handle.size
+        handle.future.set_result(handle.value)
+        Assets._evict()
+
+    @staticmethod
+    def _evict() -> None:
+        if Assets.memoryUsed <= Assets.memoryBudget:
+            return
+        for handle in list(Assets._assets.values()):
+            if Assets.memoryUsed <= Assets.memoryBudget:
+                break
+            if handle.refCount == 0 and handle.state == AssetHandle.LOADED:
+                Assets._remove(handle)
+
+    @staticmethod
+    def _remove(handle: AssetHandle) -> None:
+        del Assets._assets[handle.path]
+        if handle.state == AssetHandle.LOADED:
+            Assets.memoryUsed -= handle.size
+            loader = Assets._loaders[handle.kind]
+            if loader.unload is not None:
+                loader.unload(handle.path, handle.value)
+        handle.state = AssetHandle.EVICTED
+        handle.value = None
+        Assets.evictions += 1
+
+    @staticmethod
+    def _sizeOf(data: Any) -> int:
+        if isinstance(data, np.ndarray):
+            return data.nbytes
+        if isinstance(data, (bytes, bytearray, str)):
+            return len(data)
+        return 0
+
+
+def _readBytes(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def _readText(path: str) -> str:
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
+
+def _readJSON(path: str) -> Any:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _decodeImage(path: str) -> np.ndarray:
+    return TextureAtlas.decode(path)
+
+
+Assets.registerLoader(AssetLoader("bytes", (), _readBytes))
+Assets.registerLoader(AssetLoader("text", (".txt", ".glsl", ".vert", ".frag", ".vs", ".fs"), _readText))
+Assets.registerLoader(AssetLoader("json", (".json",), _readJSON))
+# Decoded on a worker, packed into the atlas on the context thread; the atlas uploads the page when it is next drawn
+Assets.registerLoader(AssetLoader("texture", (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tga"), _decodeImage,
+                                  upload=TextureAtlas.add, unload=lambda name, region: TextureAtlas.remove(name),
+                                  size=lambda pixels: pixels.nbytes))
@@ -1,12 +1,18 @@
-import OpenGL.GL as opengl
-from ..essentials import Component, GameObject, Console, Color32
+from ..graphics.gl import opengl
+from ..graphics.glstate import GLState
+from ..graphics.textures import TextureAtlas, AtlasRegion
+from ..essentials import Renderer, GameObject, Console, Color32
+from typing import Optional, Union
 
-class SpriteRenderer(Component):
+class SpriteRenderer(Renderer):
+    serializedFields = ("sprite", "color", "texture")
 
-    def __init__(self, gameObject: GameObject, sprite: str = "None", color:Color32 = Color32(255, 255, 255, 1)):
+    def __init__(self, gameObject: GameObject, sprite: str = "None", color: Optional[Color32] = None,
+                 texture: Union[str, AtlasRegion, None] = None):
         super().__init__(gameObject)
         self.sprite = sprite
-        self.color:Color32 = color
+        self.color: Color32 = color if color is not None else Color32(255, 255, 255, 1)  # Own instance: colors change in place
+        self.texture: Optional[AtlasRegion] = TextureAtlas.get(texture) if isinstance(texture, str) else texture
 
 
     def start(self):
@@ -14,28 +20,41 @@ class SpriteRenderer(Component):
 
 
     def update(self):
+        GLState.useFixedFunction()
+        texture = self.texture
+        GLState.setBlend(texture is not None)
+        if texture is not None:
+            TextureAtlas.upload()
+            GLState.bindTexture(opengl.GL_TEXTURE_2D, texture.page.texture)
+        GLState.setCapability(opengl.GL_TEXTURE_2D, texture is not None)
+        u0, v0, u1, v1 = texture.uv if texture is not None else TextureAtlas.FULL_UV
 
         opengl.glPushMatrix()
-        opengl.glTranslatef(self.gameObject.transform.position.x, self.gameObject.transform.position.y, 0)
-        opengl.glRotatef(self.gameObject.transform.rotation, 0, 0, 1)
-        opengl.glScalef(self.gameObject.transform.scale.x, self.gameObject.transform.scale.y, 1)
+        opengl.glMultTransposeMatrixf(self.gameObject.transform.getMatrix())
 
         match self.sprite:
             case "rectangle":
                 opengl.glBegin(opengl.GL_QUADS)
-                opengl.glColor3f(*self.color.getColor())
+                opengl.glColor3f(*self.color.getColor()[:3])
+                opengl.glTexCoord2f(u0, v0)
                 opengl.glVertex2f(-0.5, -0.5)
+                opengl.glTexCoord2f(u1, v0)
                 opengl.glVertex2f( 0.5, -0.5)
+                opengl.glTexCoord2f(u1, v1)
                 opengl.glVertex2f( 0.5,  0.5)
+                opengl.glTexCoord2f(u0, v1)
                 opengl.glVertex2f(-0.5,  0.5)
                 opengl.glEnd()
 
 
             case "triangle":
                 opengl.glBegin(opengl.GL_TRIANGLES)
-                opengl.glColor3f(*self.color.getColor())
+                opengl.glColor3f(*self.color.getColor()[:3])
+                opengl.glTexCoord2f(u0, v0)
                 opengl.glVertex2f(-0.5, -0.5)
+                opengl.glTexCoord2f(u1, v0)
                 opengl.glVertex2f( 0.5, -0.5)
+                opengl.glTexCoord2f((u0 + u1) / 2, v1)
                 opengl.glVertex2f( 0.0,  0.5)
                 opengl.glEnd()
 
@@ -0,0 +1,384 @@
+"""
+Opt-in entity component system for crowds too large for one GameObject per entity. Entities are rows of archetype
+tables, one table per set of component types, with a NumPy column per component field. EntitySystems query the
+tables and process whole columns at once. GameObjects join the same data through EntityLink.
+"""
+
+from typing import Any, Iterator, Optional, Union
+
+import numpy as np
+
+from .essentials import Component, GameObject
+
+FieldSpec = Union[type, np.dtype, tuple]  # A dtype, or (dtype, shape) for vector fields such as (np.float32, 2)
+
+
+class ComponentType:
+    """Plain data component: named fields, each stored as one column per archetype."""
+    __slots__ = ("name", "fields", "defaults", "_id")
+    _count: int = 0
+
+    def __init__(self, name: str, fields: dict[str, FieldSpec], defaults: Optional[dict[str, Any]] = None):
+        self.name = name
+        self.fields: dict[str, tuple[np.dtype, tuple[int, ...]]] = {}
+        for field, spec in fields.items():
+            dtype, shape = spec if isinstance(spec, tuple) else (spec, ())
+            self.fields[field] = (np.dtype(dtype), (shape,) if isinstance(shape, int) else tuple(shape))
+        self.defaults: dict[str, Any] = dict(defaults or {})
+        # Orders types deterministically inside archetype keys
+        self._id = ComponentType._count
+        ComponentType._count += 1
+
+    def __repr__(self) -> str:
+        return f"ComponentType({self.name})"
+
+
+# GameObject Transform data, kept in sync for linked GameObjects by World.update. float64 like the Transform's own
+# floats, so the round trip through the columns leaves untouched values exactly as they were
+TransformData = ComponentType("Transform", {"position": (np.float64, 2), "rotation": np.float64, "scale": (np.float64, 2)},
+                              defaults={"scale": (1.0, 1.0)})
+
+
+class Archetype:
+    """All entities with exactly one set of component types, as packed rows. Rows are kept dense by swap-removal."""
+
+    def __init__(self, index: int, types: frozenset[ComponentType]):
+        self.index = index
+        self.types = types
+        self.count = 0
+        self.entities = np.empty(0, dtype=np.int64)
+        self.columns: dict[ComponentType, dict[str, np.ndarray]] = {
+            componentType: {field: np.empty((0,) + shape, dtype=dtype) for field, (dtype, shape) in componentType.fields.items()}
+            for componentType in sorted(types, key=lambda componentType: componentType._id)
+        }
+
+    @property
+    def capacity(self) -> int:
+        return len(self.entities)
+
+    def reserve(self, count: int) -> None:
+        if count <= self.capacity:
+            return
+        capacity = max(count, self.capacity * 2, 64)
+        entities = np.empty(capacity, dtype=np.int64)
+        entities[:self.count] = self.entities[:self.count]
+        self.entities = entities
+        for fields in self.columns.values():
+            for field, column in fields.items():
+                grown = np.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+                grown[:self.count] = column[:self.count]
+                fields[field] = grown
+
+    def append(self, entities: np.ndarray) -> slice:
+        """Adds rows for entities, filled with the field defaults, and returns their slice."""
+        start = self.count
+        self.reserve(start + len(entities))
+        rows = slice(start, start + len(entities))
+        self.entities[rows] = entities
+        for componentType, fields in self.columns.items():
+            for field, column in fields.items():
+                column[rows] = componentType.defaults.get(field, 0)
+        self.count += len(entities)
+        return rows
+
+    def removeRow(self, row: int) -> int:
+        """Removes row by moving the last row into it. Returns the moved entity, or -1 if row was the last one."""
+        last = self.count - 1
+        moved = -1
+        if row != last:
+            moved = int(self.entities[last])
+            self.entities[row] = moved
+            for fields in self.columns.values():
+                for column in fields.values():
+                    column[row] = column[last]
+        self.count = last
+        return moved
+
+    def view(self, componentType: ComponentType) -> dict[str, np.ndarray]:
+        """Zero-copy column views over the live rows."""
+        count = self.count
+        return {field: column[:count] for field, column in self.columns[componentType].items()}
+
+
+class QueryChunk:
+    """The matching rows of one archetype. Columns are views: writing to them writes the entities' data."""
+    __slots__ = ("archetype",)
+
+    def __init__(self, archetype: Archetype):
+        self.archetype = archetype
+
+    @property
+    def entities(self) -> np.ndarray:
+        return self.archetype.entities[:self.archetype.count]
+
+    def __len__(self) -> int:
+        return self.archetype.count
+
+    def __getitem__(self, componentType: ComponentType) -> dict[str, np.ndarray]:
+        return self.archetype.view(componentType)
+
+    def column(self, componentType: ComponentType, field: str) -> np.ndarray:
+        return self.archetype.columns[componentType][field][:self.archetype.count]
+
+
+class Query:
+    """Entities having every required type and none of the excluded ones. The matching archetypes are cached."""
+
+    def __init__(self, world: "World", required: frozenset[ComponentType], excluded: frozenset[ComponentType]):
+        self.world = world
+        self.required = required
+        self.excluded = excluded
+        self._archetypes: list[Archetype] = []
+        self._seen = 0  # Archetypes of the world already matched against
+
+    @property
+    def archetypes(self) -> list[Archetype]:
+        archetypes = self.world._archetypeList
+        for archetype in archetypes[self._seen:]:
+            if self.required <= archetype.types and not (self.excluded & archetype.types):
+                self._archetypes.append(archetype)
+        self._seen = len(archetypes)
+        return self._archetypes
+
+    def __iter__(self) -> Iterator[QueryChunk]:
+        for archetype in self.archetypes:
+            if archetype.count:
+                yield QueryChunk(archetype)
+
+    def count(self) -> int:
+        return sum(archetype.count for archetype in self.archetypes)
+
+    def entities(self) -> np.ndarray:
+        chunks = [chunk.entities for chunk in self]
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+
+
+class EntitySystem:
+    """
+    Logic over a query. Set requires (and optionally excludes) on the subclass and override update(chunk), which is
+    called once per matching archetype with whole columns.
+    """
+
+    requires: tuple[ComponentType, ...] = ()
+    excludes: tuple[ComponentType, ...] = ()
+
+    def __init__(self, world: "World"):
+        self.world = world
+        self.query: Query = world.query(*self.requires, exclude=self.excludes)
+
+    def run(self) -> None:
+        for chunk in self.query:
+            self.update(chunk)
+
+    def update(self, chunk: QueryChunk) -> None:
+        pass
+
+
+class EntityLink(Component):
+    """Ties a GameObject to an entity, so its components can read and write the entity's data."""
+
+    transient = True  # The entity lives in a World, not in the scene file
+
+    def __init__(self, gameObject: GameObject, world: "World", entity: int):
+        super().__init__(gameObject)
+        self.world = world
+        self.entity = entity
+
+    def get(self, componentType: ComponentType) -> dict[str, Any]:
+        return self.world.get(self.entity, componentType)
+
+    def set(self, componentType: ComponentType, **values) -> None:
+        self.world.set(self.entity, componentType, **values)
+
+    def onDestroy(self):
+        self.world._unlink(self)
+
+
+class World:
+    """
+    Entities and their archetype tables. Entity ids are reused after destroy. A scene with a world runs
+    World.update() before its GameObjects, which runs the systems in the order they were added.
+    """
+
+    def __init__(self):
+        self._archetypes: dict[frozenset[ComponentType], Archetype] = {}
+        self._archetypeList: list[Archetype] = []
+        self._queries: dict[tuple[frozenset, frozenset], Query] = {}
+        # Per entity id: archetype index (-1 for free ids) and row; ids below _nextId have been handed out
+        self._archetypeOf = np.full(0, -1, dtype=np.int32)
+        self._rowOf = np.zeros(0, dtype=np.int64)
+        self._nextId = 0
+        self._free: list[int] = []
+        self.systems: list[EntitySystem] = []
+        self._links: dict[int, EntityLink] = {}  # entity -> link of a GameObject with TransformData
+
+    @property
+    def entityCount(self) -> int:
+        return self._nextId - len(self._free)
+
+    def create(self, *types: ComponentType, **values: dict[str, Any]) -> int:
+        """Creates one entity. Field values are passed per type name, e.g. create(Position, Velocity, Velocity={"value": (1, 0)})."""
+        return int(self.createMany(1, types, {componentType: values[componentType.name]
+                                              for componentType in types if componentType.name in values})[0])
+
+    def createMany(self, count: int, types: tuple[ComponentType, ...], values: Optional[dict[ComponentType, dict[str, Any]]] = None) -> np.ndarray:
+        """
+        Creates count entities with the same types in one go and returns their ids. values maps a type to its field
+        values, each either one value for all entities or an array with one row per entity.
+        """
+        entities = self._allocate(count)
+        archetype = self._archetype(frozenset(types))
+        rows = archetype.append(entities)
+        for componentType, fields in (values or {}).items():
+            for field, value in fields.items():
+                archetype.columns[componentType][field][rows] = value
+        self._archetypeOf[entities] = archetype.index
+        self._rowOf[entities] = np.arange(rows.start, rows.stop)
+        return entities
+
+    def destroy(self, entity: int) -> None:
+        archetype = self._archetypeList[self._location(entity)[0]]
+        self._removeRow(archetype, int(self._rowOf[entity]))
+        self._archetypeOf[entity] = -1
+        self._free.append(entity)
+        link = self._links.pop(entity, None)
+        if link is not None:
+            link.gameObject.removeComponent(link)
+
+    def destroyMany(self, entities: np.ndarray) -> None:
+        for entity in entities:
+            self.destroy(int(entity))
+
+    def isAlive(self, entity: int) -> bool:
+        return 0 <= entity < self._nextId and self._archetypeOf[entity] >= 0
+
+    def has(self, entity: int, componentType: ComponentType) -> bool:
+        return componentType in self._archetypeList[self._location(entity)[0]].types
+
+    def get(self, entity: int, componentType: ComponentType) -> dict[str, Any]:
+        """Copies of one entity's field values."""
+        index, row = self._location(entity)
+        columns = self._archetypeList[index].columns[componentType]
+        return {field: column[row].copy() if column.ndim > 1 else column[row].item() for field, column in columns.items()}
+
+    def set(self, entity: int, componentType: ComponentType, **values) -> None:
+        index, row = self._location(entity)
+        columns = self._archetypeList[index].columns[componentType]
+        for field, value in values.items():
+            columns[field][row] = value
+
+    def addComponent(self, entity: int, componentType: ComponentType, **values) -> None:
+        """Moves the entity to the archetype with componentType added. Adding one it already has just sets the values."""
+        index, row = self._location(entity)
+        source = self._archetypeList[index]
+        if componentType not in source.types:
+            self._move(entity, source, row, self._archetype(source.types | {componentType}))
+        self.set(entity, componentType, **values)
+
+    def removeComponent(self, entity: int, componentType: ComponentType) -> None:
+        index, row = self._location(entity)
+        source = self._archetypeList[index]
+        if componentType in source.types:
+            self._move(entity, source, row, self._archetype(source.types - {componentType}))
+
+    def query(self, *required: ComponentType, exclude: tuple[ComponentType, ...] = ()) -> Query:
+        key = (frozenset(required), frozenset(exclude))
+        query = self._queries.get(key)
+        if query is None:
+            query = self._queries[key] = Query(self, key[0], key[1])
+        return query
+
+    def addSystem(self, systemClass: type, *args, **kwargs) -> EntitySystem:
+        system = systemClass(self, *args, **kwargs)
+        self.systems.append(system)
+        return system
+
+    def link(self, gameObject: GameObject, *types: ComponentType, **values: dict[str, Any]) -> EntityLink:
+        """
+        Creates an entity for gameObject with TransformData and types, and adds an EntityLink component to it.
+        World.update copies the Transform into the entity before the systems run and back afterwards, so systems
+        may move linked GameObjects like any other entity.
+        """
+        entity = self.create(TransformData, *types, **values)
+        link = gameObject.addComponent(EntityLink, self, entity)
+        self._links[entity] = link
+        return link
+
+    def update(self) -> None:
+        self._pullTransforms()
+        for system in self.systems:
+            system.run()
+        self._pushTransforms()
+
+    def _pullTransforms(self) -> None:
+        for entity, link in self._links.items():
+            transform = link.gameObject.transform
+            index, row = self._location(entity)
+            columns = self._archetypeList[index].columns[TransformData]
+            columns["position"][row] = (transform.position.x, transform.position.y)
+            columns["rotation"][row] = transform.rotation
+            columns["scale"][row] = (transform.scale.x, transform.scale.y)
+
+    def _pushTransforms(self) -> None:
+        for entity, link in self._links.items():
+            transform = link.gameObject.transform
+            index, row = self._location(entity)
+            columns = self._archetypeList[index].columns[TransformData]
+            # Written into the existing vectors, so references callers hold stay live
+            position, scale = transform.position, transform.scale
+            x, y = columns["position"][row].tolist()
+            if position.x != x or position.y != y:
+                position.set(x, y)
+            rotation = columns["rotation"][row].item()
+            if transform.rotation != rotation:
+                transform.rotation = rotation
+            scale_x, scale_y = columns["scale"][row].tolist()
+            if scale.x != scale_x or scale.y != scale_y:
+                scale.set(scale_x, scale_y)
+
+    def _unlink(self, link: EntityLink) -> None:
+        if self._links.get(link.entity) is link:
+            del self._links[link.entity]
+            self.destroy(link.entity)
+
+    def _location(self, entity: int) -> tuple[int, int]:
+        if not self.isAlive(entity):
+            raise KeyError(f"Entity {entity} does not exist")
+        return int(self._archetypeOf[entity]), int(self._rowOf[entity])
+
+    def _archetype(self, types: frozenset[ComponentType]) -> Archetype:
+        archetype = self._archetypes.get(types)
+        if archetype is None:
+            archetype = self._archetypes[types] = Archetype(len(self._archetypeList), types)
+            self._archetypeList.append(archetype)
+        return archetype
+
+    def _allocate(self, count: int) -> np.ndarray:
+        reused = self._free[-count:] if count else []
+        del self._free[len(self._free) - len(reused):]
+        start = self._nextId
+        fresh = count - len(reused)
+        self._nextId += fresh
+        if self._nextId > len(self._archetypeOf):
+            capacity = max(self._nextId, len(self._archetypeOf) * 2, 64)
+            archetypeOf = np.full(capacity, -1, dtype=np.int32)
+            archetypeOf[:start] = self._archetypeOf[:start]
+            rowOf = np.zeros(capacity, dtype=np.int64)
+            rowOf[:start] = self._rowOf[:start]
+            self._archetypeOf, self._rowOf = archetypeOf, rowOf
+        return np.concatenate((np.array(reused, dtype=np.int64), np.arange(start, start + fresh, dtype=np.int64)))
+
+    def _removeRow(self, archetype: Archetype, row: int) -> None:
+        moved = archetype.removeRow(row)
+        if moved >= 0:
+            self._rowOf[moved] = row
+
+    def _move(self, entity: int, source: Archetype, row: int, target: Archetype) -> None:
+        newRow = target.append(np.array([entity], dtype=np.int64)).start
+        for componentType in source.types & target.types:
+            sourceColumns = source.columns[componentType]
+            for field, column in target.columns[componentType].items():
+                column[newRow] = sourceColumns[field][row]
+        self._removeRow(source, row)
+        self._archetypeOf[entity] = target.index
+        self._rowOf[entity] = newRow
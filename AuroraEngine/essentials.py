@@ -1,12 +1,15 @@
 """Code entirely written by AI (Alude Idiocracy) Contact at mc.morsuk@gmail.com"""
 
-import OpenGL.GL as opengl
 from math import sin, cos, tan, asin, acos, atan, atan2, sqrt, pow, radians, degrees, exp, log, log10, floor, ceil, fabs, pi, e, copysign
 import glfw
 import time
+import numpy as np
+from operator import attrgetter
 from typing import Optional
+from .timing import FrameStats, FixedTimestep, FramePacer
 
 class Vector2:
+    __slots__ = ("x", "y", "_owner")
     
     zero: "Vector2"
     one: "Vector2"
@@ -14,17 +17,44 @@ class Vector2:
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
+        self._owner: Optional["Transform"] = None  # Transform whose version the in-place methods bump
 
     def magnitude(self) -> float:
         """Returns the magnitude, or 'length' of the vector."""
-        return (self.x**2 + self.y**2)**0.5
+        return sqrt(self.x * self.x + self.y * self.y)
+
+    def sqrMagnitude(self) -> float:
+        """Returns the squared magnitude. Cheaper than magnitude() when only comparing lengths."""
+        return self.x * self.x + self.y * self.y
     
     def normalized(self) -> "Vector2":
         """Returns direction of the vector, without retaining it's magnitude."""
         mag = self.magnitude()
         if mag == 0:
-            return Vector2.zero
+            return Vector2(0, 0)
         return Vector2(self.x / mag, self.y / mag)
+
+    def normalizedInto(self, target: "Vector2") -> "Vector2":
+        """Writes the direction of the vector into target instead of allocating a new one."""
+        mag = sqrt(self.x * self.x + self.y * self.y)
+        if mag == 0:
+            target.x = target.y = 0
+        else:
+            target.x = self.x / mag
+            target.y = self.y / mag
+        if target._owner is not None:
+            target._owner.version += 1
+        return target
+
+    def set(self, x: float, y: float) -> "Vector2":
+        self.x = x
+        self.y = y
+        if self._owner is not None:
+            self._owner.version += 1
+        return self
+
+    def copy(self) -> "Vector2":
+        return Vector2(self.x, self.y)
     
     
     def __str__(self) -> str:
@@ -45,6 +75,8 @@ class Vector2:
             self.y = value
         else:
             raise IndexError("Vector2 index out of range (must be 0 or 1)")
+        if self._owner is not None:
+            self._owner.version += 1
         
     def __add__(self, other: "Vector2") -> "Vector2":
         return Vector2(self.x + other.x, self.y + other.y)
@@ -54,6 +86,28 @@ class Vector2:
     
     def __mul__(self, scalar) -> "Vector2":
         return Vector2(self.x * scalar, self.y * scalar)
+
+    # In-place operators mutate the vector itself, so every other reference to it sees the change.
+    def __iadd__(self, other: "Vector2") -> "Vector2":
+        self.x += other.x
+        self.y += other.y
+        if self._owner is not None:
+            self._owner.version += 1
+        return self
+
+    def __isub__(self, other: "Vector2") -> "Vector2":
+        self.x -= other.x
+        self.y -= other.y
+        if self._owner is not None:
+            self._owner.version += 1
+        return self
+
+    def __imul__(self, scalar) -> "Vector2":
+        self.x *= scalar
+        self.y *= scalar
+        if self._owner is not None:
+            self._owner.version += 1
+        return self
     
     def __neg__(self) -> "Vector2":
         return Vector2(-self.x, -self.y)
@@ -71,19 +125,219 @@ class Vector2:
     
     def distanceTo(self, other: "Vector2") -> float:
         """World space distance between two vectors."""
-        return Vector2(abs(self.x - other.x), abs(self.y - other.y)).magnitude()
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return sqrt(dx * dx + dy * dy)
+
+    def distanceSquaredTo(self, other: "Vector2") -> float:
+        """Squared world space distance between two vectors, skipping the square root."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
     
     @staticmethod
     def lerp(vec1: "Vector2", vec2: "Vector2", t: float) -> "Vector2":
         """Returns a vector between the two argument vectors dependent to the value of t."""
         return Vector2(vec1.x + (vec2.x - vec1.x) * t, vec1.y + (vec2.y - vec1.y) * t)
 
+    @staticmethod
+    def lerpInto(target: "Vector2", vec1: "Vector2", vec2: "Vector2", t: float) -> "Vector2":
+        """Same as lerp, but writes the result into target. target may be vec1 or vec2."""
+        x = vec1.x + (vec2.x - vec1.x) * t
+        target.y = vec1.y + (vec2.y - vec1.y) * t
+        target.x = x
+        if target._owner is not None:
+            target._owner.version += 1
+        return target
+
 
+# Shared constants: never hand them out or mutate them in place, copy() them first
 Vector2.zero = Vector2(0,0)
 Vector2.one = Vector2(1,1)
 
 
+class Vector2View(Vector2):
+    """A Vector2 that reads and writes one row of a Vector2Array's buffer instead of owning its components."""
+    __slots__ = ("_row",)
+
+    def __init__(self, row: np.ndarray):
+        self._row = row
+        self._owner = None
+
+    @property
+    def x(self) -> float:
+        return float(self._row[0])
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._row[0] = value
+
+    @property
+    def y(self) -> float:
+        return float(self._row[1])
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._row[1] = value
+
+
+class Vector2Array:
+    """
+    A contiguous (N, 2) float buffer of vectors, with the Vector2 operations applied to the whole array at once.
+    The buffer is exposed as `data` and can be passed straight to OpenGL calls such as glBufferData without copying.
+    """
+    __slots__ = ("data",)
+
+    def __init__(self, vectors: "int | np.ndarray | list[Vector2] | Vector2Array" = 0, dtype: type = np.float32):
+        if isinstance(vectors, int):
+            self.data: np.ndarray = np.zeros((vectors, 2), dtype=dtype)
+        elif isinstance(vectors, Vector2Array):
+            self.data = vectors.data
+        elif isinstance(vectors, np.ndarray):
+            self.data = np.ascontiguousarray(vectors, dtype=dtype).reshape(-1, 2)
+        else:
+            self.data = np.array([(v[0], v[1]) for v in vectors], dtype=dtype).reshape(-1, 2)
+
+    @staticmethod
+    def _operand(other: "Vector2Array | Vector2 | np.ndarray | float"):
+        if isinstance(other, Vector2Array):
+            return other.data
+        if isinstance(other, Vector2):
+            return (other.x, other.y)
+        if isinstance(other, np.ndarray) and other.ndim == 1:
+            # One scalar per vector
+            return other[:, None]
+        return other
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.data[:, 1]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.data.dtype
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: "int | slice | np.ndarray") -> "Vector2View | Vector2Array":
+        """An integer index returns a zero-copy Vector2View; slices return a Vector2Array over the same memory."""
+        if isinstance(index, (int, np.integer)):
+            return Vector2View(self.data[index])
+        result = Vector2Array.__new__(Vector2Array)
+        result.data = self.data[index]
+        return result
+
+    def __setitem__(self, index: "int | slice | np.ndarray", value: "Vector2 | Vector2Array | np.ndarray") -> None:
+        self.data[index] = Vector2Array._operand(value)
+
+    def __iter__(self):
+        for row in self.data:
+            yield Vector2View(row)
+
+    def __str__(self) -> str:
+        return f"Vector2Array({len(self.data)}, {self.data.dtype})"
+
+    def toList(self) -> list[Vector2]:
+        return [Vector2(float(x), float(y)) for x, y in self.data]
+
+    def copy(self) -> "Vector2Array":
+        return Vector2Array(self.data.copy(), self.data.dtype)
+
+    def __add__(self, other: "Vector2Array | Vector2") -> "Vector2Array":
+        return Vector2Array(self.data + Vector2Array._operand(other), self.data.dtype)
+
+    def __sub__(self, other: "Vector2Array | Vector2") -> "Vector2Array":
+        return Vector2Array(self.data - Vector2Array._operand(other), self.data.dtype)
+
+    def __mul__(self, scalar: "float | np.ndarray") -> "Vector2Array":
+        return Vector2Array(self.data * Vector2Array._operand(scalar), self.data.dtype)
+
+    def __neg__(self) -> "Vector2Array":
+        return Vector2Array(-self.data, self.data.dtype)
+
+    def __iadd__(self, other: "Vector2Array | Vector2") -> "Vector2Array":
+        self.data += Vector2Array._operand(other)
+        return self
+
+    def __isub__(self, other: "Vector2Array | Vector2") -> "Vector2Array":
+        self.data -= Vector2Array._operand(other)
+        return self
+
+    def __imul__(self, scalar: "float | np.ndarray") -> "Vector2Array":
+        self.data *= Vector2Array._operand(scalar)
+        return self
+
+    def sqrMagnitude(self) -> np.ndarray:
+        return np.einsum("ij,ij->i", self.data, self.data)
+
+    def magnitude(self) -> np.ndarray:
+        """Returns the magnitude of every vector as an (N,) array."""
+        return np.sqrt(self.sqrMagnitude())
+
+    def normalized(self) -> "Vector2Array":
+        """Returns the direction of every vector; zero vectors stay zero."""
+        return self.normalizedInto(Vector2Array(len(self.data), self.data.dtype))
+
+    def normalizedInto(self, target: "Vector2Array") -> "Vector2Array":
+        mag = self.magnitude()
+        np.divide(self.data, mag[:, None], out=target.data, where=mag[:, None] != 0)
+        target.data[mag == 0] = 0
+        return target
+
+    def distanceSquaredTo(self, other: "Vector2Array | Vector2") -> np.ndarray:
+        delta = self.data - Vector2Array._operand(other)
+        return np.einsum("ij,ij->i", delta, delta)
+
+    def distanceTo(self, other: "Vector2Array | Vector2") -> np.ndarray:
+        """World space distance from every vector to other (one Vector2, or one vector per row)."""
+        return np.sqrt(self.distanceSquaredTo(other))
+
+    def getAngleTo(self, other: "Vector2Array | Vector2") -> np.ndarray:
+        delta = Vector2Array._operand(other) - self.data
+        return np.degrees(np.arctan2(delta[:, 1], delta[:, 0]))
+
+    def rotate(self, angle: "float | np.ndarray", pivot: Optional[Vector2] = None) -> "Vector2Array":
+        """Rotates every vector in place by angle degrees (a scalar, or one angle per vector) around pivot."""
+        angle_rad = np.radians(angle)
+        cos_theta, sin_theta = np.cos(angle_rad), np.sin(angle_rad)
+        if pivot is not None:
+            self.data -= (pivot.x, pivot.y)
+        x = self.data[:, 0].copy()
+        y = self.data[:, 1]
+        self.data[:, 0] = x * cos_theta - y * sin_theta
+        self.data[:, 1] = x * sin_theta + y * cos_theta
+        if pivot is not None:
+            self.data += (pivot.x, pivot.y)
+        return self
+
+    @staticmethod
+    def lerp(vec1: "Vector2Array | Vector2", vec2: "Vector2Array | Vector2", t: "float | np.ndarray") -> "Vector2Array":
+        """Interpolates row by row; t is a scalar or one value per vector."""
+        a = Vector2Array._operand(vec1)
+        return Vector2Array(a + (np.subtract(Vector2Array._operand(vec2), a)) * Vector2Array._operand(t))
+
+    @staticmethod
+    def lerpInto(target: "Vector2Array", vec1: "Vector2Array | Vector2", vec2: "Vector2Array | Vector2", t: "float | np.ndarray") -> "Vector2Array":
+        """Same as lerp, but writes the result into target. target may be vec1 or vec2."""
+        a = Vector2Array._operand(vec1)
+        if isinstance(a, np.ndarray) and np.shares_memory(a, target.data):
+            # target.data is overwritten with vec2 - vec1 before vec1 is added back
+            a = a.copy()
+        np.subtract(Vector2Array._operand(vec2), a, out=target.data)
+        target.data *= Vector2Array._operand(t)
+        target.data += a
+        return target
+
+
+
 class Vector3:
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float, y: float, z: float):
         self.x = x
         self.y = y
@@ -91,7 +345,11 @@ class Vector3:
 
     def magnitude(self) -> float:
         """Returns the magnitude, or 'length' of the vector."""
-        return (self.x**2 + self.y**2 + self.z**2)**0.5
+        return sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def sqrMagnitude(self) -> float:
+        """Returns the squared magnitude. Cheaper than magnitude() when only comparing lengths."""
+        return self.x * self.x + self.y * self.y + self.z * self.z
     
     def normalized(self) -> "Vector3":
         """Returns direction of the vector, without retaining it's magnitude."""
@@ -99,6 +357,26 @@ class Vector3:
         if mag == 0:
             return Vector3.zero()
         return Vector3(self.x / mag, self.y / mag, self.z / mag)
+
+    def normalizedInto(self, target: "Vector3") -> "Vector3":
+        """Writes the direction of the vector into target instead of allocating a new one."""
+        mag = sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+        if mag == 0:
+            target.x = target.y = target.z = 0
+        else:
+            target.x = self.x / mag
+            target.y = self.y / mag
+            target.z = self.z / mag
+        return target
+
+    def set(self, x: float, y: float, z: float) -> "Vector3":
+        self.x = x
+        self.y = y
+        self.z = z
+        return self
+
+    def copy(self) -> "Vector3":
+        return Vector3(self.x, self.y, self.z)
     
     @staticmethod
     def zero() -> "Vector3":
@@ -140,6 +418,24 @@ class Vector3:
     
     def __mul__(self, scalar: float) -> "Vector3":
         return Vector3(self.x * scalar, self.y * scalar, self.z * scalar)
+
+    def __iadd__(self, other: "Vector3") -> "Vector3":
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        return self
+
+    def __isub__(self, other: "Vector3") -> "Vector3":
+        self.x -= other.x
+        self.y -= other.y
+        self.z -= other.z
+        return self
+
+    def __imul__(self, scalar: float) -> "Vector3":
+        self.x *= scalar
+        self.y *= scalar
+        self.z *= scalar
+        return self
     
     def __neg__(self) -> "Vector3":
         return Vector3(-self.x, -self.y, -self.z)
@@ -169,23 +465,63 @@ class Vector3:
         return degrees(atan2(dy, dx))
     
     def distanceTo(self, other: "Vector3") -> float:
-        return Vector3(abs(self.x - other.x), abs(self.y - other.y), abs(self.z - other.z)).magnitude()
+        return sqrt(self.distanceSquaredTo(other))
+
+    def distanceSquaredTo(self, other: "Vector3") -> float:
+        dx = self.x - other.x
+        dy = self.y - other.y
+        dz = self.z - other.z
+        return dx * dx + dy * dy + dz * dz
     
     @staticmethod
     def lerp(vec1: "Vector3", vec2: "Vector3", t: float) -> "Vector3":
         return Vector3(vec1.x + (vec2.x - vec1.x) * t, vec1.y + (vec2.y - vec1.y) * t, vec1.z + (vec2.z - vec1.z) * t)
 
+    @staticmethod
+    def lerpInto(target: "Vector3", vec1: "Vector3", vec2: "Vector3", t: float) -> "Vector3":
+        """Same as lerp, but writes the result into target. target may be vec1 or vec2."""
+        x = vec1.x + (vec2.x - vec1.x) * t
+        y = vec1.y + (vec2.y - vec1.y) * t
+        target.z = vec1.z + (vec2.z - vec1.z) * t
+        target.x = x
+        target.y = y
+        return target
+
 class Quaternion:
+    __slots__ = ("x", "y", "z", "w")
+
     def __init__(self, x: float, y: float, z: float, w: float):
         self.x = x
         self.y = y
         self.z = z
         self.w = w
 
+    def sqrMagnitude(self) -> float:
+        return self.x * self.x + self.y * self.y + self.z * self.z + self.w * self.w
+
     def normalized(self) -> "Quaternion":
-        mag = sqrt(self.x**2 + self.y**2 + self.z**2 + self.w**2)
+        mag = sqrt(self.sqrMagnitude())
         return Quaternion(self.x / mag, self.y / mag, self.z / mag, self.w / mag)
 
+    def normalizedInto(self, target: "Quaternion") -> "Quaternion":
+        """Writes the normalized quaternion into target instead of allocating a new one."""
+        mag = sqrt(self.sqrMagnitude())
+        target.x = self.x / mag
+        target.y = self.y / mag
+        target.z = self.z / mag
+        target.w = self.w / mag
+        return target
+
+    def set(self, x: float, y: float, z: float, w: float) -> "Quaternion":
+        self.x = x
+        self.y = y
+        self.z = z
+        self.w = w
+        return self
+
+    def copy(self) -> "Quaternion":
+        return Quaternion(self.x, self.y, self.z, self.w)
+
     def __mul__(self, other: "Quaternion") -> "Quaternion":
         return Quaternion(
             self.w * other.x + self.x * other.w + self.y * other.z - self.z * other.y,
@@ -194,13 +530,32 @@ class Quaternion:
             self.w * other.w - self.x * other.x - self.y * other.y - self.z * other.z,
         )
 
+    def __imul__(self, other: "Quaternion") -> "Quaternion":
+        return self.set(
+            self.w * other.x + self.x * other.w + self.y * other.z - self.z * other.y,
+            self.w * other.y - self.x * other.z + self.y * other.w + self.z * other.x,
+            self.w * other.z + self.x * other.y - self.y * other.x + self.z * other.w,
+            self.w * other.w - self.x * other.x - self.y * other.y - self.z * other.z,
+        )
+
     def rotateVector(self, v: Vector3) -> Vector3:
-        qvec = Vector3(self.x, self.y, self.z)
-        uv = qvec.cross(v)
-        uuv = qvec.cross(uv)
-        uv = uv * (2.0 * self.w)
-        uuv = uuv * 2.0
-        return Vector3(v.x + uv.x + uuv.x, v.y + uv.y + uuv.y, v.z + uv.z + uuv.z)
+        return self.rotateVectorInto(v, Vector3(0, 0, 0))
+
+    def rotateVectorInto(self, v: Vector3, target: Vector3) -> Vector3:
+        """Rotates v and writes the result into target. target may be v."""
+        qx, qy, qz, qw = self.x, self.y, self.z, self.w
+        # uv = q x v, uuv = q x uv; result = v + 2w * uv + 2 * uuv
+        uvx = qy * v.z - qz * v.y
+        uvy = qz * v.x - qx * v.z
+        uvz = qx * v.y - qy * v.x
+        uuvx = qy * uvz - qz * uvy
+        uuvy = qz * uvx - qx * uvz
+        uuvz = qx * uvy - qy * uvx
+        return target.set(
+            v.x + 2.0 * (qw * uvx + uuvx),
+            v.y + 2.0 * (qw * uvy + uuvy),
+            v.z + 2.0 * (qw * uvz + uuvz)
+        )
 
     @staticmethod
     def fromAxisAngle(axis: Vector3, angle_degrees: float) -> "Quaternion":
@@ -229,22 +584,27 @@ class Quaternion:
 
     @staticmethod
     def slerp(q1: "Quaternion", q2: "Quaternion", t: float) -> "Quaternion":
+        return Quaternion.slerpInto(Quaternion(0, 0, 0, 1), q1, q2, t)
 
+    @staticmethod
+    def slerpInto(target: "Quaternion", q1: "Quaternion", q2: "Quaternion", t: float) -> "Quaternion":
+        """Same as slerp, but writes the result into target. target may be q1 or q2."""
         dot = q1.x * q2.x + q1.y * q2.y + q1.z * q2.z + q1.w * q2.w
 
+        sign = 1.0
         if dot < 0.0:
-            q2 = Quaternion(-q2.x, -q2.y, -q2.z, -q2.w)
+            sign = -1.0
             dot = -dot
 
         DOT_THRESHOLD = 0.9995
         if dot > DOT_THRESHOLD:
-            result = Quaternion(
-                q1.x + t * (q2.x - q1.x),
-                q1.y + t * (q2.y - q1.y),
-                q1.z + t * (q2.z - q1.z),
-                q1.w + t * (q2.w - q1.w)
+            target.set(
+                q1.x + t * (sign * q2.x - q1.x),
+                q1.y + t * (sign * q2.y - q1.y),
+                q1.z + t * (sign * q2.z - q1.z),
+                q1.w + t * (sign * q2.w - q1.w)
             )
-            return result.normalized()
+            return target.normalizedInto(target)
 
         theta_0 = acos(dot)
         sin_theta_0 = sin(theta_0)
@@ -252,9 +612,9 @@ class Quaternion:
         sin_theta = sin(theta)
 
         s0 = cos(theta) - dot * sin_theta / sin_theta_0
-        s1 = sin_theta / sin_theta_0
+        s1 = sign * sin_theta / sin_theta_0
 
-        return Quaternion(
+        return target.set(
             q1.x * s0 + q2.x * s1,
             q1.y * s0 + q2.y * s1,
             q1.z * s0 + q2.z * s1,
@@ -269,17 +629,95 @@ class Quaternion:
 
 
 class Transform:
-    def __init__(self, position: Vector2 = Vector2.zero, rotation: float = 0, scale: Vector2 = Vector2.zero) -> None:
-        self.position: Vector2 = position
-        self.rotation: float = rotation
-        self.scale: Vector2 = scale
+    """
+    version goes up whenever position, rotation or scale is assigned and whenever one of the Transform's vectors
+    changes through an in-place method (set, +=, -=, *=, lerpInto, normalizedInto). Writing .x or .y directly is
+    not counted; call markChanged() after doing that. A vector counts for the Transform it was last assigned to.
+    """
+
+    def __init__(self, position: Optional[Vector2] = None, rotation: float = 0, scale: Optional[Vector2] = None) -> None:
+        self.version: int = 0
+        self._position: Vector2 = position if position is not None else Vector2(0, 0)
+        self._position._owner = self
+        self._rotation: float = rotation
+        self._scale: Vector2 = scale if scale is not None else Vector2(0, 0)
+        self._scale._owner = self
+
+        # Cached world matrix, keyed by the (position, rotation, scale) values it was built from
+        self._matrixKey: Optional[tuple[float, float, float, float, float]] = None
+        self._affine: tuple[float, float, float, float, float, float] = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        self._matrix: Optional[np.ndarray] = None
 
     def distanceTo(self, other: "Transform") -> float:
         return (self.position - other.position).magnitude()
     
+    @property
+    def position(self) -> Vector2:
+        return self._position
+
+    @position.setter
+    def position(self, value: Vector2) -> None:
+        self._position = value
+        value._owner = self
+        self.version += 1
+
+    @property
+    def rotation(self) -> float:
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value: float) -> None:
+        self._rotation = value
+        self.version += 1
+
+    @property
+    def scale(self) -> Vector2:
+        return self._scale
+
+    @scale.setter
+    def scale(self, value: Vector2) -> None:
+        self._scale = value
+        value._owner = self
+        self.version += 1
+
+    def markChanged(self) -> None:
+        """Bumps version after position or scale components were written directly."""
+        self.version += 1
+
     def rotate(self, angle: float) -> None:
         self.rotation += angle
 
+    def getAffine(self) -> tuple[float, float, float, float, float, float]:
+        """Returns the first two rows (a, b, tx, c, d, ty) of the world matrix, rebuilt only when position, rotation or scale changed."""
+        position, rotation, scale = self._position, self._rotation, self._scale
+        key = (position.x, position.y, rotation, scale.x, scale.y)
+        if key != self._matrixKey:
+            self._matrixKey = key
+            self._affine = Transform.composeAffine(position.x, position.y, rotation, scale.x, scale.y)
+            self._matrix = None
+        return self._affine
+
+    def getMatrix(self) -> np.ndarray:
+        """Returns the cached row-major 4x4 world matrix (translation * rotation * scale)."""
+        a, b, tx, c, d, ty = self.getAffine()
+        if self._matrix is None:
+            self._matrix = np.array([
+                a,   b,   0.0, tx,
+                c,   d,   0.0, ty,
+                0.0, 0.0, 1.0, 0.0,
+                0.0, 0.0, 0.0, 1.0
+            ], dtype=np.float32).reshape(4, 4)
+        return self._matrix
+
+    @staticmethod
+    def composeAffine(x: float, y: float, rotation: float, scale_x: float, scale_y: float) -> tuple[float, float, float, float, float, float]:
+        """Closed form of translation * rotation * scale, returned as the rows (a, b, tx, c, d, ty)."""
+        angle_rad = radians(rotation)
+        cos_theta = cos(angle_rad)
+        sin_theta = sin(angle_rad)
+        return (scale_x * cos_theta, -scale_y * sin_theta, x,
+                scale_x * sin_theta,  scale_y * cos_theta, y)
+
     def __str__(self) -> str:
         return f"Transform({self.position},{self.rotation},{self.scale})"
     
@@ -288,27 +726,100 @@ class Transform:
 
 
 class GameObject:
-    def __init__(self, name: str, transform: Transform = Transform(Vector2.zero, 0, Vector2.one)):
+    def __init__(self, name: str, transform: Optional[Transform] = None):
         self.name: str = name
-        self.transform = transform
+        self.transform = transform if transform is not None else Transform(Vector2(0, 0), 0, Vector2(1, 1))
         self.components: list[Component] = []
+        # Component class (and each of its base classes) -> components of that type, in insertion order
+        self._componentIndex: dict[type, list[Component]] = {}
+        self.scene = None
+        self._static: bool = False
+        self._pool = None  # GameObjectPool this object came from, see Scene.despawn
+
+    @property
+    def isStatic(self) -> bool:
+        """Static objects are expected not to move. Their renderers are baked into the scene's static geometry."""
+        return self._static
+
+    @isStatic.setter
+    def isStatic(self, static: bool) -> None:
+        static = bool(static)
+        if static == self._static:
+            return
+        self._static = static
+        if self.scene is not None:
+            self.scene._setStatic(self, static)
         
 
     def addComponent(self, componentClass, *args, **kwargs) -> "Component":
         component: "Component" = componentClass(self, *args, **kwargs)
         self.components.append(component)
+        for cls in type(component).__mro__[:-1]:
+            self._componentIndex.setdefault(cls, []).append(component)
+        if self.scene is not None:
+            self.scene._indexComponent(self, component)
         component.start()
         return component
 
+    def removeComponent(self, component) -> Optional["Component"]:
+        """Removes a component instance, or the first component of a given class. Returns the removed component."""
+        if isinstance(component, type):
+            component = self.getComponent(component)
+        if component is None or component not in self.components:
+            return None
+
+        self.components.remove(component)
+        component.onDestroy()
+        for cls in type(component).__mro__[:-1]:
+            matches = self._componentIndex[cls]
+            matches.remove(component)
+            if not matches:
+                del self._componentIndex[cls]
+        if self.scene is not None:
+            self.scene._unindexComponent(self, component)
+        return component
+
     def getComponent(self, componentClass):
-        for c in self.components:
-            if isinstance(c, componentClass):
-                return c
-        return None
+        matches = self._componentIndex.get(componentClass)
+        return matches[0] if matches else None
+
+    def getComponents(self, componentClass) -> list["Component"]:
+        """Returns every component that is an instance of componentClass."""
+        return list(self._componentIndex.get(componentClass, ()))
+
+    def updateComponents(self, render: bool = True, skipJobs: bool = False):
+        """
+        Updates every component; with render=False, Renderer components are skipped (used by scene culling). With
+        skipJobs=True, parallel-safe components are skipped too, as the scene already ran them on the JobSystem.
+        """
+        if skipJobs:
+            for component in self.components:
+                if not component.parallelSafe and (render or not isinstance(component, Renderer)):
+                    component.update()
+        elif render:
+            for component in self.components:
+                component.update()
+        else:
+            for component in self.components:
+                if not isinstance(component, Renderer):
+                    component.update()
 
-    def updateComponents(self):
+    def fixedUpdateComponents(self):
         for component in self.components:
-            component.update()
+            if type(component).fixedUpdate is not Component.fixedUpdate:
+                component.fixedUpdate()
+
+    def getRenderBounds(self) -> Optional[tuple[float, float, float, float]]:
+        """World-space AABB (min_x, min_y, max_x, max_y) covering every Renderer, or None if there are none."""
+        renderers = self._componentIndex.get(Renderer)
+        if not renderers:
+            return None
+        min_x, min_y, max_x, max_y = renderers[0].getBounds()
+        for renderer in renderers[1:]:
+            bounds = renderer.getBounds()
+            min_x, min_y = min(min_x, bounds[0]), min(min_y, bounds[1])
+            max_x, max_y = max(max_x, bounds[2]), max(max_y, bounds[3])
+        return (min_x, min_y, max_x, max_y)
 
 
     def getDirection(self, direction: str = "forward") -> Vector2:
@@ -327,10 +838,21 @@ class GameObject:
                 return -Vector2(cos(angle), sin(angle))
             
             case _:
-                return Vector2.zero
+                return Vector2(0, 0)
             
 
 class Component:
+    # Parallel-safe components only read shared state and write their own, and never touch GL. In a scene their
+    # updateJob() runs on the JobSystem's threads, before the main-thread components, in ascending phase order.
+    parallelSafe: bool = False
+    phase: int = 0
+
+    # Attributes saved in scene files; each must also be a keyword argument of the constructor. None means they were
+    # never declared, and the serializer leaves the component out with a warning instead of silently losing its state.
+    # transient components are left out without one, e.g. because they refer to objects outside the scene
+    serializedFields: Optional[tuple[str, ...]] = None
+    transient: bool = False
+
     def __init__(self, gameObject: GameObject):
         self.gameObject: GameObject = gameObject
 
@@ -340,10 +862,70 @@ class Component:
     def update(self):
         pass
 
+    def updateJob(self):
+        """The update run on a worker thread for parallel-safe components; defaults to update()."""
+        self.update()
+
+    def fixedUpdate(self):
+        """Called System.fixedSteps times per frame, each time with System.deltaTime set to System.fixedDeltaTime."""
+        pass
+
+    def onDestroy(self):
+        """Called when the component is removed from its GameObject."""
+        pass
+
+    def onDisable(self):
+        """Called when the GameObject leaves its scene without being destroyed, i.e. despawned back to its pool."""
+        pass
+
+    def reset(self):
+        """Called when a pooled GameObject goes back to its pool; restore the state the component started with."""
+        pass
+
+
+def _bakedAttribute(name: str) -> property:
+    """
+    A Renderer attribute baked into the static geometry of a static GameObject. Reading it is a plain lookup of
+    the backing attribute; assigning it on a static GameObject triggers a rebake.
+    """
+    private = "_" + name
+
+    def setter(self, value) -> None:
+        self.__dict__[private] = value
+        gameObject = self.__dict__.get("gameObject")
+        if gameObject is not None and gameObject._static and gameObject.scene is not None:
+            gameObject.scene._markStaticDirty()
+
+    return property(attrgetter(private), setter)
+
+
+class Renderer(Component):
+    """Base class for components whose update() only draws. Scenes skip them for objects outside the camera view."""
+
+    sprite = _bakedAttribute("sprite")
+    color = _bakedAttribute("color")
+    texture = _bakedAttribute("texture")
+
+    def getBounds(self) -> tuple[float, float, float, float]:
+        """World-space AABB of the drawn unit quad, taken from the cached Transform matrix."""
+        a, b, tx, c, d, ty = self.gameObject.transform.getAffine()
+        extent_x = 0.5 * (abs(a) + abs(b))
+        extent_y = 0.5 * (abs(c) + abs(d))
+        return (tx - extent_x, ty - extent_y, tx + extent_x, ty + extent_y)
+
 class System:
     deltaTime: float = 0
     lastFrameTimestamp: float = 0
 
+    fixedDeltaTime: float = 1 / 50
+    fixedSteps: int = 0  # Fixed updates due this frame
+    interpolationAlpha: float = 0  # Fraction of a fixed step left over, for interpolating rendered state
+    rendering: bool = True  # False while a scene updates headless, Scene.updateScene(render=False)
+
+    frameStats: FrameStats = FrameStats()
+    _fixedTimestep: FixedTimestep = FixedTimestep()
+    _framePacer: FramePacer = FramePacer()
+
     @staticmethod
     def exit() -> None:
         glfw.terminate()
@@ -354,7 +936,28 @@ class System:
 
     @staticmethod
     def time() -> float:
-        return time.time()
+        """Monotonic high-resolution time in seconds."""
+        return time.perf_counter()
+
+    @staticmethod
+    def endFrame() -> None:
+        """Paces the frame to EngineSettings.fps_limit, then advances deltaTime, frameStats and the fixed-step accumulator."""
+        if EngineSettings.fps_limit:
+            System._framePacer.wait(1 / EngineSettings.fps_limit)
+
+        now = System.time()
+        System.deltaTime = now - System.lastFrameTimestamp if System.lastFrameTimestamp else 0
+        if System.deltaTime > EngineSettings.deltaTimeMaxOverhead:
+            if EngineSettings.deltaTimeOverheadWarning:
+                Console.warn("Deltatime overhead exceeded set limit, ignore during startup.\n" +
+                "Change EngineSettings.deltaTimeOverheadWarning to disable this warning.")
+            System.deltaTime = 0
+        System.lastFrameTimestamp = now
+        if System.deltaTime:
+            System.frameStats.add(System.deltaTime)
+
+        System.fixedSteps = System._fixedTimestep.advance(System.deltaTime, System.fixedDeltaTime, EngineSettings.maxFixedStepsPerFrame)
+        System.interpolationAlpha = System._fixedTimestep.alpha(System.fixedDeltaTime)
     
 class Console:
     @staticmethod
@@ -373,6 +976,7 @@ class EngineSettings:
     deltaTimeMaxOverhead = 10
     deltaTimeOverheadWarning = True
     fps_limit = 0
+    maxFixedStepsPerFrame = 5
 
 
 class Mathf:
@@ -536,7 +1140,16 @@ class Mathf:
         return a + (b - a) * u + (c - a) * v
     
 class Color32:
+    """
+    An RGBA color packed into one int as four 8-bit channels, R in the lowest byte, so that stored as a uint32 its
+    bytes are R, G, B, A: the layout of a normalized GL_UNSIGNED_BYTE vertex attribute. r, g, b and a read and write
+    the channels as floats between 0.0 and 1.0.
+    """
+    __slots__ = ("rgba",)
+
     _1o255 = 1.0 / 255.0
+    _unit: tuple[float, ...] = tuple(i / 255.0 for i in range(256))  # Byte -> normalized float
+    _hexCache: dict[str, int] = {}
     
     red: "Color32"
     green: "Color32"
@@ -545,48 +1158,229 @@ class Color32:
     black: "Color32"
     
     def __init__(self, r: (str | float), g: float = 0, b: float = 0, a: float = 1):
-        if isinstance(r, str):
-            hex_color = r.lstrip("#")
-            if len(hex_color) == 6:
-                self.r = int(hex_color[0:2], 16) / 255.0
-                self.g = int(hex_color[2:4], 16) / 255.0
-                self.b = int(hex_color[4:6], 16) / 255.0
-                self.a = 1.0
-            elif len(hex_color) == 8:
-                self.r = int(hex_color[0:2], 16) / 255.0
-                self.g = int(hex_color[2:4], 16) / 255.0
-                self.b = int(hex_color[4:6], 16) / 255.0
-                self.a = int(hex_color[6:8], 16) / 255.0
-            else:
-                Console.error("Invalid hex color string format. Use #RRGGBB or #RRGGBBAA.")
-                self.r, self.g, self.b, self.a = 0.0, 0.0, 0.0, 1.0
-        else:
-            if r > 1.0 or g > 1.0 or b > 1.0 or a > 1.0:
-                self.r = Mathf.clamp01(r * Color32._1o255)
-                self.g = Mathf.clamp01(g * Color32._1o255)
-                self.b = Mathf.clamp01(b * Color32._1o255)
-                self.a = Mathf.clamp01(a)
-            else:
-                self.r = Mathf.clamp01(r)
-                self.g = Mathf.clamp01(g)
-                self.b = Mathf.clamp01(b)
-                self.a = Mathf.clamp01(a)
+        """Channels are 0.0-1.0, or 0-255 for r, g and b if any channel is above 1; r may also be a hex string."""
+        if r.__class__ is str:
+            self.rgba: int = Color32.parseHex(r)
+            return
+        if r > 1.0 or g > 1.0 or b > 1.0 or a > 1.0:
+            r *= Color32._1o255
+            g *= Color32._1o255
+            b *= Color32._1o255
+        self.rgba = Color32.pack(r, g, b, a)
+
+    @staticmethod
+    def pack(r: float, g: float, b: float, a: float) -> int:
+        """Packs normalized channels, clamped to 0.0-1.0, into an RGBA8 int."""
+        return ((0 if r <= 0.0 else 255 if r >= 1.0 else int(r * 255.0 + 0.5))
+                | (0 if g <= 0.0 else 255 if g >= 1.0 else int(g * 255.0 + 0.5)) << 8
+                | (0 if b <= 0.0 else 255 if b >= 1.0 else int(b * 255.0 + 0.5)) << 16
+                | (0 if a <= 0.0 else 255 if a >= 1.0 else int(a * 255.0 + 0.5)) << 24)
+
+    @staticmethod
+    def fromPacked(rgba: int) -> "Color32":
+        color = Color32.__new__(Color32)
+        color.rgba = rgba
+        return color
 
+    @staticmethod
+    def fromFloats(r: float, g: float, b: float, a: float = 1.0) -> "Color32":
+        """Builds a color from normalized channels, without the 0-255 detection of the constructor."""
+        color = Color32.__new__(Color32)
+        color.rgba = Color32.pack(r, g, b, a)
+        return color
+
+    @staticmethod
+    def parseHex(text: str) -> int:
+        """Parses #RRGGBB or #RRGGBBAA into an RGBA8 int. Results are cached, as the same few strings recur."""
+        rgba = Color32._hexCache.get(text)
+        if rgba is not None:
+            return rgba
+        hex_color = text.lstrip("#")
+        try:
+            if len(hex_color) not in (6, 8):
+                raise ValueError(hex_color)
+            value = int(hex_color, 16)
+        except ValueError:
+            Console.error("Invalid hex color string format. Use #RRGGBB or #RRGGBBAA.")
+            return 0xFF000000
+        if len(hex_color) == 6:
+            value = value << 8 | 0xFF
+        # 0xRRGGBBAA -> A, B, G, R from the high byte down
+        rgba = (value >> 24 | (value >> 8 & 0xFF00) | (value << 8 & 0xFF0000) | (value & 0xFF) << 24)
+        Color32._hexCache[text] = rgba
+        return rgba
+
+    def toHex(self) -> str:
+        rgba = self.rgba
+        return f"#{rgba & 255:02x}{rgba >> 8 & 255:02x}{rgba >> 16 & 255:02x}{rgba >> 24:02x}"
+
+    @property
+    def r(self) -> float:
+        return Color32._unit[self.rgba & 255]
+
+    @r.setter
+    def r(self, value: float) -> None:
+        self.rgba = self.rgba & 0xFFFFFF00 | Color32.pack(value, 0.0, 0.0, 0.0)
+
+    @property
+    def g(self) -> float:
+        return Color32._unit[self.rgba >> 8 & 255]
+
+    @g.setter
+    def g(self, value: float) -> None:
+        self.rgba = self.rgba & 0xFFFF00FF | Color32.pack(0.0, value, 0.0, 0.0)
+
+    @property
+    def b(self) -> float:
+        return Color32._unit[self.rgba >> 16 & 255]
+
+    @b.setter
+    def b(self, value: float) -> None:
+        self.rgba = self.rgba & 0xFF00FFFF | Color32.pack(0.0, 0.0, value, 0.0)
+
+    @property
+    def a(self) -> float:
+        return Color32._unit[self.rgba >> 24]
+
+    @a.setter
+    def a(self, value: float) -> None:
+        self.rgba = self.rgba & 0x00FFFFFF | Color32.pack(0.0, 0.0, 0.0, value)
 
     def getColor(self) -> tuple[float, float, float, float]:
-        """Returns the color as a tuple (r, g, b) with values between 0.0 and 1.0."""
-        return (self.r, self.g, self.b, self.a)
+        """Returns the color as a tuple (r, g, b, a) with values between 0.0 and 1.0."""
+        rgba = self.rgba
+        unit = Color32._unit
+        return (unit[rgba & 255], unit[rgba >> 8 & 255], unit[rgba >> 16 & 255], unit[rgba >> 24])
+
+    def getBytes(self) -> tuple[int, int, int, int]:
+        """Returns the color as a tuple (r, g, b, a) with values between 0 and 255."""
+        rgba = self.rgba
+        return (rgba & 255, rgba >> 8 & 255, rgba >> 16 & 255, rgba >> 24)
+
+    def copy(self) -> "Color32":
+        return Color32.fromPacked(self.rgba)
+
+    def __repr__(self) -> str:
+        return f"Color32('{self.toHex()}')"
     
     @staticmethod
     def lerp(c1: "Color32", c2: "Color32", t: float) -> "Color32":
-        t = Mathf.clamp01(t)
-        return Color32(
-            c1.r + (c2.r - c1.r) * t,
-            c1.g + (c2.g - c1.g) * t,
-            c1.b + (c2.b - c1.b) * t,
-            c1.a + (c2.a - c1.a) * t
-        )
-        
+        color = Color32.__new__(Color32)
+        return Color32.lerpInto(color, c1, c2, t)
+
+    @staticmethod
+    def lerpInto(target: "Color32", c1: "Color32", c2: "Color32", t: float) -> "Color32":
+        """Writes the interpolation of c1 and c2 into target, without allocating."""
+        t = 0.0 if t <= 0.0 else 1.0 if t >= 1.0 else t
+        x, y = c1.rgba, c2.rgba
+        r, g, b, a = x & 255, x >> 8 & 255, x >> 16 & 255, x >> 24
+        target.rgba = (int(r + ((y & 255) - r) * t + 0.5)
+                       | int(g + ((y >> 8 & 255) - g) * t + 0.5) << 8
+                       | int(b + ((y >> 16 & 255) - b) * t + 0.5) << 16
+                       | int(a + ((y >> 24) - a) * t + 0.5) << 24)
+        return target
+
+
+class ColorArray:
+    """
+    A contiguous (N, 4) uint8 buffer of RGBA8 colors, the array counterpart of Color32. The buffer is exposed as
+    `data`, and as one uint32 per color as `packed`; either goes to OpenGL as a normalized unsigned byte attribute,
+    a quarter of the size of four floats.
+    """
+    __slots__ = ("data",)
+
+    def __init__(self, colors: "int | np.ndarray | list[Color32] | ColorArray" = 0):
+        """Float arrays are read as normalized channels; uint8 arrays, contiguous or not, are wrapped without copying."""
+        if isinstance(colors, int):
+            self.data: np.ndarray = np.zeros((colors, 4), dtype=np.uint8)
+        elif isinstance(colors, ColorArray):
+            self.data = colors.data
+        elif isinstance(colors, np.ndarray):
+            if colors.dtype == np.uint8:
+                self.data = colors.reshape(-1, 4)
+            else:
+                self.data = np.empty((colors.size // 4, 4), dtype=np.uint8)
+                ColorArray._store(self.data, np.asarray(colors, dtype=np.float32).reshape(-1, 4) * 255.0)
+        else:
+            self.data = np.array([color.rgba for color in colors], dtype=np.uint32).view(np.uint8).reshape(-1, 4)
+
+    @staticmethod
+    def _operand(other: "ColorArray | Color32 | np.ndarray | float"):
+        """Colors as float channels in 0-255; a 1-D array is one scalar per color."""
+        if isinstance(other, ColorArray):
+            return other.data.astype(np.float32)
+        if isinstance(other, Color32):
+            return np.array(other.getBytes(), dtype=np.float32)
+        if isinstance(other, np.ndarray) and other.ndim == 1:
+            return other[:, None]
+        return other
+
+    @staticmethod
+    def _store(target: np.ndarray, channels: np.ndarray) -> None:
+        # Round and clamp 0-255 float channels into the uint8 buffer
+        channels += 0.5
+        np.clip(channels, 0.0, 255.0, out=channels)
+        np.copyto(target, channels, casting="unsafe")
+
+    @property
+    def packed(self) -> np.ndarray:
+        """The colors as one uint32 each, the same values as Color32.rgba. Needs a contiguous buffer."""
+        return self.data.view(np.uint32).reshape(-1)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: "int | slice | np.ndarray") -> "Color32 | ColorArray":
+        """An integer index returns a Color32 copy; slices return a ColorArray over the same memory."""
+        if isinstance(index, (int, np.integer)):
+            r, g, b, a = self.data[index].tolist()
+            return Color32.fromPacked(r | g << 8 | b << 16 | a << 24)
+        result = ColorArray.__new__(ColorArray)
+        result.data = self.data[index]
+        return result
+
+    def __setitem__(self, index: "int | slice | np.ndarray", value: "Color32 | ColorArray | np.ndarray") -> None:
+        if isinstance(value, Color32):
+            self.data[index] = value.getBytes()
+        else:
+            self.data[index] = value.data if isinstance(value, ColorArray) else value
+
+    def __str__(self) -> str:
+        return f"ColorArray({len(self.data)})"
+
+    def toList(self) -> list[Color32]:
+        return [self[i] for i in range(len(self.data))]
+
+    def copy(self) -> "ColorArray":
+        return ColorArray(self.data.copy())
+
+    def floats(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Returns the colors as an (N, 4) float32 array of normalized channels, written into out if given."""
+        if out is None:
+            out = np.empty(self.data.shape, dtype=np.float32)
+        np.multiply(self.data, np.float32(Color32._1o255), out=out)
+        return out
+
+    @staticmethod
+    def lerp(color1: "ColorArray | Color32", color2: "ColorArray | Color32", t: "float | np.ndarray") -> "ColorArray":
+        """Interpolates row by row; t is a scalar or one value per color, clamped to 0-1."""
+        a = ColorArray._operand(color1)
+        b = ColorArray._operand(color2)
+        count = len(a) if np.ndim(a) == 2 else len(b) if np.ndim(b) == 2 else len(t)  # type: ignore[arg-type]
+        return ColorArray.lerpInto(ColorArray(count), color1, color2, t)
+
+    @staticmethod
+    def lerpInto(target: "ColorArray", color1: "ColorArray | Color32", color2: "ColorArray | Color32", t: "float | np.ndarray") -> "ColorArray":
+        a = ColorArray._operand(color1)
+        channels = np.subtract(ColorArray._operand(color2), a, dtype=np.float32)
+        channels = channels * ColorArray._operand(np.clip(t, 0.0, 1.0))
+        channels += a
+        if channels.shape != target.data.shape:
+            channels = np.broadcast_to(channels, target.data.shape).copy()
+        ColorArray._store(target.data, channels)
+        return target
+
+# Shared constants, like Vector2.zero: copy() before changing channels in place
 Color32.red = Color32(255, 0, 0, 1)
 Color32.green = Color32(0,255,0,1)
 Color32.blue = Color32(0,0,255,1)
@@ -0,0 +1,282 @@
+import os
+import ctypes
+from typing import Callable, Optional
+
+import glfw
+import numpy as np
+
+from ..essentials import Console
+from .gl import opengl, NullGL
+
+
+class SharedContext:
+    """A second GL context sharing objects with the window's, for loading work on another thread."""
+
+    def __init__(self, makeCurrent: Callable[[], None], release: Callable[[], None], destroy: Callable[[], None]):
+        self.makeCurrent = makeCurrent
+        self.release = release
+        self.destroy = destroy
+
+
+class Backend:
+    """What Window needs from a platform: a current GL context, a framebuffer, events and presentation."""
+
+    name: str = "backend"
+
+    def __init__(self, dimensions: tuple[int, int], title: str):
+        self.dimensions = dimensions
+        self.title = title
+        self.handle = None  # Native window handle, if the backend has one
+        self._resizeCallback: Optional[Callable[[int, int], None]] = None
+
+    def getFramebufferSize(self) -> tuple[int, int]:
+        return self.dimensions
+
+    def setResizeCallback(self, callback: Callable[[int, int], None]) -> None:
+        self._resizeCallback = callback
+
+    def resize(self, width: int, height: int) -> None:
+        self.dimensions = (width, height)
+        if self._resizeCallback is not None:
+            self._resizeCallback(width, height)
+
+    def pollEvents(self) -> None:
+        pass
+
+    def shouldClose(self) -> bool:
+        return False
+
+    def swapBuffers(self) -> None:
+        pass
+
+    def setSwapInterval(self, interval: int) -> None:
+        pass
+
+    def setAspectRatio(self, ratio: tuple) -> None:
+        pass
+
+    def createSharedContext(self) -> SharedContext:
+        """Must be called on the thread that owns the window; the returned context may then be used on any other."""
+        return SharedContext(lambda: None, lambda: None, lambda: None)
+
+    def readPixels(self) -> np.ndarray:
+        """The current framebuffer as a (height, width, 4) uint8 array, bottom row first."""
+        width, height = self.getFramebufferSize()
+        data = opengl.glReadPixels(0, 0, width, height, opengl.GL_RGBA, opengl.GL_UNSIGNED_BYTE)
+        return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 4)
+
+    def terminate(self) -> None:
+        pass
+
+
+class GLFWBackend(Backend):
+    """An on-screen window through GLFW."""
+
+    name = "glfw"
+
+    def __init__(self, dimensions: tuple[int, int], title: str, monitor=None, share=None):
+        super().__init__(dimensions, title)
+        if not glfw.init():
+            raise Exception("GLFW cannot be initialized")
+
+        self.handle = glfw.create_window(dimensions[0], dimensions[1], title, monitor, share)
+        if not self.handle:
+            glfw.terminate()
+            raise Exception("GLFW window cannot be created")
+
+        glfw.make_context_current(self.handle)
+        glfw.set_framebuffer_size_callback(self.handle, lambda window, width, height: self.resize(width, height))
+
+    def getFramebufferSize(self) -> tuple[int, int]:
+        return tuple(glfw.get_framebuffer_size(self.handle))
+
+    def pollEvents(self) -> None:
+        glfw.poll_events()
+
+    def shouldClose(self) -> bool:
+        return glfw.window_should_close(self.handle)
+
+    def swapBuffers(self) -> None:
+        glfw.swap_buffers(self.handle)
+
+    def setSwapInterval(self, interval: int) -> None:
+        glfw.swap_interval(interval)
+
+    def setAspectRatio(self, ratio: tuple) -> None:
+        glfw.set_window_aspect_ratio(self.handle, *ratio)
+
+    def createSharedContext(self) -> SharedContext:
+        glfw.window_hint(glfw.VISIBLE, glfw.FALSE)
+        window = glfw.create_window(1, 1, "", None, self.handle)
+        glfw.default_window_hints()
+        if not window:
+            raise RuntimeError("GLFW could not create a shared context")
+        return SharedContext(lambda: glfw.make_context_current(window), lambda: glfw.make_context_current(None),
+                             lambda: glfw.destroy_window(window))
+
+    def terminate(self) -> None:
+        glfw.terminate()
+
+
+class OffscreenBackend(Backend):
+    """
+    A real GL context with no display: EGL on Mesa's surfaceless platform (llvmpipe) rendering into a pbuffer,
+    falling back to OSMesa when EGL is unavailable. OSMesa needs PYOPENGL_PLATFORM=osmesa set before OpenGL is
+    first imported.
+    """
+
+    name = "offscreen"
+
+    def __init__(self, dimensions: tuple[int, int], title: str):
+        super().__init__(dimensions, title)
+        self._egl = None
+        self._osmesa = None
+        try:
+            self._createEGL(*dimensions)
+        except Exception as egl_error:
+            try:
+                self._createOSMesa(*dimensions)
+            except Exception as osmesa_error:
+                raise RuntimeError(f"No offscreen GL context available (EGL: {egl_error}; OSMesa: {osmesa_error})")
+        Console.log(f"Offscreen backend: {opengl.glGetString(opengl.GL_RENDERER).decode()}")
+
+    def _createEGL(self, width: int, height: int) -> None:
+        # Mesa reads this when the default display is opened; without it EGL looks for X11 or Wayland
+        os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+        from OpenGL import EGL, platform
+        if "EGL" not in type(platform.PLATFORM).__name__:
+            raise RuntimeError("PyOpenGL was loaded for another platform, set PYOPENGL_PLATFORM=egl before importing it")
+
+        display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+        if display == EGL.EGL_NO_DISPLAY or not EGL.eglInitialize(display, None, None):
+            raise RuntimeError("eglInitialize failed")
+
+        attributes = (EGL.EGLint * 13)(EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT, EGL.EGL_RED_SIZE, 8,
+                                       EGL.EGL_GREEN_SIZE, 8, EGL.EGL_BLUE_SIZE, 8, EGL.EGL_ALPHA_SIZE, 8,
+                                       EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT, EGL.EGL_NONE)
+        config = EGL.EGLConfig()
+        count = EGL.EGLint()
+        if not EGL.eglChooseConfig(display, attributes, ctypes.pointer(config), 1, ctypes.pointer(count)) or not count.value:
+            raise RuntimeError("no EGL config with desktop OpenGL and pbuffer support")
+
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+        context = EGL.eglCreateContext(display, config, EGL.EGL_NO_CONTEXT, None)
+        if context == EGL.EGL_NO_CONTEXT:
+            raise RuntimeError("eglCreateContext failed")
+        self._egl = [EGL, display, config, None, context]
+        self._setEGLSurface(width, height)
+
+    def _setEGLSurface(self, width: int, height: int) -> None:
+        EGL, display, config, previous, context = self._egl
+        surface = EGL.eglCreatePbufferSurface(display, config, (EGL.EGLint * 5)(EGL.EGL_WIDTH, width, EGL.EGL_HEIGHT, height, EGL.EGL_NONE))
+        if surface == EGL.EGL_NO_SURFACE or not EGL.eglMakeCurrent(display, surface, surface, context):
+            raise RuntimeError("could not make an EGL pbuffer surface current")
+        if previous is not None:
+            EGL.eglDestroySurface(display, previous)
+        self._egl[3] = surface
+
+    def _createOSMesa(self, width: int, height: int) -> None:
+        from OpenGL import osmesa
+
+        context = osmesa.OSMesaCreateContextExt(osmesa.OSMESA_RGBA, 24, 0, 0, None)
+        if not context:
+            raise RuntimeError("OSMesaCreateContextExt failed")
+        self._osmesa = [osmesa, context, None]
+        self._setOSMesaBuffer(width, height)
+
+    def _setOSMesaBuffer(self, width: int, height: int) -> None:
+        from OpenGL import arrays
+
+        osmesa, context, _ = self._osmesa
+        buffer = arrays.GLubyteArray.zeros((height, width, 4))
+        if not osmesa.OSMesaMakeCurrent(context, buffer, opengl.GL_UNSIGNED_BYTE, width, height):
+            raise RuntimeError("OSMesaMakeCurrent failed")
+        self._osmesa[2] = buffer
+
+    def resize(self, width: int, height: int) -> None:
+        """Swaps in a render target of the new size; the context, and every GL object in it, is kept."""
+        if self._egl is not None:
+            self._setEGLSurface(width, height)
+        else:
+            self._setOSMesaBuffer(width, height)
+        super().resize(width, height)
+
+    def createSharedContext(self) -> SharedContext:
+        if self._egl is None:
+            raise RuntimeError("Shared contexts need the EGL offscreen backend")
+        EGL, display, config, _, main_context = self._egl
+        context = EGL.eglCreateContext(display, config, main_context, None)
+        surface = EGL.eglCreatePbufferSurface(display, config, (EGL.EGLint * 5)(EGL.EGL_WIDTH, 1, EGL.EGL_HEIGHT, 1, EGL.EGL_NONE))
+        if context == EGL.EGL_NO_CONTEXT or surface == EGL.EGL_NO_SURFACE:
+            raise RuntimeError("EGL could not create a shared context")
+
+        def makeCurrent() -> None:
+            EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+            if not EGL.eglMakeCurrent(display, surface, surface, context):
+                raise RuntimeError("could not make the shared EGL context current")
+
+        def destroy() -> None:
+            EGL.eglDestroySurface(display, surface)
+            EGL.eglDestroyContext(display, context)
+
+        return SharedContext(makeCurrent, lambda: EGL.eglMakeCurrent(display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT), destroy)
+
+    def swapBuffers(self) -> None:
+        if self._egl is not None:
+            EGL, display, _, surface, _ = self._egl
+            EGL.eglSwapBuffers(display, surface)
+        else:
+            opengl.glFinish()
+
+    def terminate(self) -> None:
+        if self._egl is not None:
+            EGL, display, _, surface, context = self._egl
+            EGL.eglMakeCurrent(display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT)
+            EGL.eglDestroySurface(display, surface)
+            EGL.eglDestroyContext(display, context)
+            self._egl = None
+        elif self._osmesa is not None:
+            osmesa, context, _ = self._osmesa
+            osmesa.OSMesaDestroyContext(context)
+            self._osmesa = None
+
+
+class NullBackend(Backend):
+    """No GL at all: engine GL calls go to a NullGL recorder, so scenes run anywhere at the cost of the Python side only."""
+
+    name = "null"
+
+    def __init__(self, dimensions: tuple[int, int], title: str):
+        super().__init__(dimensions, title)
+        self.gl = NullGL()
+        self._previous = opengl.target
+        opengl.bind(self.gl)
+
+    def swapBuffers(self) -> None:
+        self.gl.endFrame()
+
+    def readPixels(self) -> np.ndarray:
+        width, height = self.dimensions
+        return np.zeros((height, width, 4), dtype=np.uint8)
+
+    def terminate(self) -> None:
+        if opengl.target is self.gl:
+            opengl.bind(self._previous)
+
+
+BACKENDS: dict[str, type[Backend]] = {
+    GLFWBackend.name: GLFWBackend,
+    OffscreenBackend.name: OffscreenBackend,
+    NullBackend.name: NullBackend,
+}
+
+
+def createBackend(name: Optional[str], dimensions: tuple[int, int], title: str, **options) -> Backend:
+    """Creates the named backend; with no name, the AURORA_BACKEND environment variable decides (default glfw)."""
+    name = (name or os.environ.get("AURORA_BACKEND") or GLFWBackend.name).lower()
+    backend = BACKENDS.get(name)
+    if backend is None:
+        raise RuntimeError(f"Unknown backend '{name}', expected one of: {', '.join(BACKENDS)}")
+    if backend is GLFWBackend:
+        return backend(dimensions, title, **options)
+    return backend(dimensions, title)
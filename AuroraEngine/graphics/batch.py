@@ -0,0 +1,210 @@
+import ctypes
+import numpy as np
+from typing import Optional
+
+from .gl import opengl
+from .glstate import GLState
+from ..essentials import Console, Vector2, Color32, Transform
+from .shaders import Shader, ShaderCache
+from .camera import Camera
+from .textures import TextureAtlas, AtlasRegion, AtlasPage
+
+
+class SpriteBatch:
+    """
+    Collects every sprite submitted during a frame and draws each group with one instanced call. Sprites are grouped
+    by shape, blending and atlas page, so textured sprites sharing a page batch together.
+    """
+
+    # Per-instance layout: model row 0 (3 floats), model row 1 (3 floats), color (4 bytes packed in one float slot,
+    # see Color32), atlas UV rect (4 floats)
+    INSTANCE_FLOATS: int = 11
+    COLOR_COLUMN: int = 6
+
+    SHAPES: dict[str, tuple[int, tuple[float, ...]]] = {
+        "rectangle": (opengl.GL_TRIANGLE_FAN, (
+            -0.5, -0.5,  # Bottom-left
+             0.5, -0.5,  # Bottom-right
+             0.5,  0.5,  # Top-right
+            -0.5,  0.5   # Top-left
+        )),
+        "triangle": (opengl.GL_TRIANGLES, (
+            -0.5, -0.5,
+             0.5, -0.5,
+             0.0,  0.5
+        )),
+    }
+
+    _program_id: int = 0
+    _projection_loc: int = -1
+    _atlas_loc: int = -1
+    _instance_vbo_id: int = 0
+    _shape_buffers: dict[str, tuple[int, int, int]] = {}  # shape -> (vao, primitive, vertex count)
+    # Used when no Camera exists: orthographic -10..10 on both axes
+    _default_projection = np.array([
+        0.1, 0.0, 0.0, 0.0,
+        0.0, 0.1, 0.0, 0.0,
+        0.0, 0.0, -1.0, 0.0,
+        0.0, 0.0, 0.0, 1.0
+    ], dtype=np.float32).reshape(4, 4)
+
+    _initialized_gl_resources = False
+
+    # (shape, blend, atlas page or None) -> (flat list of instance floats, packed colors, instance arrays) collected this frame
+    _groups: dict[tuple[str, bool, Optional[AtlasPage]], tuple[list[float], list[int], list[np.ndarray]]] = {}
+
+    # Statistics of the last flushed frame
+    spriteCount: int = 0
+    batchCount: int = 0
+    drawCalls: int = 0
+
+    @classmethod
+    def initialize(cls) -> None:
+        if cls._initialized_gl_resources:
+            return
+        Console.log("SpriteBatch: Setting up OpenGL resources (VBOs, VAOs, Shaders)...")
+
+        cls._program_id = ShaderCache.getProgram(Shader.INSTANCED_VERTEX_SHADER_SOURCE, Shader.INSTANCED_FRAGMENT_SHADER_SOURCE)
+        cls._projection_loc = opengl.glGetUniformLocation(cls._program_id, "projection")
+        if cls._projection_loc == -1:
+            Console.error("Failed to get uniform locations for SpriteBatch shader!")
+            raise RuntimeError("Shader uniform location error.")
+        cls._atlas_loc = opengl.glGetUniformLocation(cls._program_id, "atlas")
+
+        cls._instance_vbo_id = opengl.glGenBuffers(1)
+        stride = cls.INSTANCE_FLOATS * 4
+
+        for name, (primitive, vertices) in cls.SHAPES.items():
+            shape_vertices = np.array(vertices, dtype=np.float32)
+
+            vao_id = opengl.glGenVertexArrays(1)
+            GLState.bindVertexArray(vao_id)
+
+            vbo_id = opengl.glGenBuffers(1)
+            GLState.bindBuffer(opengl.GL_ARRAY_BUFFER, vbo_id)
+            opengl.glBufferData(opengl.GL_ARRAY_BUFFER, shape_vertices.nbytes, shape_vertices, opengl.GL_STATIC_DRAW)
+            opengl.glVertexAttribPointer(0, 2, opengl.GL_FLOAT, opengl.GL_FALSE, 2 * shape_vertices.itemsize, None)
+            opengl.glEnableVertexAttribArray(0)
+
+            GLState.bindBuffer(opengl.GL_ARRAY_BUFFER, cls._instance_vbo_id)
+            for location, size, kind, normalized, offset in ((1, 3, opengl.GL_FLOAT, opengl.GL_FALSE, 0),
+                                                             (2, 3, opengl.GL_FLOAT, opengl.GL_FALSE, 3),
+                                                             (3, 4, opengl.GL_UNSIGNED_BYTE, opengl.GL_TRUE, cls.COLOR_COLUMN),
+                                                             (4, 4, opengl.GL_FLOAT, opengl.GL_FALSE, 7)):
+                opengl.glVertexAttribPointer(location, size, kind, normalized, stride, ctypes.c_void_p(offset * 4))
+                opengl.glEnableVertexAttribArray(location)
+                opengl.glVertexAttribDivisor(location, 1)
+
+            cls._shape_buffers[name] = (vao_id, primitive, len(vertices) // 2)
+
+        cls._initialized_gl_resources = True
+        Console.log("SpriteBatch: OpenGL resources setup complete.")
+
+    @staticmethod
+    def submit(shape: str, position: Vector2, rotation: float, scale: Vector2, color: Color32, blend: bool = False,
+               texture: Optional[AtlasRegion] = None) -> None:
+        """Queues one sprite for this frame's batched draw."""
+        SpriteBatch.submitAffine(shape, Transform.composeAffine(position.x, position.y, rotation, scale.x, scale.y), color, blend, texture)
+
+    @staticmethod
+    def submitAffine(shape: str, affine: tuple[float, float, float, float, float, float], color: Color32, blend: bool = False,
+                     texture: Optional[AtlasRegion] = None) -> None:
+        """Queues one sprite whose world matrix rows (a, b, tx, c, d, ty) are already known, e.g. from Transform.getAffine()."""
+        group = SpriteBatch._group(shape, blend, texture.page if texture is not None else None)
+        if group is not None:
+            group[0].extend(affine)
+            group[0].append(0.0)  # Color slot, filled from group[1] at flush
+            group[0].extend(texture.uv if texture is not None else TextureAtlas.FULL_UV)
+            group[1].append(color.rgba)
+
+    @staticmethod
+    def submitMany(shape: str, instances: np.ndarray, blend: bool = False, page: Optional[AtlasPage] = None) -> None:
+        """
+        Queues an (N, INSTANCE_FLOATS) float32 array of instances, colors written through instanceColors(). The array
+        is read at flush time, not copied; call detach() before reusing its memory earlier than that.
+        """
+        group = SpriteBatch._group(shape, blend, page)
+        if group is not None and len(instances):
+            group[2].append(instances)
+
+    @staticmethod
+    def detach(buffer: np.ndarray) -> None:
+        """Replaces every queued submitMany array that shares memory with buffer by a copy, so buffer can be reused."""
+        for floats, colors, arrays in SpriteBatch._groups.values():
+            for index, instances in enumerate(arrays):
+                if np.shares_memory(instances, buffer):
+                    arrays[index] = instances.copy()
+
+    @staticmethod
+    def instanceColors(instances: np.ndarray) -> np.ndarray:
+        """The (N, 4) uint8 RGBA view of the color slots of an instance array, e.g. as a ColorArray's data."""
+        column = SpriteBatch.COLOR_COLUMN * 4
+        return instances.view(np.uint8).reshape(len(instances), -1)[:, column:column + 4]
+
+    @staticmethod
+    def _group(shape: str, blend: bool, page: Optional[AtlasPage]) -> Optional[tuple[list[float], list[int], list[np.ndarray]]]:
+        key = (shape, blend, page)
+        group = SpriteBatch._groups.get(key)
+        if group is None:
+            if shape not in SpriteBatch.SHAPES:
+                Console.warn(f"No sprite with name {shape} found.")
+                return None
+            group = SpriteBatch._groups[key] = ([], [], [])
+        return group
+
+    @staticmethod
+    def clear() -> None:
+        """Drops everything queued since the last flush, e.g. when nothing will draw it."""
+        for floats, colors, arrays in SpriteBatch._groups.values():
+            floats.clear()
+            colors.clear()
+            arrays.clear()
+
+    @staticmethod
+    def flush() -> None:
+        """Draws every queued sprite, one instanced call per shape group, and resets the queue."""
+        cls = SpriteBatch
+        cls.spriteCount = 0
+        cls.batchCount = 0
+        cls.drawCalls = 0
+
+        # Opaque groups first so blended sprites land on top of them
+        pending = [(key, group) for key, group in cls._groups.items() if group[0] or group[2]]
+        if not pending:
+            return
+        pending.sort(key=lambda item: item[0][1])
+
+        cls.initialize()
+        TextureAtlas.upload()
+        GLState.useProgram(cls._program_id)
+        opengl.glUniform1i(cls._atlas_loc, 0)
+        camera = getattr(Camera, "MainCamera", None)
+        projection = camera.getProjectionMatrix() if camera is not None else cls._default_projection
+        opengl.glUniformMatrix4fv(cls._projection_loc, 1, opengl.GL_TRUE, projection)
+
+        for (shape, blend, page), (floats, colors, arrays) in pending:
+            if floats:
+                submitted = np.array(floats, dtype=np.float32).reshape(-1, cls.INSTANCE_FLOATS)
+                submitted.view(np.uint32)[:, cls.COLOR_COLUMN] = colors
+                arrays.append(submitted)
+            instances = arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+            instance_count = len(instances)
+            floats.clear()
+            colors.clear()
+            arrays.clear()
+
+            GLState.bindBuffer(opengl.GL_ARRAY_BUFFER, cls._instance_vbo_id)
+            opengl.glBufferData(opengl.GL_ARRAY_BUFFER, instances.nbytes, instances, opengl.GL_STREAM_DRAW)
+
+            GLState.setBlend(blend)
+            GLState.bindTexture(opengl.GL_TEXTURE_2D, page.texture if page is not None else TextureAtlas.whiteTexture())
+            vao_id, primitive, vertex_count = cls._shape_buffers[shape]
+            GLState.bindVertexArray(vao_id)
+            opengl.glDrawArraysInstanced(primitive, 0, vertex_count, instance_count)
+
+            cls.spriteCount += instance_count
+            cls.batchCount += 1
+            cls.drawCalls += 1
+
+        # Immediate-mode drawing after the flush must not go through the sprite program and VAO
+        GLState.useFixedFunction()
@@ -1,4 +1,5 @@
-import OpenGL.GL as opengl
+import numpy as np
+from .gl import opengl
 from ..essentials import Vector2
 
 class Camera:
@@ -10,19 +11,29 @@ class Camera:
         self.zoom = 1.0
         self.screen_size = screen_size
         
-    def applyProjection(self):
+    def getVisibleBounds(self) -> tuple[float, float, float, float]:
+        """World-space rectangle (left, bottom, right, top) covered by the orthographic projection."""
         width, height = self.screen_size
-        aspect = width / height
+        aspect = width / height if height else 1.0
+        return (-aspect * self.zoom + self.position.x, -self.zoom + self.position.y,
+                aspect * self.zoom + self.position.x, self.zoom + self.position.y)
+
+    def getProjectionMatrix(self) -> np.ndarray:
+        """Row-major 4x4 equivalent of the glOrtho call made by applyProjection."""
+        left, bottom, right, top = self.getVisibleBounds()
+        return np.array([
+            2.0/(right-left), 0.0, 0.0, -(right+left)/(right-left),
+            0.0, 2.0/(top-bottom), 0.0, -(top+bottom)/(top-bottom),
+            0.0, 0.0, -1.0, 0.0,
+            0.0, 0.0, 0.0, 1.0
+        ], dtype=np.float32).reshape(4, 4)
 
+    def applyProjection(self):
         opengl.glMatrixMode(opengl.GL_PROJECTION)
         opengl.glLoadIdentity()
 
-        left, right = -aspect * self.zoom, aspect * self.zoom
-        bottom, top = -1 * self.zoom, 1 * self.zoom
-
-        opengl.glOrtho(left + self.position.x, right + self.position.x,
-                bottom + self.position.y, top + self.position.y,
-                -1, 1)
+        left, bottom, right, top = self.getVisibleBounds()
+        opengl.glOrtho(left, right, bottom, top, -1, 1)
 
         opengl.glMatrixMode(opengl.GL_MODELVIEW)
         opengl.glLoadIdentity()
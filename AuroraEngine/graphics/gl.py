@@ -0,0 +1,110 @@
+import os
+import sys
+from collections import Counter
+from typing import Any
+
+# PyOpenGL picks its platform once, on first import. Without a display only the offscreen (EGL) backend can make a
+# context, so default to EGL there; an explicit PYOPENGL_PLATFORM always wins.
+if sys.platform.startswith("linux") and "PYOPENGL_PLATFORM" not in os.environ:
+    if os.environ.get("AURORA_BACKEND", "").lower() == "offscreen" or not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        os.environ["PYOPENGL_PLATFORM"] = "egl"
+
+try:
+    import OpenGL.GL as _GL
+except ImportError:  # No PyOpenGL or no libGL: only the null backend can run
+    _GL = None
+
+
+class GLProxy:
+    """
+    Stand-in for the OpenGL.GL module that engine code calls through (`opengl.glDrawArrays(...)`). It forwards to
+    whatever it is bound to: PyOpenGL for real contexts, a NullGL recorder for the null backend. Looked-up names
+    are cached on the instance, so after the first call a lookup costs the same as a module attribute.
+    """
+
+    def __init__(self, target: Any):
+        object.__setattr__(self, "_target", target)
+
+    def bind(self, target: Any) -> None:
+        self.__dict__.clear()
+        object.__setattr__(self, "_target", target)
+
+    @property
+    def target(self) -> Any:
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        self.__dict__[name] = value
+        return value
+
+
+class NullGL:
+    """
+    OpenGL replacement that draws nothing. Object-creating calls hand out increasing ids, queries report success,
+    every call is counted and draw calls are recorded with their arguments until the frame ends.
+    """
+
+    DRAW_CALLS = frozenset(("glDrawArrays", "glDrawArraysInstanced", "glDrawElements", "glDrawElementsInstanced", "glBegin"))
+    _CREATE_CALLS = frozenset(("glGenBuffers", "glGenVertexArrays", "glGenTextures", "glGenFramebuffers",
+                               "glCreateShader", "glCreateProgram"))
+
+    def __init__(self):
+        self.callCounts: Counter = Counter()
+        self.drawCalls: list[tuple[str, tuple]] = []
+        self.lastFrameDrawCalls: list[tuple[str, tuple]] = []
+        self._nextId = 1
+        self._constants: dict[str, int] = {}
+
+    def endFrame(self) -> None:
+        self.lastFrameDrawCalls = self.drawCalls
+        self.drawCalls = []
+
+    def _newId(self) -> int:
+        value = self._nextId
+        self._nextId += 1
+        return value
+
+    def _constant(self, name: str) -> int:
+        if _GL is not None and hasattr(_GL, name):
+            return int(getattr(_GL, name))
+        # Without PyOpenGL any distinct value will do
+        return self._constants.setdefault(name, 0x10000 + len(self._constants))
+
+    def __getattr__(self, name: str) -> Any:
+        if not name.startswith(("gl", "GL_")):
+            raise AttributeError(name)
+        if name.startswith("GL_"):
+            value = self._constant(name)
+            setattr(self, name, value)
+            return value
+
+        counts = self.callCounts
+        if name in NullGL._CREATE_CALLS:
+            def call(*args):
+                counts[name] += 1
+                if name.startswith("glGen") and args and args[0] > 1:
+                    return [self._newId() for _ in range(args[0])]
+                return self._newId()
+        elif name in NullGL.DRAW_CALLS:
+            def call(*args):
+                counts[name] += 1
+                self.drawCalls.append((name, args))
+        elif name.startswith(("glGetShaderiv", "glGetProgramiv")):
+            def call(*args):
+                counts[name] += 1
+                return 1
+        elif name.startswith(("glGetShaderInfoLog", "glGetProgramInfoLog", "glGetString")):
+            def call(*args):
+                counts[name] += 1
+                return b"NullGL"
+        else:
+            def call(*args):
+                counts[name] += 1
+                return 0
+
+        setattr(self, name, call)
+        return call
+
+
+opengl = GLProxy(_GL if _GL is not None else NullGL())
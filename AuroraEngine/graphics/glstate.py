@@ -0,0 +1,171 @@
+from typing import Optional
+
+from .gl import opengl
+
+
+class GLState:
+    """
+    Shadow copy of the GL state the engine changes. Every engine bind, enable and viewport change goes through
+    here, and a change to the value that is already current is skipped. Anything that touches GL behind the
+    engine's back must call GLState.reset() so the next change is issued unconditionally.
+    """
+
+    # State changes issued to / skipped before reaching the driver, this frame and in the last finished frame
+    issued: int = 0
+    skipped: int = 0
+    lastFrameIssued: int = 0
+    lastFrameSkipped: int = 0
+
+    # None means unknown: the next change is always issued
+    _program: Optional[int] = None
+    _vertexArray: Optional[int] = None
+    _buffers: dict[int, int] = {}
+    _capabilities: dict[int, bool] = {}
+    _blendFunc: Optional[tuple[int, int]] = None
+    _viewport: Optional[tuple[int, int, int, int]] = None
+    _activeTexture: Optional[int] = None
+    _textures: dict[tuple[int, int], int] = {}  # (texture unit, target) -> texture
+
+    @staticmethod
+    def reset() -> None:
+        """Forgets all tracked state, e.g. after a context switch or raw GL calls from outside the engine."""
+        GLState._program = None
+        GLState._vertexArray = None
+        GLState._buffers.clear()
+        GLState._capabilities.clear()
+        GLState._blendFunc = None
+        GLState._viewport = None
+        GLState._activeTexture = None
+        GLState._textures.clear()
+
+    @staticmethod
+    def endFrame() -> None:
+        GLState.lastFrameIssued = GLState.issued
+        GLState.lastFrameSkipped = GLState.skipped
+        GLState.issued = 0
+        GLState.skipped = 0
+
+    @staticmethod
+    def useProgram(program: int) -> None:
+        if GLState._program == program:
+            GLState.skipped += 1
+            return
+        opengl.glUseProgram(program)
+        GLState._program = program
+        GLState.issued += 1
+
+    @staticmethod
+    def bindVertexArray(vertexArray: int) -> None:
+        if GLState._vertexArray == vertexArray:
+            GLState.skipped += 1
+            return
+        opengl.glBindVertexArray(vertexArray)
+        GLState._vertexArray = vertexArray
+        # The element array binding is part of the vertex array object
+        GLState._buffers.pop(opengl.GL_ELEMENT_ARRAY_BUFFER, None)
+        GLState.issued += 1
+
+    @staticmethod
+    def bindBuffer(target: int, buffer: int) -> None:
+        if GLState._buffers.get(target) == buffer:
+            GLState.skipped += 1
+            return
+        opengl.glBindBuffer(target, buffer)
+        GLState._buffers[target] = buffer
+        GLState.issued += 1
+
+    @staticmethod
+    def setCapability(capability: int, enabled: bool) -> None:
+        if GLState._capabilities.get(capability) == enabled:
+            GLState.skipped += 1
+            return
+        if enabled:
+            opengl.glEnable(capability)
+        else:
+            opengl.glDisable(capability)
+        GLState._capabilities[capability] = enabled
+        GLState.issued += 1
+
+    @staticmethod
+    def enable(capability: int) -> None:
+        GLState.setCapability(capability, True)
+
+    @staticmethod
+    def disable(capability: int) -> None:
+        GLState.setCapability(capability, False)
+
+    @staticmethod
+    def blendFunc(source: int, destination: int) -> None:
+        if GLState._blendFunc == (source, destination):
+            GLState.skipped += 1
+            return
+        opengl.glBlendFunc(source, destination)
+        GLState._blendFunc = (source, destination)
+        GLState.issued += 1
+
+    @staticmethod
+    def setBlend(enabled: bool, source: Optional[int] = None, destination: Optional[int] = None) -> None:
+        """Enables or disables blending; when enabling, sets the blend function too (standard alpha by default)."""
+        GLState.setCapability(opengl.GL_BLEND, enabled)
+        if enabled:
+            GLState.blendFunc(opengl.GL_SRC_ALPHA if source is None else source,
+                              opengl.GL_ONE_MINUS_SRC_ALPHA if destination is None else destination)
+
+    @staticmethod
+    def viewport(x: int, y: int, width: int, height: int) -> None:
+        if GLState._viewport == (x, y, width, height):
+            GLState.skipped += 1
+            return
+        opengl.glViewport(x, y, width, height)
+        GLState._viewport = (x, y, width, height)
+        GLState.issued += 1
+
+    @staticmethod
+    def activeTexture(unit: int) -> None:
+        """unit is the index of the texture unit, not the GL_TEXTURE0 + index enum."""
+        if GLState._activeTexture == unit:
+            GLState.skipped += 1
+            return
+        opengl.glActiveTexture(opengl.GL_TEXTURE0 + unit)
+        GLState._activeTexture = unit
+        GLState.issued += 1
+
+    @staticmethod
+    def bindTexture(target: int, texture: int, unit: int = 0) -> None:
+        key = (unit, target)
+        if GLState._textures.get(key) == texture:
+            GLState.skipped += 1
+            return
+        GLState.activeTexture(unit)
+        opengl.glBindTexture(target, texture)
+        GLState._textures[key] = texture
+        GLState.issued += 1
+
+    @staticmethod
+    def useFixedFunction() -> None:
+        """Unbinds the shader program and vertex array before immediate-mode drawing (glBegin/glEnd)."""
+        GLState.useProgram(0)
+        GLState.bindVertexArray(0)
+
+    @staticmethod
+    def forgetProgram(program: int) -> None:
+        """Call after deleting the object, as GL may hand its id out again."""
+        if GLState._program == program:
+            GLState._program = None
+
+    @staticmethod
+    def forgetBuffer(buffer: int) -> None:
+        for target, bound in list(GLState._buffers.items()):
+            if bound == buffer:
+                del GLState._buffers[target]
+
+    @staticmethod
+    def forgetVertexArray(vertexArray: int) -> None:
+        if GLState._vertexArray == vertexArray:
+            GLState._vertexArray = None
+
+    @staticmethod
+    def forgetTexture(texture: int) -> None:
+        for key, bound in list(GLState._textures.items()):
+            if bound == texture:
+                del GLState._textures[key]
@@ -1,62 +1,33 @@
-from ..essentials import Component, GameObject, Vector2, Color32, Mathf, System, Console
+from ..essentials import Component, GameObject, Color32, ColorArray, Mathf, System, Console
 from ..components.VBOSpriteRenderer import VBO_SpriteRenderer
-import random
-import OpenGL.GL as opengl
+from .batch import SpriteBatch
+from .textures import TextureAtlas
+from ..pooling import Pool
+import numpy as np
 from typing import Optional
 
-class Particle:
-    def __init__(self,
-            position: Vector2,
-            velocity: Vector2,
-            start_lifetime: float,
-            start_size: float,
-            end_size: float,
-            start_color: Color32,
-            end_color: Color32,
-            start_rotation: float = 0.0,
-            angular_velocity: float = 0.0):
-        self.position = position
-        self.velocity = velocity
-        self.total_lifetime = start_lifetime
-        self.current_life = 0.0
-        self.start_size = start_size
-        self.end_size = end_size
-        self.start_color = start_color
-        self.end_color = end_color
-        self.rotation = start_rotation
-        self.angular_velocity = angular_velocity
-        self.is_alive = True
-
-    def update(self):
-        if not self.is_alive:
-            return
-
-        self.current_life += System.deltaTime
-
-        if self.current_life >= self.total_lifetime:
-            self.is_alive = False
-            return
-
-        self.position += self.velocity * System.deltaTime
-
-        self.rotation += self.angular_velocity * System.deltaTime
-
-
-    def get_current_state(self) -> tuple[Vector2, float, Vector2, Color32]:
-        """Returns the current position, rotation, scale, and color for rendering."""
-        t = self.current_life / self.total_lifetime
-
-        current_size = Mathf.lerp(self.start_size, self.end_size, t)
-        current_scale = Vector2(current_size, current_size)
-
-        current_color = Color32.lerp(self.start_color, self.end_color, t)
-
-        return self.position, self.rotation, current_scale, current_color
-    
-
+# Per-particle columns of ParticleSystem: attribute name -> (shape of one row, dtype); colors are RGBA8 like Color32
+_PARTICLE_COLUMNS: dict[str, tuple[tuple[int, ...], type]] = {
+    "_position": ((2,), np.float32),
+    "_velocity": ((2,), np.float32),
+    "_life": ((), np.float32),
+    "_lifetime": ((), np.float32),
+    "_start_size": ((), np.float32),
+    "_end_size": ((), np.float32),
+    "_start_color": ((4,), np.uint8),
+    "_end_color": ((4,), np.uint8),
+    "_rotation": ((), np.float32),
+    "_angular_velocity": ((), np.float32),
+}
 
 
 class ParticleSystem(Component):
+    serializedFields = ("max_particles", "emission_rate", "duration", "looping", "start_delay",
+                        "start_lifetime_min", "start_lifetime_max", "start_speed_min", "start_speed_max",
+                        "start_size_min", "start_size_max", "end_size_min", "end_size_max",
+                        "start_color_min", "start_color_max", "end_color_min", "end_color_max",
+                        "start_rotation_min", "start_rotation_max", "angular_velocity_min", "angular_velocity_max",
+                        "shape", "cone_angle", "cone_direction", "sprite_type", "gravity_modifier")
     def __init__(self, gameObject: GameObject,
         max_particles: int = 100,
         emission_rate: float = 10.0, # particles per second
@@ -71,10 +42,10 @@ class ParticleSystem(Component):
         start_size_max: float = 0.3,
         end_size_min: float = 0.01,
         end_size_max: float = 0.05,
-        start_color_min: Color32 = Color32(255, 255, 255, 255), # White
-        start_color_max: Color32 = Color32(255, 255, 255, 255),
-        end_color_min: Color32 = Color32(255, 255, 255, 0), # Transparent White
-        end_color_max: Color32 = Color32(255, 255, 255, 0),
+        start_color_min: Optional[Color32] = None, # White
+        start_color_max: Optional[Color32] = None,
+        end_color_min: Optional[Color32] = None, # Transparent White
+        end_color_max: Optional[Color32] = None,
         start_rotation_min: float = 0.0,
         start_rotation_max: float = 360.0,
         angular_velocity_min: float = -50.0, # degrees per second
@@ -101,10 +72,11 @@ class ParticleSystem(Component):
         self.start_size_max = start_size_max
         self.end_size_min = end_size_min
         self.end_size_max = end_size_max
-        self.start_color_min = start_color_min
-        self.start_color_max = start_color_max
-        self.end_color_min = end_color_min
-        self.end_color_max = end_color_max
+        # Own instances rather than shared defaults, as colors change in place
+        self.start_color_min = start_color_min if start_color_min is not None else Color32(255, 255, 255, 255)
+        self.start_color_max = start_color_max if start_color_max is not None else Color32(255, 255, 255, 255)
+        self.end_color_min = end_color_min if end_color_min is not None else Color32(255, 255, 255, 0)
+        self.end_color_max = end_color_max if end_color_max is not None else Color32(255, 255, 255, 0)
         self.start_rotation_min = start_rotation_min
         self.start_rotation_max = start_rotation_max
         self.angular_velocity_min = angular_velocity_min
@@ -117,7 +89,13 @@ class ParticleSystem(Component):
 
         self.sprite_type = sprite_type
 
-        self.particles: list[Particle] = []
+        # Structure-of-arrays particle store; rows [0, _count) are alive
+        self._rng = np.random.default_rng(ParticleSystem._seedSource.integers(2 ** 63))
+        self._capacity = 0
+        self._count = 0
+        self._columns: Optional[dict[str, np.ndarray]] = None
+        self._allocate(max_particles)
+
         self.time_since_last_emission = 0.0
         self.emission_accumulator = 0.0
         self.current_duration_time = 0.0
@@ -150,71 +128,165 @@ class ParticleSystem(Component):
             self.emit_particles()
 
         self.update_particles()
-        self.render_particles()
+        if System.rendering:
+            self.render_particles()
+
+    @property
+    def particleCount(self) -> int:
+        return self._count
+
+    def reset(self):
+        """Clears the particles and restarts the emission, e.g. when a pooled effect is despawned."""
+        self._count = 0
+        self.time_since_last_emission = 0.0
+        self.emission_accumulator = 0.0
+        self.current_duration_time = 0.0
+        self.has_started = False
+        self.delay_timer = 0.0
+
+    def onDestroy(self):
+        self._releaseColumns()
+        self._capacity = 0
+        self._count = 0
+
+    # Each new system seeds its own generator from this one, so reseeding it makes their emission reproducible
+    _seedSource: np.random.Generator = np.random.default_rng()
+
+    @staticmethod
+    def seed(value: Optional[int]) -> None:
+        """Reseeds the generators of the ParticleSystems created from now on, e.g. at the start of an episode."""
+        ParticleSystem._seedSource = np.random.default_rng(value)
+
+    # Column sets of destroyed or resized systems, per capacity, reused by the next system of that size
+    _columnPools: dict[int, Pool] = {}
+
+    @staticmethod
+    def _columnPool(capacity: int) -> Pool:
+        pool = ParticleSystem._columnPools.get(capacity)
+        if pool is None:
+            def create() -> dict[str, np.ndarray]:
+                columns = {name: np.zeros((capacity,) + shape, dtype=dtype) for name, (shape, dtype) in _PARTICLE_COLUMNS.items()}
+                columns["_instances"] = np.zeros((capacity, SpriteBatch.INSTANCE_FLOATS), dtype=np.float32)
+                columns["_scratch"] = np.zeros((3, capacity), dtype=np.float32)
+                return columns
+            pool = ParticleSystem._columnPools[capacity] = Pool(create, capacity=8, name=f"ParticleSystem columns[{capacity}]")
+        return pool
+
+    def _allocate(self, capacity: int) -> None:
+        """(Re)allocates the particle columns, keeping the particles that still fit."""
+        keep = min(self._count, capacity)
+        columns = ParticleSystem._columnPool(capacity).acquire()
+        if keep:
+            for name in _PARTICLE_COLUMNS:
+                columns[name][:keep] = self._columns[name][:keep]  # type: ignore[index]
+        self._releaseColumns()
+        self._columns = columns
+        for name, column in columns.items():
+            setattr(self, name, column)
+        self._capacity = capacity
+        self._count = keep
+
+    def _releaseColumns(self) -> None:
+        if self._columns is not None:
+            # The instances may still be queued for this frame's flush, and the next owner would overwrite them
+            SpriteBatch.detach(self._columns["_instances"])
+            ParticleSystem._columnPool(self._capacity).release(self._columns)
+            self._columns = None
 
     def emit_particles(self):
-        if len(self.particles) >= self.max_particles:
+        if self.max_particles != self._capacity:
+            self._allocate(self.max_particles)
+        if self._count >= self.max_particles:
             return
 
         self.emission_accumulator += self.emission_rate * System.deltaTime
         num_to_emit = Mathf.floor(self.emission_accumulator)
         self.emission_accumulator -= num_to_emit
 
-        for _ in range(int(num_to_emit)):
-            if len(self.particles) >= self.max_particles:
-                break
-            self._create_single_particle()
+        num_to_emit = min(int(num_to_emit), self.max_particles - self._count)
+        if num_to_emit > 0:
+            self._create_particles(num_to_emit)
 
-    def _create_single_particle(self):
+    def _create_particles(self, amount: int):
+        rng = self._rng
+        new = slice(self._count, self._count + amount)
         start_pos = self.gameObject.transform.position
 
-        lifetime = random.uniform(self.start_lifetime_min, self.start_lifetime_max)
-
-        speed = random.uniform(self.start_speed_min, self.start_speed_max)
-
-        direction_rad = Mathf.rad2deg(self.gameObject.transform.rotation + self.cone_direction)
+        direction_rad = Mathf.deg2rad(self.gameObject.transform.rotation + self.cone_direction)
         if self.shape == "cone":
-            half_angle_rad = Mathf.rad2deg(self.cone_angle / 2.0)
-            random_angle_offset = random.uniform(-half_angle_rad, half_angle_rad)
-            direction_rad += random_angle_offset
+            half_angle_rad = Mathf.deg2rad(self.cone_angle / 2.0)
+            directions = direction_rad + rng.uniform(-half_angle_rad, half_angle_rad, amount)
         elif self.shape == "circle":
-            direction_rad = random.uniform(0, 2 * Mathf.PI)
-
-        velocity = Vector2(Mathf.cos(direction_rad), Mathf.sin(direction_rad)) * speed
-
-        start_size = random.uniform(self.start_size_min, self.start_size_max)
-        end_size = random.uniform(self.end_size_min, self.end_size_max)
-
-        start_color = Color32.lerp(self.start_color_min, self.start_color_max, random.random())
-        end_color = Color32.lerp(self.end_color_min, self.end_color_max, random.random())
-
-        start_rotation = random.uniform(self.start_rotation_min, self.start_rotation_max)
-        angular_velocity = random.uniform(self.angular_velocity_min, self.angular_velocity_max)
-
-
-        new_particle = Particle(start_pos, velocity, lifetime,
-                                start_size, end_size,
-                                start_color, end_color,
-                                start_rotation, angular_velocity)
-        self.particles.append(new_particle)
+            directions = rng.uniform(0, 2 * Mathf.PI, amount)
+        else:
+            directions = np.full(amount, direction_rad)
+        speeds = rng.uniform(self.start_speed_min, self.start_speed_max, amount)
+
+        self._position[new] = (start_pos.x, start_pos.y)
+        self._velocity[new, 0] = np.cos(directions) * speeds
+        self._velocity[new, 1] = np.sin(directions) * speeds
+        self._life[new] = 0.0
+        self._lifetime[new] = rng.uniform(self.start_lifetime_min, self.start_lifetime_max, amount)
+        self._start_size[new] = rng.uniform(self.start_size_min, self.start_size_max, amount)
+        self._end_size[new] = rng.uniform(self.end_size_min, self.end_size_max, amount)
+        ColorArray.lerpInto(ColorArray(self._start_color[new]), self.start_color_min, self.start_color_max, rng.random(amount))
+        ColorArray.lerpInto(ColorArray(self._end_color[new]), self.end_color_min, self.end_color_max, rng.random(amount))
+        self._rotation[new] = rng.uniform(self.start_rotation_min, self.start_rotation_max, amount)
+        self._angular_velocity[new] = rng.uniform(self.angular_velocity_min, self.angular_velocity_max, amount)
+
+        self._count += amount
 
     def update_particles(self):
-        alive_particles = []
-        for particle in self.particles:
-            particle.update()
-            if self.gravity_modifier != 0:
-                particle.velocity.y -= self.gravity_modifier * System.deltaTime
-            if particle.is_alive:
-                alive_particles.append(particle)
-        self.particles = alive_particles
+        count = self._count
+        if count == 0:
+            return
+        delta_time = System.deltaTime
+
+        life = self._life[:count]
+        life += delta_time
+        alive = life < self._lifetime[:count]
+        if not alive.all():
+            count = int(np.count_nonzero(alive))
+            for column in (self._position, self._velocity, self._life, self._lifetime,
+                           self._start_size, self._end_size, self._start_color, self._end_color,
+                           self._rotation, self._angular_velocity):
+                column[:count] = column[:self._count][alive]
+            self._count = count
+
+        self._position[:count] += self._velocity[:count] * delta_time
+        self._rotation[:count] += self._angular_velocity[:count] * delta_time
+        if self.gravity_modifier != 0:
+            self._velocity[:count, 1] -= self.gravity_modifier * delta_time
 
     def render_particles(self):
-        if self.sprite_renderer:
-            opengl.glEnable(opengl.GL_BLEND)
-            opengl.glBlendFunc(opengl.GL_SRC_ALPHA, opengl.GL_ONE_MINUS_SRC_ALPHA)
-
-            for particle in self.particles:
-                pos, rot, scale, color = particle.get_current_state()
-                self.sprite_renderer.draw(pos, rot, scale, color)
-            
-            opengl.glDisable(opengl.GL_BLEND)
\ No newline at end of file
+        count = self._count
+        if not self.sprite_renderer or count == 0:
+            return
+
+        t, size, angle = self._scratch[:, :count]
+        np.divide(self._life[:count], self._lifetime[:count], out=t)
+        np.clip(t, 0.0, 1.0, out=t)
+
+        # size = lerp(start_size, end_size, t)
+        np.subtract(self._end_size[:count], self._start_size[:count], out=size)
+        size *= t
+        size += self._start_size[:count]
+
+        # Rows of translation * rotation * uniform scale, then the lerped color
+        instances = self._instances[:count]
+        texture = self.sprite_renderer.texture
+        instances[:, 7:11] = texture.uv if texture is not None else TextureAtlas.FULL_UV
+        np.radians(self._rotation[:count], out=angle)
+        np.cos(angle, out=instances[:, 0])
+        np.sin(angle, out=instances[:, 3])
+        instances[:, 0] *= size
+        instances[:, 3] *= size
+        np.negative(instances[:, 3], out=instances[:, 1])
+        instances[:, 4] = instances[:, 0]
+        instances[:, 2] = self._position[:count, 0]
+        instances[:, 5] = self._position[:count, 1]
+
+        colors = ColorArray(SpriteBatch.instanceColors(instances))
+        ColorArray.lerpInto(colors, ColorArray(self._start_color[:count]), ColorArray(self._end_color[:count]), t)
+
+        SpriteBatch.submitMany(self.sprite_renderer.sprite, instances, blend=True, page=texture.page if texture is not None else None)
@@ -1,4 +1,15 @@
-import OpenGL.GL as opengl
+import ctypes
+import hashlib
+import os
+import struct
+import threading
+from concurrent.futures import Future
+from typing import Optional
+
+import numpy as np
+
+from .gl import opengl, NullGL
+from .glstate import GLState
 from ..essentials import Console
 
 
@@ -28,6 +39,59 @@ class Shader:
     }
     """
 
+    INSTANCED_VERTEX_SHADER_SOURCE = """
+    #version 330 core
+    layout (location = 0) in vec2 aPos; // Vertex position
+    layout (location = 1) in vec3 aModelRow0; // First row of the 2D affine model matrix
+    layout (location = 2) in vec3 aModelRow1; // Second row of the 2D affine model matrix
+    layout (location = 3) in vec4 aColor; // Per-instance color
+    layout (location = 4) in vec4 aUVRect; // Atlas region (u0, v0, u1, v1) of the sprite's texture
+
+    uniform mat4 projection; // Projection matrix (orthographic)
+
+    out vec4 spriteColor;
+    out vec2 uv;
+
+    void main()
+    {
+        vec3 local = vec3(aPos, 1.0);
+        gl_Position = projection * vec4(dot(aModelRow0, local), dot(aModelRow1, local), 0.0, 1.0);
+        spriteColor = aColor;
+        uv = mix(aUVRect.xy, aUVRect.zw, aPos + 0.5);
+    }
+    """
+    STATIC_VERTEX_SHADER_SOURCE = """
+    #version 330 core
+    layout (location = 0) in vec2 aPos; // World-space position, baked on the CPU
+    layout (location = 1) in vec4 aColor; // Per-vertex color
+    layout (location = 2) in vec2 aUV; // Atlas coordinates
+
+    uniform mat4 projection; // Projection matrix (orthographic)
+
+    out vec4 spriteColor;
+    out vec2 uv;
+
+    void main()
+    {
+        gl_Position = projection * vec4(aPos, 0.0, 1.0);
+        spriteColor = aColor;
+        uv = aUV;
+    }
+    """
+    INSTANCED_FRAGMENT_SHADER_SOURCE = """
+    #version 330 core
+    in vec4 spriteColor;
+    in vec2 uv;
+    out vec4 FragColor;
+
+    uniform sampler2D atlas; // Atlas page of the batch, or a 1x1 white texture for untextured sprites
+
+    void main()
+    {
+        FragColor = spriteColor * texture(atlas, uv);
+    }
+    """
+
     @staticmethod
     def compile_shader(source: str, shader_type: int) -> int: 
         shader = opengl.glCreateShader(shader_type)
@@ -43,19 +107,23 @@ class Shader:
         return shader # type: ignore[arg-type]
 
     @staticmethod
-    def create_program(vertex_shader_source: str, fragment_shader_source: str) -> int:
+    def create_program(vertex_shader_source: str, fragment_shader_source: str, retrievable: bool = False) -> int:
+        """Compiles and links a program. retrievable asks the driver to keep its binary for glGetProgramBinary."""
         vertex_shader = Shader.compile_shader(vertex_shader_source, opengl.GL_VERTEX_SHADER)
         fragment_shader = Shader.compile_shader(fragment_shader_source, opengl.GL_FRAGMENT_SHADER)
 
         program = opengl.glCreateProgram()
         opengl.glAttachShader(program, vertex_shader)
         opengl.glAttachShader(program, fragment_shader)
+        if retrievable:
+            opengl.glProgramParameteri(program, opengl.GL_PROGRAM_BINARY_RETRIEVABLE_HINT, opengl.GL_TRUE)
         opengl.glLinkProgram(program)
 
         if not opengl.glGetProgramiv(program, opengl.GL_LINK_STATUS):
             info_log = opengl.glGetProgramInfoLog(program).decode('utf-8')
             Console.error(f"Error linking shader program:\n{info_log}")
             opengl.glDeleteProgram(program)
+            GLState.forgetProgram(program)
             opengl.glDeleteShader(vertex_shader)
             opengl.glDeleteShader(fragment_shader)
             raise RuntimeError(f"Shader linking failed: {info_log}")
@@ -63,3 +131,177 @@ class Shader:
         opengl.glDeleteShader(vertex_shader)
         opengl.glDeleteShader(fragment_shader)
         return program # type: ignore[arg-type]
+
+
+class ShaderCache:
+    """
+    Linked programs by source, kept in memory for the process and on disk as driver binaries between runs.
+    Entries are keyed by a hash of both sources and the GL vendor/renderer/version, so a driver update or a
+    different GPU misses instead of loading an incompatible binary. Binaries the driver rejects are deleted
+    and the program is compiled from source again.
+    """
+
+    MAGIC: bytes = b"AUSP"
+    VERSION: int = 1
+    _HEADER = struct.Struct("<4sII")  # magic, cache version, binary format
+
+    enabled: bool = True
+    directory: str = os.environ.get("AURORA_SHADER_CACHE") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "AuroraEngine", "shaders")
+
+    # Loads from disk, compiles from source (cache misses) and programs reused from memory
+    hits: int = 0
+    misses: int = 0
+    reused: int = 0
+
+    _programs: dict[str, int] = {}
+    _lock = threading.Lock()
+    _driver: Optional[str] = None
+    _binarySupported: Optional[bool] = None
+
+    @staticmethod
+    def getProgram(vertex_shader_source: str, fragment_shader_source: str) -> int:
+        """Returns a linked program for the sources, from memory, from the disk cache or freshly compiled."""
+        if not ShaderCache.enabled or isinstance(opengl.target, NullGL):
+            return Shader.create_program(vertex_shader_source, fragment_shader_source)
+
+        key = ShaderCache.key(vertex_shader_source, fragment_shader_source)
+        with ShaderCache._lock:
+            program = ShaderCache._programs.get(key)
+        if program is not None:
+            ShaderCache.reused += 1
+            return program
+
+        program = ShaderCache._load(key) if ShaderCache._supportsBinaries() else None
+        if program is None:
+            ShaderCache.misses += 1
+            program = Shader.create_program(vertex_shader_source, fragment_shader_source, retrievable=ShaderCache._supportsBinaries())
+            if ShaderCache._supportsBinaries():
+                ShaderCache._store(key, program)
+        else:
+            ShaderCache.hits += 1
+
+        with ShaderCache._lock:
+            ShaderCache._programs[key] = program
+        return program
+
+    @staticmethod
+    def key(vertex_shader_source: str, fragment_shader_source: str) -> str:
+        digest = hashlib.sha256()
+        for part in (ShaderCache._driverString(), vertex_shader_source, fragment_shader_source):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @staticmethod
+    def precompile(programs: list[tuple[str, str]], context) -> Future:
+        """
+        Builds every (vertex, fragment) source pair on a background thread, e.g. behind a loading screen. context must
+        share objects with the rendering context and provide makeCurrent(), release() and destroy(), as returned by
+        Window.createSharedContext(). The future resolves to the program ids once they are ready on the main context.
+        """
+        future: Future = Future()
+
+        def build() -> None:
+            try:
+                context.makeCurrent()
+                try:
+                    ids = [ShaderCache.getProgram(vertex, fragment) for vertex, fragment in programs]
+                    # Objects made in a shared context are only safe to use elsewhere once their commands completed
+                    opengl.glFinish()
+                finally:
+                    context.release()
+                    context.destroy()
+                future.set_result(ids)
+            except BaseException as error:
+                future.set_exception(error)
+
+        future.set_running_or_notify_cancel()
+        threading.Thread(target=build, name="ShaderCache.precompile", daemon=True).start()
+        return future
+
+    @staticmethod
+    def forget() -> None:
+        """Drops the in-memory programs, e.g. after their context was destroyed. The disk cache is kept."""
+        with ShaderCache._lock:
+            ShaderCache._programs.clear()
+        ShaderCache._driver = None
+        ShaderCache._binarySupported = None
+
+    @staticmethod
+    def clearDisk() -> None:
+        if not os.path.isdir(ShaderCache.directory):
+            return
+        for name in os.listdir(ShaderCache.directory):
+            if name.endswith(".bin"):
+                os.remove(os.path.join(ShaderCache.directory, name))
+
+    @staticmethod
+    def _driverString() -> str:
+        if ShaderCache._driver is None:
+            parts = [opengl.glGetString(name) or b"" for name in (opengl.GL_VENDOR, opengl.GL_RENDERER, opengl.GL_VERSION)]
+            ShaderCache._driver = "|".join(part.decode("utf-8", "replace") for part in parts)
+        return ShaderCache._driver
+
+    @staticmethod
+    def _supportsBinaries() -> bool:
+        if ShaderCache._binarySupported is None:
+            try:
+                ShaderCache._binarySupported = bool(opengl.glGetIntegerv(opengl.GL_NUM_PROGRAM_BINARY_FORMATS))
+            except Exception:
+                ShaderCache._binarySupported = False
+        return ShaderCache._binarySupported
+
+    @staticmethod
+    def _path(key: str) -> str:
+        return os.path.join(ShaderCache.directory, key + ".bin")
+
+    @staticmethod
+    def _load(key: str) -> Optional[int]:
+        path = ShaderCache._path(key)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        header = ShaderCache._HEADER
+        if len(data) > header.size:
+            magic, version, binary_format = header.unpack_from(data)
+            if magic == ShaderCache.MAGIC and version == ShaderCache.VERSION:
+                binary = np.frombuffer(data, dtype=np.uint8, offset=header.size)
+                program = opengl.glCreateProgram()
+                opengl.glProgramBinary(program, binary_format, binary, len(binary))
+                if opengl.glGetProgramiv(program, opengl.GL_LINK_STATUS):
+                    return program
+                opengl.glDeleteProgram(program)
+                GLState.forgetProgram(program)
+
+        Console.warn(f"ShaderCache: discarding unusable cached program {key[:12]}")
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+    @staticmethod
+    def _store(key: str, program: int) -> None:
+        length = opengl.glGetProgramiv(program, opengl.GL_PROGRAM_BINARY_LENGTH)
+        if not length:
+            return
+        binary = np.empty(length, dtype=np.uint8)
+        written = opengl.GLsizei()
+        binary_format = opengl.GLenum()
+        opengl.glGetProgramBinary(program, length, ctypes.byref(written), ctypes.byref(binary_format), binary)
+
+        path = ShaderCache._path(key)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(ShaderCache.directory, exist_ok=True)
+            with open(temporary, "wb") as file:
+                file.write(ShaderCache._HEADER.pack(ShaderCache.MAGIC, ShaderCache.VERSION, binary_format.value))
+                file.write(binary[:written.value].tobytes())
+            # Atomic, so a concurrent reader never sees half a file
+            os.replace(temporary, path)
+        except OSError as error:
+            Console.warn(f"ShaderCache: could not write {path}: {error}")
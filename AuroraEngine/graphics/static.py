@@ -0,0 +1,172 @@
+import ctypes
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .gl import opengl
+from .glstate import GLState
+from ..essentials import GameObject, Renderer
+from .shaders import Shader, ShaderCache
+from .batch import SpriteBatch
+from .camera import Camera
+from .textures import TextureAtlas, AtlasPage
+
+
+def _triangulate(primitive: int, vertices: tuple[float, ...]) -> np.ndarray:
+    """Local-space triangle list (T * 3, 2) for one of SpriteBatch.SHAPES."""
+    points = np.array(vertices, dtype=np.float32).reshape(-1, 2)
+    if primitive == opengl.GL_TRIANGLE_FAN:
+        indices = [index for corner in range(1, len(points) - 1) for index in (0, corner, corner + 1)]
+        return points[indices]
+    return points
+
+
+class StaticBatch:
+    """
+    World-space triangles of every Renderer on a scene's static GameObjects, in one immutable vertex buffer drawn
+    with a single call. Scene marks it dirty when a static object changes its renderers or goes away; draw also
+    rebakes when the version of a static object's Transform or TextureAtlas.generation moved on since the last bake.
+    """
+
+    # Per-vertex layout: world position (2 floats), color (4 bytes packed in one float slot, see Color32), atlas UV (2 floats)
+    VERTEX_FLOATS: int = 5
+
+    _program_id: int = 0
+    _projection_loc: int = -1
+    _atlas_loc: int = -1
+    _triangles: dict[str, np.ndarray] = {}
+
+    def __init__(self):
+        self.dirty: bool = True
+        self.vertexCount: int = 0
+        self.rendererCount: int = 0
+        self.bakeCount: int = 0
+        self._versions: list[int] = []  # Transform.version of each baked GameObject, in bake order
+        self._atlasGeneration: int = -1  # TextureAtlas.generation the UVs were baked from
+        self._ranges: list[tuple[Optional[AtlasPage], int, int]] = []  # (atlas page, first vertex, vertex count), one draw each
+        self._vao_id: int = 0
+        self._vbo_id: int = 0
+
+    @classmethod
+    def _initializeProgram(cls) -> None:
+        if cls._program_id:
+            return
+        cls._program_id = ShaderCache.getProgram(Shader.STATIC_VERTEX_SHADER_SOURCE, Shader.INSTANCED_FRAGMENT_SHADER_SOURCE)
+        cls._projection_loc = opengl.glGetUniformLocation(cls._program_id, "projection")
+        cls._atlas_loc = opengl.glGetUniformLocation(cls._program_id, "atlas")
+        cls._triangles = {name: _triangulate(primitive, vertices) for name, (primitive, vertices) in SpriteBatch.SHAPES.items()}
+
+    def markDirty(self) -> None:
+        self.dirty = True
+
+    def bake(self, gameObjects: Iterable[GameObject]) -> None:
+        """Rebuilds the vertex buffer from the renderers of gameObjects."""
+        StaticBatch._initializeProgram()
+        self._versions = [gameObject.transform.version for gameObject in gameObjects]
+        self._atlasGeneration = TextureAtlas.generation
+        # (shape, atlas page) -> (affine rows, colors, UV rects) of its renderers
+        shapes: dict[tuple[str, Optional[AtlasPage]], tuple[list, list, list]] = {}
+        for gameObject in gameObjects:
+            renderers = gameObject._componentIndex.get(Renderer)
+            if not renderers:
+                continue
+            affine = gameObject.transform.getAffine()
+            for renderer in renderers:
+                sprite = getattr(renderer, "sprite", None)
+                color = getattr(renderer, "color", None)
+                if sprite not in StaticBatch._triangles or color is None:
+                    continue
+                texture = getattr(renderer, "texture", None)
+                group = shapes.setdefault((sprite, texture.page if texture is not None else None), ([], [], []))
+                group[0].append(affine)
+                group[1].append(color.rgba)
+                group[2].append(texture.uv if texture is not None else TextureAtlas.FULL_UV)
+
+        chunks = []
+        ranges = []
+        renderer_count = 0
+        first = 0
+        # Sorted by page so each page is one contiguous range
+        for (sprite, page), (affines, colors, uvs) in sorted(shapes.items(), key=lambda item: -1 if item[0][1] is None else item[0][1].index):
+            local = StaticBatch._triangles[sprite]
+            rows = np.array(affines, dtype=np.float32)  # (N, 6): a, b, tx, c, d, ty
+            vertices = np.empty((len(rows), len(local), StaticBatch.VERTEX_FLOATS), dtype=np.float32)
+            vertices[:, :, 0] = rows[:, 0:1] * local[:, 0] + rows[:, 1:2] * local[:, 1] + rows[:, 2:3]
+            vertices[:, :, 1] = rows[:, 3:4] * local[:, 0] + rows[:, 4:5] * local[:, 1] + rows[:, 5:6]
+            vertices.view(np.uint32)[:, :, 2] = np.array(colors, dtype=np.uint32)[:, None]
+            rects = np.array(uvs, dtype=np.float32)  # (N, 4): u0, v0, u1, v1
+            corner = local + 0.5
+            vertices[:, :, 3] = rects[:, 0:1] + (rects[:, 2:3] - rects[:, 0:1]) * corner[:, 0]
+            vertices[:, :, 4] = rects[:, 1:2] + (rects[:, 3:4] - rects[:, 1:2]) * corner[:, 1]
+            chunks.append(vertices.reshape(-1, StaticBatch.VERTEX_FLOATS))
+            count = len(rows) * len(local)
+            if ranges and ranges[-1][0] is page:
+                ranges[-1] = (page, ranges[-1][1], ranges[-1][2] + count)
+            else:
+                ranges.append((page, first, count))
+            first += count
+            renderer_count += len(rows)
+
+        self.release()
+        self._ranges = ranges
+        self.vertexCount = first
+        self.rendererCount = renderer_count
+        self.dirty = False
+        self.bakeCount += 1
+        if not self.vertexCount:
+            return
+
+        data = np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+        self._vao_id = opengl.glGenVertexArrays(1)
+        GLState.bindVertexArray(self._vao_id)
+        self._vbo_id = opengl.glGenBuffers(1)
+        GLState.bindBuffer(opengl.GL_ARRAY_BUFFER, self._vbo_id)
+        if bool(opengl.glBufferStorage):
+            # Immutable storage: rebaking allocates a new buffer instead of respecifying this one
+            opengl.glBufferStorage(opengl.GL_ARRAY_BUFFER, data.nbytes, data, 0)
+        else:
+            opengl.glBufferData(opengl.GL_ARRAY_BUFFER, data.nbytes, data, opengl.GL_STATIC_DRAW)
+
+        stride = StaticBatch.VERTEX_FLOATS * 4
+        opengl.glVertexAttribPointer(0, 2, opengl.GL_FLOAT, opengl.GL_FALSE, stride, None)
+        opengl.glEnableVertexAttribArray(0)
+        opengl.glVertexAttribPointer(1, 4, opengl.GL_UNSIGNED_BYTE, opengl.GL_TRUE, stride, ctypes.c_void_p(2 * 4))
+        opengl.glEnableVertexAttribArray(1)
+        opengl.glVertexAttribPointer(2, 2, opengl.GL_FLOAT, opengl.GL_FALSE, stride, ctypes.c_void_p(3 * 4))
+        opengl.glEnableVertexAttribArray(2)
+
+    def draw(self, gameObjects: Iterable[GameObject]) -> None:
+        """Rebakes if needed, then draws all static geometry with the main camera's projection."""
+        camera = getattr(Camera, "MainCamera", None)
+        if camera is None:
+            return
+        stale = self.dirty or self._atlasGeneration != TextureAtlas.generation
+        if stale or [gameObject.transform.version for gameObject in gameObjects] != self._versions:
+            self.bake(gameObjects)
+        if not self.vertexCount:
+            return
+
+        TextureAtlas.upload()
+        GLState.useProgram(StaticBatch._program_id)
+        opengl.glUniformMatrix4fv(StaticBatch._projection_loc, 1, opengl.GL_TRUE, camera.getProjectionMatrix())
+        opengl.glUniform1i(StaticBatch._atlas_loc, 0)
+        GLState.bindVertexArray(self._vao_id)
+        for page, first, count in self._ranges:
+            # Textured sprites carry transparent edges; untextured ones keep the opaque path
+            GLState.setBlend(page is not None)
+            GLState.bindTexture(opengl.GL_TEXTURE_2D, page.texture if page is not None else TextureAtlas.whiteTexture())
+            opengl.glDrawArrays(opengl.GL_TRIANGLES, first, count)
+        GLState.useFixedFunction()
+
+    def release(self) -> None:
+        """Deletes the GL buffers; the next draw bakes again."""
+        if self._vbo_id:
+            opengl.glDeleteBuffers(1, [self._vbo_id])
+            GLState.forgetBuffer(self._vbo_id)
+            self._vbo_id = 0
+        if self._vao_id:
+            opengl.glDeleteVertexArrays(1, [self._vao_id])
+            GLState.forgetVertexArray(self._vao_id)
+            self._vao_id = 0
+        self._ranges = []
+        self.dirty = True
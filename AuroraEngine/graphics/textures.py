@@ -0,0 +1,351 @@
+from typing import Optional
+
+import numpy as np
+
+from .gl import opengl
+from .glstate import GLState
+from ..essentials import Console
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is only needed to decode image files; raw pixel arrays work without it
+    Image = None
+
+
+class SkylinePacker:
+    """
+    Bottom-left skyline bin packer. The skyline is the top edge of everything placed so far, as (x, y, width)
+    segments; a rectangle goes where it rests lowest. The bin can grow, and existing placements stay valid.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.skyline: list[list[int]] = [[0, 0, width]]
+
+    def grow(self, width: int, height: int) -> None:
+        if width > self.width:
+            self.skyline.append([self.width, 0, width - self.width])
+            self.width = width
+        self.height = max(self.height, height)
+
+    def insert(self, width: int, height: int) -> Optional[tuple[int, int]]:
+        """Places a width x height rectangle and returns its bottom-left corner, or None if it does not fit."""
+        best = None  # (top, waste-free x, index, y)
+        skyline = self.skyline
+        for index in range(len(skyline)):
+            x = skyline[index][0]
+            if x + width > self.width:
+                break
+            # The rectangle rests on the highest segment it spans
+            y, remaining, span = 0, width, index
+            while remaining > 0:
+                y = max(y, skyline[span][1])
+                remaining -= skyline[span][2]
+                span += 1
+            if y + height > self.height:
+                continue
+            if best is None or (y + height, x) < (best[0], best[1]):
+                best = (y + height, x, index, y)
+        if best is None:
+            return None
+
+        _, x, index, y = best
+        self._place(index, x, y + height, width)
+        return (x, y)
+
+    def _place(self, index: int, x: int, top: int, width: int) -> None:
+        skyline = self.skyline
+        skyline.insert(index, [x, top, width])
+        # Trim or drop the segments now covered by the new one
+        right = x + width
+        next_index = index + 1
+        while next_index < len(skyline) and skyline[next_index][0] < right:
+            segment = skyline[next_index]
+            overlap = right - segment[0]
+            if overlap >= segment[2]:
+                del skyline[next_index]
+            else:
+                segment[0] += overlap
+                segment[2] -= overlap
+                break
+        # Merge neighbours of equal height
+        merged = [skyline[0]]
+        for segment in skyline[1:]:
+            if segment[1] == merged[-1][1]:
+                merged[-1][2] += segment[2]
+            else:
+                merged.append(segment)
+        self.skyline = merged
+
+
+class AtlasPage:
+    """
+    One atlas texture: RGBA pixels on the CPU, uploaded to GL when they changed. Space of removed regions is kept in
+    a free list and reused before the skyline grows.
+    """
+
+    def __init__(self, index: int, size: int):
+        self.index = index
+        self.packer = SkylinePacker(size, size)
+        self.pixels = np.zeros((size, size, 4), dtype=np.uint8)
+        self.texture: int = 0
+        self.dirty = True
+        self._uploadedSize = 0
+        self.regionCount: int = 0
+        self.free: list[tuple[int, int, int, int]] = []  # (x, y, width, height) of removed regions, padding included
+
+    def takeFree(self, width: int, height: int) -> Optional[tuple[int, int]]:
+        """Places a rectangle in the smallest free rectangle it fits, splitting off the rest. None if none fits."""
+        best = None
+        for index, (_, _, free_width, free_height) in enumerate(self.free):
+            if free_width >= width and free_height >= height and (best is None or free_width * free_height < best[1]):
+                best = (index, free_width * free_height)
+        if best is None:
+            return None
+        x, y, free_width, free_height = self.free.pop(best[0])
+        # Guillotine split: the strip right of the rectangle and the strip above it
+        if free_width > width:
+            self.free.append((x + width, y, free_width - width, free_height))
+        if free_height > height:
+            self.free.append((x, y + height, width, free_height - height))
+        return (x, y)
+
+    @property
+    def size(self) -> int:
+        return self.packer.width
+
+    def grow(self, size: int) -> None:
+        pixels = np.zeros((size, size, 4), dtype=np.uint8)
+        old = self.pixels.shape[0]
+        pixels[:old, :old] = self.pixels
+        self.pixels = pixels
+        self.packer.grow(size, size)
+        self.dirty = True
+
+    def upload(self, mipmaps: bool) -> None:
+        size = self.size
+        if not self.texture:
+            self.texture = opengl.glGenTextures(1)
+        GLState.bindTexture(opengl.GL_TEXTURE_2D, self.texture)
+        if self._uploadedSize != size:
+            opengl.glTexImage2D(opengl.GL_TEXTURE_2D, 0, opengl.GL_RGBA8, size, size, 0, opengl.GL_RGBA, opengl.GL_UNSIGNED_BYTE, self.pixels)
+            opengl.glTexParameteri(opengl.GL_TEXTURE_2D, opengl.GL_TEXTURE_MIN_FILTER,
+                                   opengl.GL_LINEAR_MIPMAP_LINEAR if mipmaps else opengl.GL_LINEAR)
+            opengl.glTexParameteri(opengl.GL_TEXTURE_2D, opengl.GL_TEXTURE_MAG_FILTER, opengl.GL_LINEAR)
+            opengl.glTexParameteri(opengl.GL_TEXTURE_2D, opengl.GL_TEXTURE_WRAP_S, opengl.GL_CLAMP_TO_EDGE)
+            opengl.glTexParameteri(opengl.GL_TEXTURE_2D, opengl.GL_TEXTURE_WRAP_T, opengl.GL_CLAMP_TO_EDGE)
+            self._uploadedSize = size
+        else:
+            opengl.glTexSubImage2D(opengl.GL_TEXTURE_2D, 0, 0, 0, size, size, opengl.GL_RGBA, opengl.GL_UNSIGNED_BYTE, self.pixels)
+        if mipmaps:
+            opengl.glGenerateMipmap(opengl.GL_TEXTURE_2D)
+        self.dirty = False
+
+    def release(self) -> None:
+        if self.texture:
+            opengl.glDeleteTextures(1, [self.texture])
+            GLState.forgetTexture(self.texture)
+            self.texture = 0
+        self._uploadedSize = 0
+        self.dirty = True
+
+
+class AtlasRegion:
+    """Where an image ended up: its atlas page and its UV rectangle (u0, v0, u1, v1), bottom-left to top-right."""
+    __slots__ = ("name", "page", "x", "y", "width", "height", "uv")
+
+    def __init__(self, name: str, page: AtlasPage, x: int, y: int, width: int, height: int):
+        self.name = name
+        self.page = page
+        self.x, self.y = x, y
+        self.width, self.height = width, height
+        self.uv: tuple[float, float, float, float] = TextureAtlas.FULL_UV
+        self._rescale()
+
+    def _rescale(self) -> None:
+        size = self.page.size
+        self.uv = (self.x / size, self.y / size, (self.x + self.width) / size, (self.y + self.height) / size)
+
+    def __repr__(self) -> str:
+        return f"AtlasRegion({self.name!r}, page={self.page.index}, {self.width}x{self.height} at {self.x},{self.y})"
+
+
+class TextureAtlas:
+    """
+    Packs every loaded image into shared atlas pages, so sprites using different images of one page still batch into
+    a single draw. Pages start small and double up to maxSize before a new page is opened.
+    """
+
+    maxSize: int = 2048  # Largest page edge, further limited by GL_MAX_TEXTURE_SIZE
+    initialSize: int = 256
+    padding: int = 2  # Edge pixels repeated around each image, so filtering and mipmaps do not bleed neighbours in
+    mipmaps: bool = True
+
+    FULL_UV: tuple[float, float, float, float] = (0.0, 0.0, 1.0, 1.0)
+
+    # Goes up whenever the UVs of live regions change or atlas space is freed or reused, so geometry baked from
+    # older UVs (StaticBatch) can tell
+    generation: int = 0
+
+    _pages: list[AtlasPage] = []
+    _nextPageIndex: int = 0  # Page indices stay unique when empty pages are dropped
+    _regions: dict[str, AtlasRegion] = {}
+    _white_texture: int = 0
+    _gl_max_size: int = 0  # GL_MAX_TEXTURE_SIZE, known once a page was uploaded
+
+    @staticmethod
+    def load(path: str, name: Optional[str] = None) -> AtlasRegion:
+        """
+        Decodes an image file (needs Pillow) and packs it. Loading the same name twice returns the first region.
+        This blocks; Assets.load decodes on a worker thread instead.
+        """
+        name = name or path
+        region = TextureAtlas._regions.get(name)
+        if region is not None:
+            return region
+        return TextureAtlas.add(name, TextureAtlas.decode(path))
+
+    @staticmethod
+    def decode(path: str) -> np.ndarray:
+        """An image file as an (height, width, 4) uint8 RGBA array. Touches no GL state, so any thread may call it."""
+        if Image is None:
+            raise RuntimeError("Loading image files needs Pillow (pip install pillow); use TextureAtlas.add with a pixel array instead.")
+        with Image.open(path) as image:
+            return np.asarray(image.convert("RGBA"))
+
+    @staticmethod
+    def add(name: str, pixels: np.ndarray) -> AtlasRegion:
+        """Packs an (height, width, 4) uint8 RGBA image, top row first, under name."""
+        region = TextureAtlas._regions.get(name)
+        if region is not None:
+            return region
+
+        pixels = np.asarray(pixels, dtype=np.uint8)
+        if pixels.ndim != 3 or pixels.shape[2] != 4:
+            raise ValueError(f"Expected an (height, width, 4) RGBA array for texture {name}, got shape {pixels.shape}")
+        height, width = pixels.shape[:2]
+        pad = TextureAtlas.padding
+        limit = TextureAtlas._limit()
+        if width + 2 * pad > limit or height + 2 * pad > limit:
+            raise RuntimeError(f"Texture {name} ({width}x{height}) does not fit in an atlas page of {limit}x{limit}")
+
+        page, x, y = TextureAtlas._allocate(width + 2 * pad, height + 2 * pad, limit)
+        # GL rows go bottom-up; edge-extrude the padding
+        padded = np.pad(pixels[::-1], ((pad, pad), (pad, pad), (0, 0)), mode="edge")
+        page.pixels[y:y + height + 2 * pad, x:x + width + 2 * pad] = padded
+        page.dirty = True
+
+        region = AtlasRegion(name, page, x + pad, y + pad, width, height)
+        TextureAtlas._regions[name] = region
+        page.regionCount += 1
+        return region
+
+    @staticmethod
+    def get(name: str) -> Optional[AtlasRegion]:
+        region = TextureAtlas._regions.get(name)
+        if region is None:
+            Console.warn(f"No texture with name {name} loaded.")
+        return region
+
+    @staticmethod
+    def remove(name: str) -> None:
+        """
+        Forgets a region, so its name can be added again. Its space goes to the page's free list for later images; a
+        page left without regions is dropped and its GL texture freed.
+        """
+        region = TextureAtlas._regions.pop(name, None)
+        if region is None:
+            return
+        page = region.page
+        page.regionCount -= 1
+        TextureAtlas.generation += 1
+        if page.regionCount == 0:
+            page.release()
+            TextureAtlas._pages.remove(page)
+            return
+        pad = TextureAtlas.padding
+        page.free.append((region.x - pad, region.y - pad, region.width + 2 * pad, region.height + 2 * pad))
+
+    @staticmethod
+    def getPages() -> list[AtlasPage]:
+        return list(TextureAtlas._pages)
+
+    @staticmethod
+    def upload() -> None:
+        """Uploads pages changed since the last call. SpriteBatch calls this before drawing."""
+        if not TextureAtlas._gl_max_size:
+            TextureAtlas._gl_max_size = int(opengl.glGetIntegerv(opengl.GL_MAX_TEXTURE_SIZE))
+        for page in TextureAtlas._pages:
+            if page.dirty:
+                page.upload(TextureAtlas.mipmaps)
+
+    @staticmethod
+    def whiteTexture() -> int:
+        """A 1x1 white texture, bound for untextured sprites so one shader serves both."""
+        if not TextureAtlas._white_texture:
+            TextureAtlas._white_texture = opengl.glGenTextures(1)
+            GLState.bindTexture(opengl.GL_TEXTURE_2D, TextureAtlas._white_texture)
+            opengl.glTexImage2D(opengl.GL_TEXTURE_2D, 0, opengl.GL_RGBA8, 1, 1, 0, opengl.GL_RGBA, opengl.GL_UNSIGNED_BYTE,
+                                np.full(4, 255, dtype=np.uint8))
+            opengl.glTexParameteri(opengl.GL_TEXTURE_2D, opengl.GL_TEXTURE_MIN_FILTER, opengl.GL_NEAREST)
+            opengl.glTexParameteri(opengl.GL_TEXTURE_2D, opengl.GL_TEXTURE_MAG_FILTER, opengl.GL_NEAREST)
+        return TextureAtlas._white_texture
+
+    @staticmethod
+    def release() -> None:
+        """Frees the GL textures. Pages stay on the CPU and are uploaded again when next drawn."""
+        for page in TextureAtlas._pages:
+            page.release()
+        if TextureAtlas._white_texture:
+            opengl.glDeleteTextures(1, [TextureAtlas._white_texture])
+            GLState.forgetTexture(TextureAtlas._white_texture)
+            TextureAtlas._white_texture = 0
+
+    @staticmethod
+    def clear() -> None:
+        TextureAtlas.release()
+        TextureAtlas._pages.clear()
+        TextureAtlas._regions.clear()
+        TextureAtlas._nextPageIndex = 0
+        TextureAtlas.generation += 1
+
+    @staticmethod
+    def _limit() -> int:
+        # Images may be added before any context exists, so the GL limit is only applied once it is known
+        if TextureAtlas._gl_max_size:
+            return min(TextureAtlas.maxSize, TextureAtlas._gl_max_size)
+        return TextureAtlas.maxSize
+
+    @staticmethod
+    def _allocate(width: int, height: int, limit: int) -> tuple[AtlasPage, int, int]:
+        for page in TextureAtlas._pages:
+            position = page.takeFree(width, height)
+            if position is not None:
+                TextureAtlas.generation += 1
+                return page, position[0], position[1]
+        for page in TextureAtlas._pages:
+            while True:
+                position = page.packer.insert(width, height)
+                if position is not None:
+                    return page, position[0], position[1]
+                if page.size >= limit:
+                    break
+                TextureAtlas._growPage(page, min(page.size * 2, limit))
+
+        size = TextureAtlas.initialSize
+        while size < width or size < height:
+            size *= 2
+        page = AtlasPage(TextureAtlas._nextPageIndex, min(size, limit))
+        TextureAtlas._nextPageIndex += 1
+        TextureAtlas._pages.append(page)
+        x, y = page.packer.insert(width, height)
+        return page, x, y
+
+    @staticmethod
+    def _growPage(page: AtlasPage, size: int) -> None:
+        page.grow(size)
+        for region in TextureAtlas._regions.values():
+            if region.page is page:
+                region._rescale()
+        TextureAtlas.generation += 1
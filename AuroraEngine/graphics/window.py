@@ -1,26 +1,30 @@
-import glfw
-import OpenGL.GL as opengl
+from typing import Optional
+from .gl import opengl
 from ..input import Input
 from ..essentials import Vector2, System, EngineSettings, Console
 from .camera import Camera
+from .batch import SpriteBatch
+from .glstate import GLState
+from .backends import Backend, GLFWBackend, SharedContext, createBackend
+from ..profiler import Profiler
+from ..assets import Assets
 
 class Window:
-    def __init__(self, dimensions: tuple, title: str = "AuroraEngine Window", _GLFW_Monitor = None, _GLFW_Share = None):
-        if not glfw.init():
-            raise Exception("GLFW cannot be initialized")
-        
-        self.dimensions = dimensions
-        self.window = glfw.create_window(self.dimensions[0], self.dimensions[1], title, _GLFW_Monitor, _GLFW_Share)
-        self.camera = Camera(glfw.get_framebuffer_size(window=self.window))
+    def __init__(self, dimensions: tuple, title: str = "AuroraEngine Window", _GLFW_Monitor = None, _GLFW_Share = None, backend: Optional[str] = None):
+        """backend is "glfw", "offscreen" or "null"; when omitted the AURORA_BACKEND environment variable decides, defaulting to glfw."""
+        self.backend: Backend = createBackend(backend, dimensions, title, monitor=_GLFW_Monitor, share=_GLFW_Share)
+        GLState.reset()
+        self.window = self.backend.handle
+
+        self.dimensions = self.backend.getFramebufferSize()
+        self.camera = Camera(self.dimensions)
         Camera.MainCamera = self.camera
 
-        if not self.window:
-            glfw.terminate()
-            raise Exception("GLFW window cannot be created")
-        
-        glfw.make_context_current(self.window)
-        glfw.set_framebuffer_size_callback(self.window, self.framebufferSizeCallback)
-        Input.setWindow(self.window)
+        self.backend.setResizeCallback(lambda width, height: self.framebufferSizeCallback(self.window, width, height))
+        if isinstance(self.backend, GLFWBackend):
+            Input.setWindow(self.window)
+        else:
+            GLState.viewport(0, 0, *self.dimensions)
 
     
     @staticmethod
@@ -29,7 +33,6 @@ class Window:
 
     @staticmethod
     def clear() -> None:
-        glfw.poll_events()
         opengl.glClear(opengl.GL_COLOR_BUFFER_BIT)
 
     @staticmethod
@@ -37,22 +40,29 @@ class Window:
         opengl.glLoadIdentity()
 
     def mainloop(self) -> bool:
+        if Profiler.enabled:
+            Profiler.beginFrame()
+            Profiler.beginPhase("input")
+        self.backend.pollEvents()
         Input.update()
-        return not glfw.window_should_close(self.window)
+        if Profiler.enabled:
+            Profiler.beginPhase("assets")
+        Assets.processUploads()
+        return not self.backend.shouldClose()
         
 
     def framebufferSizeCallback(self, window, width, height) -> None:
-        opengl.glViewport(0, 0, width, height)
+        GLState.viewport(0, 0, width, height)
         self.camera.update_screen_size(width, height)
         self.camera.applyProjection()
 
-        self.dimensions = glfw.get_framebuffer_size(self.window)
+        self.dimensions = self.backend.getFramebufferSize()
 
     def setAspectRatio(self, ratio: tuple) -> None:
-        glfw.set_window_aspect_ratio(self.window, *ratio)
+        self.backend.setAspectRatio(ratio)
 
     def disableVSync(self) -> None:
-        glfw.swap_interval(0)
+        self.backend.setSwapInterval(0)
 
     def screenToWorldPos(self,x, y) -> Vector2:
         width, height = self.dimensions
@@ -64,25 +74,34 @@ class Window:
         self.camera.applyProjection()
         Window.clear()
         self.loadIdentity()
+        if Profiler.enabled:
+            Profiler.beginPhase("update")
 
     
 
     def renderScreen(self) -> None:
         """Refreshes the screen and performs important post frame calculations. Last function you should call in the mainloop."""
-        glfw.swap_buffers(self.window)
-        System.deltaTime = System.time() - System.lastFrameTimestamp
-        if System.deltaTime > EngineSettings.deltaTimeMaxOverhead:
-            if EngineSettings.deltaTimeOverheadWarning:
-                Console.warn("Deltatime overhead exceeded set limit, ignore during startup.\n" +
-                "Change EngineSettings.deltaTimeOverheadWarning to disable this warning.")
-            System.deltaTime = 0
-        System.lastFrameTimestamp = System.time()
-        if EngineSettings.fps_limit and not EngineSettings.fps_limit == 0:
-            System.wait(1 / EngineSettings.fps_limit)
-
-    
-    
-
-
-
- 
\ No newline at end of file
+        profiling = Profiler.enabled
+        if profiling:
+            Profiler.beginPhase("render")
+        SpriteBatch.flush()
+        if profiling:
+            Profiler.beginPhase("swap")
+        self.backend.swapBuffers()
+        if profiling:
+            Profiler.beginPhase("wait")
+        GLState.endFrame()
+        System.endFrame()
+        if profiling:
+            Profiler.endFrame()
+
+    def readPixels(self):
+        """The framebuffer as a (height, width, 4) uint8 array, bottom row first. Handy on the offscreen backend."""
+        return self.backend.readPixels()
+
+    def createSharedContext(self) -> SharedContext:
+        """A context sharing this window's GL objects, for background loading such as ShaderCache.precompile."""
+        return self.backend.createSharedContext()
+
+    def close(self) -> None:
+        self.backend.terminate()
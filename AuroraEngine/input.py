@@ -1,50 +1,188 @@
 import glfw
 from .essentials import *
 
+
+class InputState:
+    """One frame of input: what is held, and what went down or up since the previous frame."""
+    __slots__ = ("keys", "pressed", "released", "buttons", "buttonsPressed", "buttonsReleased", "mousePos")
+
+    def __init__(self, keys: frozenset = frozenset(), pressed: frozenset = frozenset(), released: frozenset = frozenset(),
+                 buttons: frozenset = frozenset(), buttonsPressed: frozenset = frozenset(), buttonsReleased: frozenset = frozenset(),
+                 mousePos: Optional[Vector2] = None):
+        self.keys = keys
+        self.pressed = pressed
+        self.released = released
+        self.buttons = buttons
+        self.buttonsPressed = buttonsPressed
+        self.buttonsReleased = buttonsReleased
+        self.mousePos = mousePos if mousePos is not None else Vector2(0, 0)
+
+
 class Input:
     _window = None
-    _previous_keys = {}
+
+    # Live state, written by the GLFW callbacks (or inject*) between two Input.update calls
+    _heldKeys: set[int] = set()
+    _pressedKeys: set[int] = set()
+    _releasedKeys: set[int] = set()
+    _heldButtons: set[int] = set()
+    _pressedButtons: set[int] = set()
+    _releasedButtons: set[int] = set()
+    _cursor: tuple[float, float] = (0.0, 0.0)
+
+    # Snapshots of the current and the previous frame; every query reads _current
+    _current: InputState = InputState()
+    _previous: InputState = InputState()
+
+    _actions: dict[str, tuple[int, ...]] = {}
+    _axes: dict[str, tuple[tuple[int, ...], tuple[int, ...]]] = {
+        "horizontal": ((glfw.KEY_D, glfw.KEY_RIGHT), (glfw.KEY_A, glfw.KEY_LEFT)),
+        "vertical": ((glfw.KEY_W, glfw.KEY_UP), (glfw.KEY_S, glfw.KEY_DOWN)),
+    }
+
     Keys: dict = {'UNKNOWN': -1, 'SPACE': 32, 'APOSTROPHE': 39, 'COMMA': 44, 'MINUS': 45, 'PERIOD': 46, 'SLASH': 47, '0': 48, '1': 49, '2': 50, '3': 51, '4': 52, '5': 53, '6': 54, '7': 55, '8': 56, '9': 57, 'SEMICOLON': 59, 'EQUAL': 61, 'A': 65, 'B': 66, 'C': 67, 'D': 68, 'E': 69, 'F': 70, 'G': 71, 'H': 72, 'I': 73, 'J': 74, 'K': 75, 'L': 76, 'M': 77, 'N': 78, 'O': 79, 'P': 80, 'Q': 81, 'R': 82, 'S': 83, 'T': 84, 'U': 85, 'V': 86, 'W': 87, 'X': 88, 'Y': 89, 'Z': 90, 'LEFT_BRACKET': 91, 'BACKSLASH': 92, 'RIGHT_BRACKET': 93, 'GRAVE_ACCENT': 96, 'WORLD_1': 161, 'WORLD_2': 162, 'ESCAPE': 256, 'ENTER': 257, 'TAB': 258, 'BACKSPACE': 259, 'INSERT': 260, 'DELETE': 261, 'RIGHT': 262, 'LEFT': 263, 'DOWN': 264, 'UP': 265, 'PAGE_UP': 266, 'PAGE_DOWN': 267, 'HOME': 268, 'END': 269, 'CAPS_LOCK': 280, 'SCROLL_LOCK': 281, 'NUM_LOCK': 282, 'PRINT_SCREEN': 283, 'PAUSE': 284, 'F1': 290, 'F2': 291, 'F3': 292, 'F4': 293, 'F5': 294, 'F6': 295, 'F7': 296, 'F8': 297, 'F9': 298, 'F10': 299, 'F11': 300, 'F12': 301, 'F13': 302, 'F14': 303, 'F15': 304, 'F16': 305, 'F17': 306, 'F18': 307, 'F19': 308, 'F20': 309, 'F21': 310, 'F22': 311, 'F23': 312, 'F24': 313, 'F25': 314, 'KP_0': 320, 'KP_1': 321, 'KP_2': 322, 'KP_3': 323, 'KP_4': 324, 'KP_5': 325, 'KP_6': 326, 'KP_7': 327, 'KP_8': 328, 'KP_9': 329, 'KP_DECIMAL': 330, 'KP_DIVIDE': 331, 'KP_MULTIPLY': 332, 'KP_SUBTRACT': 333, 'KP_ADD': 334, 'KP_ENTER': 335, 'KP_EQUAL': 336, 'LEFT_SHIFT': 340, 'LEFT_CONTROL': 341, 'LEFT_ALT': 342, 'LEFT_SUPER': 343, 'RIGHT_SHIFT': 344, 'RIGHT_CONTROL': 345, 'RIGHT_ALT': 346, 'RIGHT_SUPER': 347, 'MENU': 348}
     @staticmethod
     def setWindow(window):
         Input._window = window
+        glfw.set_key_callback(window, Input._keyCallback)
+        glfw.set_mouse_button_callback(window, Input._mouseButtonCallback)
+        glfw.set_cursor_pos_callback(window, Input._cursorPosCallback)
+        Input._cursor = glfw.get_cursor_pos(window)
 
     @staticmethod
     def Key(key: str) -> int:
         return  Input.Keys[key.upper()]
 
+    @staticmethod
+    def _keyCallback(window, key: int, scancode: int, action: int, mods: int) -> None:
+        if action == glfw.PRESS:
+            Input.injectKey(key, True)
+        elif action == glfw.RELEASE:
+            Input.injectKey(key, False)
+
+    @staticmethod
+    def _mouseButtonCallback(window, button: int, action: int, mods: int) -> None:
+        if action == glfw.PRESS:
+            Input.injectMouseButton(button, True)
+        elif action == glfw.RELEASE:
+            Input.injectMouseButton(button, False)
+
+    @staticmethod
+    def _cursorPosCallback(window, x: float, y: float) -> None:
+        Input._cursor = (x, y)
+
+    @staticmethod
+    def injectKey(key: int, down: bool) -> None:
+        """Feeds a key event as if it came from the window. It becomes visible on the next Input.update."""
+        if down:
+            Input._heldKeys.add(key)
+            Input._pressedKeys.add(key)
+        else:
+            Input._heldKeys.discard(key)
+            Input._releasedKeys.add(key)
+
+    @staticmethod
+    def injectMouseButton(button: int, down: bool) -> None:
+        if down:
+            Input._heldButtons.add(button)
+            Input._pressedButtons.add(button)
+        else:
+            Input._heldButtons.discard(button)
+            Input._releasedButtons.add(button)
+
+    @staticmethod
+    def injectMousePos(x: float, y: float) -> None:
+        Input._cursor = (x, y)
+
     @staticmethod
     def update():
-        for key in range(glfw.KEY_SPACE, glfw.KEY_LAST):
-            current = glfw.get_key(Input._window, key)
-            Input._previous_keys[key] = current
+        """Commits the events received since the last call into a new frame snapshot."""
+        previous = Input._current
+        keys = frozenset(Input._heldKeys)
+        buttons = frozenset(Input._heldButtons)
+        Input.setState(InputState(
+            keys,
+            (keys - previous.keys) | Input._pressedKeys,
+            (previous.keys - keys) | Input._releasedKeys,
+            buttons,
+            (buttons - previous.buttons) | Input._pressedButtons,
+            (previous.buttons - buttons) | Input._releasedButtons,
+            Vector2(*Input._cursor)
+        ))
+        Input._pressedKeys.clear()
+        Input._releasedKeys.clear()
+        Input._pressedButtons.clear()
+        Input._releasedButtons.clear()
+
+    @staticmethod
+    def getState() -> InputState:
+        """The current frame's snapshot. Snapshots are immutable, so they can be recorded and replayed with setState."""
+        return Input._current
+
+    @staticmethod
+    def setState(state: InputState) -> None:
+        """Makes state the current frame's snapshot, e.g. to replay recorded input without a window."""
+        Input._previous = Input._current
+        Input._current = state
 
     @staticmethod
     def getKey(key: int) -> bool:
-        return glfw.get_key(Input._window, key) == glfw.PRESS
+        return key in Input._current.keys or key in Input._current.pressed
     
     @staticmethod
     def getKeyDown(key: int) -> bool:
-        current = glfw.get_key(Input._window, key)
-        previous = Input._previous_keys.get(key, glfw.RELEASE)
-        return current == glfw.PRESS and previous == glfw.RELEASE
+        return key in Input._current.pressed
+
+    @staticmethod
+    def getKeyUp(key: int) -> bool:
+        return key in Input._current.released
+
+    @staticmethod
+    def getMouseButton(button: int) -> bool:
+        return button in Input._current.buttons or button in Input._current.buttonsPressed
+
+    @staticmethod
+    def getMouseButtonDown(button: int) -> bool:
+        return button in Input._current.buttonsPressed
+
+    @staticmethod
+    def getMouseButtonUp(button: int) -> bool:
+        return button in Input._current.buttonsReleased
+
+    @staticmethod
+    def mapAction(name: str, *keys: int) -> None:
+        """Binds a named action to one or more keys, e.g. Input.mapAction("jump", Input.Key("space"))."""
+        Input._actions[name.lower()] = keys
+
+    @staticmethod
+    def getAction(name: str) -> bool:
+        return any(Input.getKey(key) for key in Input._actions[name.lower()])
+
+    @staticmethod
+    def getActionDown(name: str) -> bool:
+        return any(key in Input._current.pressed for key in Input._actions[name.lower()])
+
+    @staticmethod
+    def getActionUp(name: str) -> bool:
+        state = Input._current
+        keys = Input._actions[name.lower()]
+        return any(key in state.released for key in keys) and not any(key in state.keys for key in keys)
+
+    @staticmethod
+    def mapAxis(name: str, positive: tuple[int, ...], negative: tuple[int, ...]) -> None:
+        """Binds a named axis: +1 while any positive key is held, -1 for negative keys, 0 for both or neither."""
+        Input._axes[name.lower()] = (tuple(positive), tuple(negative))
 
     @staticmethod
     def getAxis(axis: str) -> int:
-        w = glfw.get_key(Input._window, glfw.KEY_W) == glfw.PRESS or glfw.get_key(Input._window, glfw.KEY_UP) == glfw.PRESS
-        s = glfw.get_key(Input._window, glfw.KEY_S) == glfw.PRESS or glfw.get_key(Input._window, glfw.KEY_DOWN) == glfw.PRESS
-        a = glfw.get_key(Input._window, glfw.KEY_A) == glfw.PRESS or glfw.get_key(Input._window, glfw.KEY_LEFT) == glfw.PRESS
-        d = glfw.get_key(Input._window, glfw.KEY_D) == glfw.PRESS or glfw.get_key(Input._window, glfw.KEY_RIGHT) == glfw.PRESS
-
-        if axis.lower() == "vertical":
-            return -int(s) + int(w)
-        elif axis.lower() == "horizontal":
-            return -int(a) + int(d)
-        return 0
+        mapping = Input._axes.get(axis.lower())
+        if mapping is None:
+            return 0
+        keys = Input._current.keys
+        positive = any(key in keys for key in mapping[0])
+        negative = any(key in keys for key in mapping[1])
+        return int(positive) - int(negative)
     
     @staticmethod
     def getMousePos() -> Vector2:
-        if Vector2(*glfw.get_cursor_pos(Input._window)):
-            return Vector2(*glfw.get_cursor_pos(Input._window))
-        else:
-            return Vector2.zero()
\ No newline at end of file
+        return Input._current.mousePos.copy()
@@ -0,0 +1,89 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, wait
+from time import perf_counter
+from typing import Optional
+
+from .essentials import Component, GameObject
+from .profiler import Profiler
+
+
+class JobSystem:
+    """
+    Runs the update of parallel-safe components on a thread pool. Scene.updateScene hands over the components of
+    each phase, lowest phase first; a phase only starts once every job of the previous one finished. Work that
+    releases the GIL (NumPy, I/O) overlaps on any build; on free-threaded builds plain Python code scales across
+    cores too.
+    """
+
+    # Python built without the GIL (PEP 703) and running with it disabled
+    freeThreaded: bool = hasattr(sys, "_is_gil_enabled") and not sys._is_gil_enabled()
+
+    enabled: bool = True  # When False, parallel-safe components run on the main thread, phase by phase
+    workers: int = os.cpu_count() or 1
+    minJobSize: int = 16  # Components per job at least, so tiny updates are not drowned by scheduling overhead
+
+    # Seconds spent in each phase and jobs submitted, in the last frame
+    phaseTimes: dict[int, float] = {}
+    lastFrameJobs: int = 0
+
+    _pool: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def run(phases: dict[int, list[tuple[GameObject, Component]]]) -> None:
+        """Updates the (gameObject, component) pairs of every phase; the first exception of a phase is re-raised here."""
+        JobSystem.phaseTimes = {}
+        JobSystem.lastFrameJobs = 0
+        profiling = Profiler.enabled
+        for phase in sorted(phases):
+            entries = phases[phase]
+            start = perf_counter()
+            chunks = JobSystem._split(entries)
+            if len(chunks) == 1:
+                timings = JobSystem._runChunk(chunks[0], profiling)
+            else:
+                if JobSystem._pool is None:
+                    JobSystem._pool = ThreadPoolExecutor(JobSystem.workers, thread_name_prefix="JobSystem")
+                futures = [JobSystem._pool.submit(JobSystem._runChunk, chunk, profiling) for chunk in chunks]
+                JobSystem.lastFrameJobs += len(futures)
+                wait(futures)
+                timings = []
+                for future in futures:
+                    # Raises the job's exception, if any
+                    timings.extend(future.result())
+            end = perf_counter()
+            JobSystem.phaseTimes[phase] = end - start
+            if profiling:
+                # Component totals are only touched here, on the main thread
+                for gameObject, component, componentStart, componentEnd in timings:
+                    Profiler.recordComponent(component, gameObject, componentStart, componentEnd)
+                Profiler.recordPhase(f"jobs phase {phase}", start, end, {"components": len(entries), "jobs": len(chunks)})
+
+    @staticmethod
+    def shutdown() -> None:
+        if JobSystem._pool is not None:
+            JobSystem._pool.shutdown(wait=True)
+            JobSystem._pool = None
+
+    @staticmethod
+    def _split(entries: list) -> list[list]:
+        if not JobSystem.enabled or JobSystem.workers <= 1:
+            return [entries]
+        count = max(1, min(JobSystem.workers * 4, len(entries) // JobSystem.minJobSize))
+        size = -(-len(entries) // count)
+        return [entries[index:index + size] for index in range(0, len(entries), size)]
+
+    @staticmethod
+    def _runChunk(entries: list[tuple[GameObject, Component]], profiling: bool) -> list[tuple[GameObject, Component, float, float]]:
+        if not profiling:
+            for _, component in entries:
+                component.updateJob()
+            return []
+        timings = []
+        chunkStart = perf_counter()
+        for gameObject, component in entries:
+            start = perf_counter()
+            component.updateJob()
+            timings.append((gameObject, component, start, perf_counter()))
+        Profiler.recordEvent("job", "jobs", chunkStart, perf_counter(), {"components": len(entries)})
+        return timings
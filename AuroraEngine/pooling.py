@@ -0,0 +1,119 @@
+from typing import Callable, Generic, Optional, TypeVar
+
+from .essentials import GameObject, Console
+
+T = TypeVar("T")
+
+
+class Pool(Generic[T]):
+    """
+    Reuses objects instead of allocating new ones. acquire() hands out a free object, or creates one with factory
+    when none is free; release() resets it and keeps it for the next acquire. At most `capacity` free objects are
+    kept, the rest are dropped for the garbage collector.
+    """
+
+    # Every pool created with a name, for Pool.report()
+    registry: dict[str, "Pool"] = {}
+
+    def __init__(self, factory: Callable[[], T], reset: Optional[Callable[[T], None]] = None,
+                 capacity: Optional[int] = None, name: Optional[str] = None):
+        self.factory = factory
+        self.reset = reset
+        self.capacity = capacity
+        self.name = name
+        self._free: list[T] = []
+        self._freeIds: set[int] = set()
+
+        self.created: int = 0
+        self.acquired: int = 0
+        self.released: int = 0
+        self.discarded: int = 0
+        self.active: int = 0
+        self.highWater: int = 0  # Most objects out of the pool at once
+
+        if name is not None:
+            Pool.registry[name] = self
+
+    def acquire(self) -> T:
+        if self._free:
+            item = self._free.pop()
+            self._freeIds.discard(id(item))
+        else:
+            item = self.factory()
+            self.created += 1
+        self.acquired += 1
+        self.active += 1
+        if self.active > self.highWater:
+            self.highWater = self.active
+        return item
+
+    def release(self, item: T) -> None:
+        if id(item) in self._freeIds:
+            Console.warn(f"Object released twice to pool {self.name or self.factory}.")
+            return
+        self.released += 1
+        self.active -= 1
+        if self.reset is not None:
+            self.reset(item)
+        if self.capacity is not None and len(self._free) >= self.capacity:
+            self.discarded += 1
+            return
+        self._free.append(item)
+        self._freeIds.add(id(item))
+
+    def prewarm(self, count: int) -> None:
+        """Creates objects up front until count are free, e.g. during a loading screen."""
+        while len(self._free) < count:
+            item = self.factory()
+            self.created += 1
+            self._free.append(item)
+            self._freeIds.add(id(item))
+
+    def clear(self) -> None:
+        """Drops the free objects; objects still out of the pool may be released again later."""
+        self._free.clear()
+        self._freeIds.clear()
+
+    @property
+    def freeCount(self) -> int:
+        return len(self._free)
+
+    def stats(self) -> dict[str, int]:
+        return {"created": self.created, "acquired": self.acquired, "released": self.released, "discarded": self.discarded,
+                "active": self.active, "free": len(self._free), "highWater": self.highWater}
+
+    @staticmethod
+    def report() -> str:
+        lines = [f"{'Pool':<28}{'active':>8}{'free':>8}{'high':>8}{'created':>9}{'acquired':>10}"]
+        for name, pool in Pool.registry.items():
+            lines.append(f"{name[:27]:<28}{pool.active:>8}{len(pool._free):>8}{pool.highWater:>8}{pool.created:>9}{pool.acquired:>10}")
+        return "\n".join(lines)
+
+
+class GameObjectPool(Pool[GameObject]):
+    """
+    Pool of GameObjects built by prefab(), for bullets, effects and other objects spawned over and over. Use
+    Scene.spawn(pool) and Scene.despawn(gameObject). On release the transform goes back to the values it had
+    when the prefab built it and every component's reset() is called.
+    """
+
+    def __init__(self, prefab: Callable[[], GameObject], capacity: Optional[int] = None, name: Optional[str] = None):
+        super().__init__(self._build, GameObjectPool._resetObject, capacity, name)
+        self.prefab = prefab
+
+    def _build(self) -> GameObject:
+        gameObject = self.prefab()
+        transform = gameObject.transform
+        gameObject._pool = self
+        gameObject._pooledTransform = (transform.position.x, transform.position.y, transform.rotation, transform.scale.x, transform.scale.y)
+        return gameObject
+
+    @staticmethod
+    def _resetObject(gameObject: GameObject) -> None:
+        x, y, rotation, scale_x, scale_y = gameObject._pooledTransform
+        transform = gameObject.transform
+        transform.position.set(x, y)
+        transform.rotation = rotation
+        transform.scale.set(scale_x, scale_y)
+        for component in gameObject.components:
+            component.reset()
@@ -0,0 +1,197 @@
+import json
+import threading
+from collections import deque
+from time import perf_counter
+from typing import Optional
+
+from .essentials import GameObject, Renderer, Console
+
+
+class FrameRecord:
+    """Everything the profiler measured during one frame. Times are perf_counter seconds."""
+    __slots__ = ("index", "start", "end", "phases", "componentTimes", "componentCalls", "objectTimes", "events")
+
+    def __init__(self, index: int, start: float):
+        self.index = index
+        self.start = start
+        self.end = start
+        self.phases: list[tuple[str, float, float]] = []
+        self.componentTimes: dict[str, float] = {}
+        self.componentCalls: dict[str, int] = {}
+        self.objectTimes: dict[str, float] = {}
+        # (name, category, start, end, thread id, args) for the Chrome trace
+        self.events: list[tuple[str, str, float, float, int, Optional[dict]]] = []
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class Profiler:
+    """
+    Opt-in frame profiler. While enabled, Scene.updateScene times every component update and the Window marks
+    the input/update/render/swap/wait phases of each frame. The last `capacity` frames are kept in a ring buffer.
+    """
+
+    enabled: bool = False
+    traceComponents: bool = True  # Record one trace event per component update, not just the per-frame totals
+
+    _frames: deque[FrameRecord] = deque(maxlen=120)
+    _current: Optional[FrameRecord] = None
+    _phase: Optional[tuple[str, float]] = None
+    _frameIndex: int = 0
+
+    @staticmethod
+    def enable(capacity: int = 120, traceComponents: bool = True) -> None:
+        if Profiler._frames.maxlen != capacity:
+            Profiler._frames = deque(Profiler._frames, maxlen=capacity)
+        Profiler.traceComponents = traceComponents
+        Profiler.enabled = True
+
+    @staticmethod
+    def disable() -> None:
+        Profiler.enabled = False
+        Profiler._current = None
+        Profiler._phase = None
+
+    @staticmethod
+    def clear() -> None:
+        Profiler._frames.clear()
+
+    @staticmethod
+    def getFrames() -> list[FrameRecord]:
+        return list(Profiler._frames)
+
+    @staticmethod
+    def beginFrame() -> None:
+        if Profiler._current is not None:
+            Profiler.endFrame()
+        Profiler._current = FrameRecord(Profiler._frameIndex, perf_counter())
+        Profiler._frameIndex += 1
+
+    @staticmethod
+    def endFrame() -> None:
+        frame = Profiler._current
+        if frame is None:
+            return
+        Profiler.endPhase()
+        frame.end = perf_counter()
+        Profiler._frames.append(frame)
+        Profiler._current = None
+
+    @staticmethod
+    def beginPhase(name: str) -> None:
+        """Starts a named phase of the current frame, ending the previous one."""
+        Profiler.endPhase()
+        if Profiler._current is not None:
+            Profiler._phase = (name, perf_counter())
+
+    @staticmethod
+    def endPhase() -> None:
+        phase = Profiler._phase
+        frame = Profiler._current
+        if phase is None or frame is None:
+            return
+        end = perf_counter()
+        frame.phases.append((phase[0], phase[1], end))
+        frame.events.append((phase[0], "phase", phase[1], end, threading.get_ident(), None))
+        Profiler._phase = None
+
+    @staticmethod
+    def recordPhase(name: str, start: float, end: float, args: Optional[dict] = None) -> None:
+        """Adds a phase measured elsewhere, e.g. one nested inside the update phase such as a JobSystem phase."""
+        frame = Profiler._current
+        if frame is None:
+            return
+        frame.phases.append((name, start, end))
+        frame.events.append((name, "phase", start, end, threading.get_ident(), args))
+
+    @staticmethod
+    def recordEvent(name: str, category: str, start: float, end: float, args: Optional[dict] = None) -> None:
+        """Adds a trace event on the calling thread. Safe to call from worker threads."""
+        frame = Profiler._current
+        if frame is not None:
+            frame.events.append((name, category, start, end, threading.get_ident(), args))
+
+    @staticmethod
+    def recordComponent(component, gameObject: GameObject, start: float, end: float) -> None:
+        frame = Profiler._current
+        if frame is None:
+            return
+        name = type(component).__name__
+        elapsed = end - start
+        frame.componentTimes[name] = frame.componentTimes.get(name, 0.0) + elapsed
+        frame.componentCalls[name] = frame.componentCalls.get(name, 0) + 1
+        frame.objectTimes[gameObject.name] = frame.objectTimes.get(gameObject.name, 0.0) + elapsed
+        if Profiler.traceComponents:
+            frame.events.append((name, "component", start, end, threading.get_ident(), {"gameObject": gameObject.name}))
+
+    @staticmethod
+    def updateObject(gameObject: GameObject, render: bool = True, skipJobs: bool = False) -> None:
+        """Timed equivalent of GameObject.updateComponents, used by Scene.updateScene while profiling."""
+        for component in gameObject.components:
+            if (not render and isinstance(component, Renderer)) or (skipJobs and component.parallelSafe):
+                continue
+            start = perf_counter()
+            component.update()
+            Profiler.recordComponent(component, gameObject, start, perf_counter())
+
+    @staticmethod
+    def toChromeTrace() -> dict:
+        """Recorded frames as Chrome trace_event JSON (load it in chrome://tracing or ui.perfetto.dev)."""
+        events = []
+        for frame in Profiler._frames:
+            events.append({"name": f"Frame {frame.index}", "cat": "frame", "ph": "X", "pid": 0,
+                           "tid": threading.main_thread().ident, "ts": frame.start * 1e6, "dur": frame.duration * 1e6})
+            for name, category, start, end, thread, args in frame.events:
+                event = {"name": name, "cat": category, "ph": "X", "pid": 0, "tid": thread,
+                         "ts": start * 1e6, "dur": (end - start) * 1e6}
+                if args:
+                    event["args"] = args
+                events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    @staticmethod
+    def exportChromeTrace(path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(Profiler.toChromeTrace(), file)
+        Console.log(f"Profiler: wrote {len(Profiler._frames)} frames to {path}")
+
+    @staticmethod
+    def summary(top: int = 10) -> str:
+        """Rolling table of mean milliseconds per frame for phases, component classes and the slowest GameObjects."""
+        frames = list(Profiler._frames)
+        if not frames:
+            return "Profiler: no frames recorded"
+        count = len(frames)
+
+        def accumulate(rows: dict, key: str, value: float, calls: int = 0) -> None:
+            total, peak, total_calls = rows.get(key, (0.0, 0.0, 0))
+            rows[key] = (total + value, max(peak, value), total_calls + calls)
+
+        phases: dict[str, tuple[float, float, int]] = {}
+        components: dict[str, tuple[float, float, int]] = {}
+        objects: dict[str, tuple[float, float, int]] = {}
+        for frame in frames:
+            frame_phases: dict[str, float] = {}
+            for name, start, end in frame.phases:
+                frame_phases[name] = frame_phases.get(name, 0.0) + end - start
+            for name, elapsed in frame_phases.items():
+                accumulate(phases, name, elapsed)
+            for name, elapsed in frame.componentTimes.items():
+                accumulate(components, name, elapsed, frame.componentCalls[name])
+            for name, elapsed in frame.objectTimes.items():
+                accumulate(objects, name, elapsed)
+
+        frame_mean = sum(frame.duration for frame in frames) / count
+        lines = [f"Profiler: {count} frames, {frame_mean * 1000:.3f} ms/frame mean",
+                 f"{'':<32}{'mean ms':>10}{'max ms':>10}{'calls/frame':>13}"]
+        for title, rows, limit in (("Phases", phases, None), ("Components", components, None), ("GameObjects", objects, top)):
+            if not rows:
+                continue
+            lines.append(title)
+            ordered = sorted(rows.items(), key=lambda item: item[1][0], reverse=True)
+            for name, (total, peak, calls) in ordered[:limit]:
+                calls_text = f"{calls / count:>13.1f}" if calls else ""
+                lines.append(f"  {name[:30]:<30}{total / count * 1000:>10.3f}{peak * 1000:>10.3f}{calls_text}")
+        return "\n".join(lines)
@@ -1,17 +1,197 @@
-from .essentials import GameObject
+from .essentials import GameObject, Component, System, Vector2
+from .graphics.camera import Camera
+from .graphics.static import StaticBatch
+from .profiler import Profiler
+from .jobs import JobSystem
+from .ecs import World
 from typing import Optional
 
 class Scene:
     def __init__(self, name: str):
         self.gameObjects: list[GameObject] = []
         self.name = name
+        # Component class (and each of its base classes) -> {GameObject: number of such components}
+        self._componentIndex: dict[type, dict[GameObject, int]] = {}
+        # Optional ECS world for entities without GameObjects, updated before the GameObjects
+        self.world: Optional[World] = None
 
-    def updateScene(self) -> None:
+        # Parallel-safe components (an ordered set) and their GameObjects, run on the JobSystem each update
+        self._jobComponents: dict[Component, GameObject] = {}
+
+        # Skip Renderers of objects outside Camera.MainCamera's view; counts of such objects in the last updateScene
+        self.culling: bool = True
+        self.drawnCount: int = 0
+        self.culledCount: int = 0
+
+        # Static GameObjects (an ordered set) and the baked geometry of their renderers
+        self._staticObjects: dict[GameObject, None] = {}
+        self.staticBatch: StaticBatch = StaticBatch()
+
+    def updateScene(self, render: bool = True) -> None:
+        """Runs one frame of the scene. With render=False no Renderer runs, e.g. for headless simulation."""
+        System.rendering = render
+        if System.fixedSteps:
+            self.fixedUpdateScene(System.fixedSteps)
+
+        if self.world is not None:
+            self.world.update()
+
+        skipJobs = bool(self._jobComponents)
+        if skipJobs:
+            phases: dict[int, list] = {}
+            for component, gameObject in self._jobComponents.items():
+                phases.setdefault(component.phase, []).append((gameObject, component))
+            JobSystem.run(phases)
+
+        # Checked once per frame so the unprofiled path pays nothing for the profiler
+        updateObject = Profiler.updateObject if Profiler.enabled else GameObject.updateComponents
+
+        if not render:
+            for gameObject in self.gameObjects:
+                updateObject(gameObject, False, skipJobs)
+            self.drawnCount = self.culledCount = 0
+            return
+
+        # Static renderers are drawn from the baked geometry, underneath everything drawn this frame
+        if self._staticObjects:
+            self.staticBatch.draw(self._staticObjects)
+
+        camera = getattr(Camera, "MainCamera", None)
+        if not self.culling or camera is None:
+            for gameObject in self.gameObjects:
+                updateObject(gameObject, not gameObject._static, skipJobs)
+            self.drawnCount = self.culledCount = 0
+            return
+
+        left, bottom, right, top = camera.getVisibleBounds()
+        drawn = culled = 0
         for gameObject in self.gameObjects:
-            gameObject.updateComponents()
+            if gameObject._static:
+                updateObject(gameObject, False, skipJobs)
+                continue
+            bounds = gameObject.getRenderBounds()
+            if bounds is None:
+                updateObject(gameObject, True, skipJobs)
+            elif bounds[0] > right or bounds[2] < left or bounds[1] > top or bounds[3] < bottom:
+                updateObject(gameObject, False, skipJobs)
+                culled += 1
+            else:
+                updateObject(gameObject, True, skipJobs)
+                drawn += 1
+        self.drawnCount = drawn
+        self.culledCount = culled
+
+    def fixedUpdateScene(self, steps: int = 1) -> None:
+        """Runs steps rounds of fixedUpdate with System.deltaTime set to System.fixedDeltaTime."""
+        deltaTime = System.deltaTime
+        System.deltaTime = System.fixedDeltaTime
+        try:
+            for _ in range(steps):
+                for gameObject in self.gameObjects:
+                    gameObject.fixedUpdateComponents()
+        finally:
+            System.deltaTime = deltaTime
 
     def instantiate(self, gameObject: GameObject) -> None:
         self.gameObjects.append(gameObject)
+        gameObject.scene = self
+        for component in gameObject.components:
+            self._indexComponent(gameObject, component)
+        if gameObject._static:
+            self._setStatic(gameObject, True)
+
+    def destroy(self, gameObject: GameObject) -> None:
+        """Removes a GameObject from the scene, calling onDestroy on each of its components."""
+        if gameObject.scene is not self:
+            return
+        for component in gameObject.components:
+            component.onDestroy()
+        self._remove(gameObject)
+
+    def spawn(self, pool, position: Optional[Vector2] = None, rotation: Optional[float] = None) -> GameObject:
+        """Takes a GameObject from a GameObjectPool and instantiates it, optionally moved to position and rotation."""
+        gameObject = pool.acquire()
+        transform = gameObject.transform
+        if position is not None:
+            transform.position.set(position.x, position.y)
+        if rotation is not None:
+            transform.rotation = rotation
+        self.instantiate(gameObject)
+        return gameObject
+
+    def despawn(self, gameObject: GameObject) -> None:
+        """
+        Removes a GameObject from the scene. One from a GameObjectPool goes back to its pool, reset but not destroyed,
+        to be spawned again; any other one is destroyed.
+        """
+        if gameObject._pool is None:
+            self.destroy(gameObject)
+            return
+        if gameObject.scene is not self:
+            return
+        for component in gameObject.components:
+            component.onDisable()
+        self._remove(gameObject)
+        gameObject._pool.release(gameObject)
+
+    def _remove(self, gameObject: GameObject) -> None:
+        if gameObject._static:
+            self._setStatic(gameObject, False)
+        self.gameObjects.remove(gameObject)
+        for component in gameObject.components:
+            self._unindexComponent(gameObject, component)
+        gameObject.scene = None
+
+    def markStatic(self, region: Optional[tuple[float, float, float, float]] = None, static: bool = True) -> int:
+        """
+        Sets isStatic on every GameObject with renderers whose render bounds lie inside region (left, bottom, right,
+        top), or on all of them when region is None. Returns how many objects were marked.
+        """
+        marked = 0
+        for gameObject in self.gameObjects:
+            bounds = gameObject.getRenderBounds()
+            if bounds is None:
+                continue
+            if region is not None and (bounds[0] < region[0] or bounds[1] < region[1] or bounds[2] > region[2] or bounds[3] > region[3]):
+                continue
+            gameObject.isStatic = static
+            marked += 1
+        return marked
+
+    def _setStatic(self, gameObject: GameObject, static: bool) -> None:
+        if static:
+            self._staticObjects[gameObject] = None
+        else:
+            self._staticObjects.pop(gameObject, None)
+        self.staticBatch.markDirty()
+
+    def _markStaticDirty(self) -> None:
+        self.staticBatch.markDirty()
+
+    def findObjectsWithComponent(self, componentClass) -> list[GameObject]:
+        """Returns every GameObject in the scene that has a component of the given class."""
+        return list(self._componentIndex.get(componentClass, ()))
+
+    def _indexComponent(self, gameObject: GameObject, component: Component) -> None:
+        for cls in type(component).__mro__[:-1]:
+            owners = self._componentIndex.setdefault(cls, {})
+            owners[gameObject] = owners.get(gameObject, 0) + 1
+        if component.parallelSafe:
+            self._jobComponents[component] = gameObject
+        if gameObject._static:
+            self.staticBatch.markDirty()
+
+    def _unindexComponent(self, gameObject: GameObject, component: Component) -> None:
+        for cls in type(component).__mro__[:-1]:
+            owners = self._componentIndex[cls]
+            owners[gameObject] -= 1
+            if owners[gameObject] == 0:
+                del owners[gameObject]
+                if not owners:
+                    del self._componentIndex[cls]
+        self._jobComponents.pop(component, None)
+        if gameObject._static:
+            self.staticBatch.markDirty()
 
 
 class SceneManager:
@@ -0,0 +1,372 @@
+"""
+Binary scene files. Transforms, names and component fields are stored as contiguous typed arrays, described by a
+JSON schema section, so loading maps the file and builds every object from whole columns instead of parsing
+objects one by one.
+
+Layout: a header (magic, format version, object and section counts), a directory of (name, offset, size) entries,
+then the sections, each aligned to 64 bytes. Component fields are the names listed in the component class's
+serializedFields, which must also be keyword arguments of its constructor; a component class that does not declare
+them is left out of the file with a warning.
+"""
+
+import importlib
+import json
+import mmap
+import struct
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from .essentials import GameObject, Component, Transform, Vector2, Color32, Console
+from .scenes import Scene
+from .graphics.textures import AtlasRegion
+
+
+class SceneFile:
+    """
+    Read-only view of a binary scene, over a memory map or a bytes object. Every array it returns is a zero-copy
+    view into the buffer, so they are only valid until close().
+    """
+
+    MAGIC: bytes = b"AUSC"
+    # A different major version cannot be read; minor versions only add sections and column kinds.
+    # 2.0: float64 transforms and vec2 columns, rgba8 colors
+    VERSION: tuple[int, int] = (2, 0)
+    _HEADER = struct.Struct("<4sHHII")  # magic, major, minor, object count, section count
+    _ENTRY = struct.Struct("<16sQQ")  # section name, offset, size
+    ALIGNMENT: int = 64
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        self._buffer = buffer
+        self._file = None
+        magic, major, minor, self.objectCount, sections = SceneFile._HEADER.unpack_from(buffer, 0)
+        if magic != SceneFile.MAGIC:
+            raise RuntimeError("Not an AuroraEngine scene file")
+        if major != SceneFile.VERSION[0]:
+            raise RuntimeError(f"Scene file version {major}.{minor} cannot be read by format version {SceneFile.VERSION[0]}.x")
+        self.version = (major, minor)
+        self._sections: dict[str, tuple[int, int]] = {}
+        for index in range(sections):
+            name, offset, size = SceneFile._ENTRY.unpack_from(buffer, SceneFile._HEADER.size + index * SceneFile._ENTRY.size)
+            self._sections[name.rstrip(b"\0").decode("ascii")] = (offset, size)
+        self.schema: dict = json.loads(bytes(self.raw("schema")).decode("utf-8"))
+
+    @staticmethod
+    def open(path: str) -> "SceneFile":
+        file = open(path, "rb")
+        try:
+            sceneFile = SceneFile(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        except BaseException:
+            file.close()
+            raise
+        sceneFile._file = file
+        return sceneFile
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "SceneFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def raw(self, name: str) -> memoryview:
+        offset, size = self._sections[name]
+        return memoryview(self._buffer)[offset:offset + size]
+
+    def array(self, name: str, dtype: Any, shape: tuple[int, ...] = ()) -> np.ndarray:
+        offset, size = self._sections[name]
+        dtype = np.dtype(dtype)
+        count = size // dtype.itemsize
+        return np.frombuffer(self._buffer, dtype=dtype, count=count, offset=offset).reshape((-1,) + shape)
+
+    def strings(self, name: str) -> list[str]:
+        """A string table, stored as one UTF-8 blob and the character offsets of its entries."""
+        text = bytes(self.raw(name)).decode("utf-8")
+        offsets = self.array(name + "#", np.uint32).tolist()
+        return [text[offsets[index]:offsets[index + 1]] for index in range(len(offsets) - 1)]
+
+    @property
+    def transforms(self) -> np.ndarray:
+        """(N, 5) float64: position x, position y, rotation, scale x, scale y."""
+        return self.array("transforms", np.float64, (5,))
+
+    @property
+    def flags(self) -> np.ndarray:
+        return self.array("flags", np.uint8)
+
+
+class SceneSerializer:
+    """Saves scenes to the binary format, loads them back and exports them as JSON for diffing."""
+
+    FLAG_STATIC: int = 1
+
+    # Column kind -> (dtype, shape) of its array. Floats are float64 like Python's, so values load back exactly;
+    # colors are Color32.rgba
+    _KINDS: dict[str, tuple[Any, tuple[int, ...]]] = {
+        "bool": (np.uint8, ()), "int": (np.int64, ()), "float": (np.float64, ()),
+        "str": (np.int32, ()), "json": (np.int32, ()), "vec2": (np.float64, (2,)), "rgba8": (np.uint32, ()),
+    }
+
+    @staticmethod
+    def save(scene: Scene, path: str) -> None:
+        data = SceneSerializer.dumps(scene)
+        with open(path, "wb") as file:
+            file.write(data)
+
+    @staticmethod
+    def dumps(scene: Scene) -> bytes:
+        objects = scene.gameObjects
+        count = len(objects)
+        transforms = np.empty((count, 5), dtype=np.float64)
+        flags = np.zeros(count, dtype=np.uint8)
+        componentCounts = np.zeros(count, dtype=np.uint16)
+        order: list[int] = []
+        tables: dict[type, list[Component]] = {}
+        tableIndex: dict[type, int] = {}
+        skipped: set[type] = set()
+
+        for index, gameObject in enumerate(objects):
+            transform = gameObject.transform
+            transforms[index] = (transform.position.x, transform.position.y, transform.rotation, transform.scale.x, transform.scale.y)
+            if gameObject._static:
+                flags[index] = SceneSerializer.FLAG_STATIC
+            saved = 0
+            for component in gameObject.components:
+                componentClass = type(component)
+                if componentClass.serializedFields is None:
+                    if not componentClass.transient and componentClass not in skipped:
+                        skipped.add(componentClass)
+                        Console.warn(f"SceneSerializer: {componentClass.__qualname__} declares no serializedFields, it is not saved.")
+                    continue
+                if componentClass not in tableIndex:
+                    tableIndex[componentClass] = len(tables)
+                    tables[componentClass] = []
+                tables[componentClass].append(component)
+                order.append(tableIndex[componentClass])
+                saved += 1
+            componentCounts[index] = saved
+
+        strings: dict[str, int] = {}
+        sections: dict[str, bytes] = {}
+        schemaTables = []
+        for table, (componentClass, components) in enumerate(tables.items()):
+            fields = []
+            for field_index, field in enumerate(componentClass.serializedFields):
+                values = [getattr(component, field) for component in components]
+                kind, column, nulls = SceneSerializer._encodeColumn(componentClass, field, values, strings)
+                sections[f"c{table}.{field_index}"] = column.tobytes()
+                if nulls is not None:
+                    sections[f"n{table}.{field_index}"] = nulls.tobytes()
+                fields.append({"name": field, "kind": kind, "nullable": nulls is not None})
+            schemaTables.append({"type": f"{componentClass.__module__}:{componentClass.__qualname__}",
+                                 "rows": len(components), "fields": fields})
+
+        schema = {"scene": scene.name, "tables": schemaTables}
+        sections = {
+            "schema": json.dumps(schema).encode("utf-8"),
+            "transforms": transforms.tobytes(),
+            "flags": flags.tobytes(),
+            "componentCounts": componentCounts.tobytes(),
+            "componentOrder": np.array(order, dtype=np.uint16).tobytes(),
+            **SceneSerializer._encodeStrings("names", [gameObject.name for gameObject in objects]),
+            **SceneSerializer._encodeStrings("strings", list(strings)),
+            **sections,
+        }
+        return SceneSerializer._pack(count, sections)
+
+    @staticmethod
+    def load(path: str) -> Scene:
+        """Builds a Scene from a scene file through a memory map."""
+        with SceneFile.open(path) as sceneFile:
+            return SceneSerializer.build(sceneFile)
+
+    @staticmethod
+    def loads(data: bytes) -> Scene:
+        return SceneSerializer.build(SceneFile(data))
+
+    @staticmethod
+    def build(sceneFile: SceneFile) -> Scene:
+        """Creates the scene's objects and components, each column converted once for all objects."""
+        schema = sceneFile.schema
+        scene = Scene(schema["scene"])
+        names = sceneFile.strings("names")
+        strings = sceneFile.strings("strings")
+        transforms = sceneFile.transforms.tolist()
+        static = (sceneFile.flags & SceneSerializer.FLAG_STATIC).astype(bool).tolist()
+        componentCounts = sceneFile.array("componentCounts", np.uint16).tolist()
+        order = sceneFile.array("componentOrder", np.uint16).tolist()
+
+        # Per table: component class and one keyword-argument dict per row
+        classes = []
+        rows: list[list[dict]] = []
+        for table, entry in enumerate(schema["tables"]):
+            module, _, qualname = entry["type"].partition(":")
+            componentClass: Any = importlib.import_module(module)
+            for part in qualname.split("."):
+                componentClass = getattr(componentClass, part)
+            classes.append(componentClass)
+            columns = {}
+            for field_index, field in enumerate(entry["fields"]):
+                columns[field["name"]] = SceneSerializer._decodeColumn(sceneFile, table, field_index, field, strings)
+            rows.append([dict(zip(columns, values)) for values in zip(*columns.values())] if columns else [{}] * entry["rows"])
+
+        rowIterators = [iter(tableRows) for tableRows in rows]
+        bases = [componentClass.__mro__[:-1] for componentClass in classes]
+        position = 0
+        gameObjects = []
+        for index in range(sceneFile.objectCount):
+            x, y, rotation, scale_x, scale_y = transforms[index]
+            gameObject = GameObject(names[index], Transform(Vector2(x, y), rotation, Vector2(scale_x, scale_y)))
+            components = gameObject.components
+            componentIndex = gameObject._componentIndex
+            # GameObject.addComponent for an object not in a scene yet, with each class's bases looked up once
+            for table in order[position:position + componentCounts[index]]:
+                component = classes[table](gameObject, **next(rowIterators[table]))
+                components.append(component)
+                for base in bases[table]:
+                    componentIndex.setdefault(base, []).append(component)
+            # Started once all saved components exist, so start() finds its siblings instead of adding defaults
+            for component in components[:]:
+                component.start()
+            position += componentCounts[index]
+            gameObjects.append(gameObject)
+
+        for gameObject, isStatic in zip(gameObjects, static):
+            scene.instantiate(gameObject)
+            if isStatic:
+                gameObject.isStatic = True
+        return scene
+
+    @staticmethod
+    def toDict(source: Union[Scene, SceneFile]) -> dict:
+        """The scene as plain data, objects in order, for JSON export."""
+        sceneFile = source if isinstance(source, SceneFile) else SceneFile(SceneSerializer.dumps(source))
+        schema = sceneFile.schema
+        strings = sceneFile.strings("strings")
+        tables = []
+        for table, entry in enumerate(schema["tables"]):
+            columns = {field["name"]: SceneSerializer._decodeColumn(sceneFile, table, field_index, field, strings, plain=True)
+                       for field_index, field in enumerate(entry["fields"])}
+            tables.append((entry["type"], [dict(zip(columns, values)) for values in zip(*columns.values())] if columns else [{}] * entry["rows"]))
+
+        order = sceneFile.array("componentOrder", np.uint16).tolist()
+        cursors = [0] * len(tables)
+        position = 0
+        objects = []
+        for name, transform, flag, componentCount in zip(sceneFile.strings("names"), sceneFile.transforms.tolist(),
+                                                         sceneFile.flags.tolist(), sceneFile.array("componentCounts", np.uint16).tolist()):
+            components = []
+            for table in order[position:position + componentCount]:
+                components.append({"type": tables[table][0], "fields": tables[table][1][cursors[table]]})
+                cursors[table] += 1
+            position += componentCount
+            objects.append({"name": name, "position": transform[0:2], "rotation": transform[2], "scale": transform[3:5],
+                            "static": bool(flag & SceneSerializer.FLAG_STATIC), "components": components})
+        return {"version": ".".join(map(str, sceneFile.version)), "scene": schema["scene"], "objects": objects}
+
+    @staticmethod
+    def exportJSON(source: Union[Scene, str], path: str) -> None:
+        """Writes a scene, or a scene file given by path, as indented JSON."""
+        if isinstance(source, str):
+            with SceneFile.open(source) as sceneFile:
+                data = SceneSerializer.toDict(sceneFile)
+        else:
+            data = SceneSerializer.toDict(source)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=1, ensure_ascii=False)
+
+    @staticmethod
+    def _encodeColumn(componentClass: type, field: str, values: list, strings: dict[str, int]) -> tuple[str, np.ndarray, Optional[np.ndarray]]:
+        kinds = set()
+        for value in values:
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                kinds.add("bool")
+            elif isinstance(value, int):
+                kinds.add("int")
+            elif isinstance(value, float):
+                kinds.add("float")
+            elif isinstance(value, (str, AtlasRegion)):
+                kinds.add("str")
+            elif isinstance(value, Vector2):
+                kinds.add("vec2")
+            elif isinstance(value, Color32):
+                kinds.add("rgba8")
+            else:
+                kinds.add("json")
+        if kinds == {"int", "float"}:
+            kinds = {"float"}
+        if len(kinds) > 1:
+            raise RuntimeError(f"Field {field} of {componentClass.__name__} mixes value types {sorted(kinds)}")
+        kind = kinds.pop() if kinds else "float"
+
+        dtype, shape = SceneSerializer._KINDS[kind]
+        column = np.zeros((len(values),) + shape, dtype=dtype)
+        nulls = np.zeros(len(values), dtype=np.uint8) if None in values else None
+        for row, value in enumerate(values):
+            if value is None:
+                nulls[row] = 1  # type: ignore[index]
+            elif kind == "vec2":
+                column[row] = (value.x, value.y)
+            elif kind == "rgba8":
+                column[row] = value.rgba
+            elif kind in ("str", "json"):
+                text = value.name if isinstance(value, AtlasRegion) else value if kind == "str" else json.dumps(value)
+                column[row] = strings.setdefault(text, len(strings))
+            else:
+                column[row] = value
+        return kind, column, nulls
+
+    @staticmethod
+    def _decodeColumn(sceneFile: SceneFile, table: int, field_index: int, field: dict, strings: list[str], plain: bool = False) -> list:
+        kind = field["kind"]
+        dtype, shape = SceneSerializer._KINDS[kind]
+        values = sceneFile.array(f"c{table}.{field_index}", dtype, shape).tolist()
+        if kind == "bool":
+            values = [bool(value) for value in values]
+        elif kind == "str":
+            values = [strings[value] for value in values]
+        elif kind == "json":
+            values = [json.loads(strings[value]) for value in values]
+        elif not plain and kind == "vec2":
+            values = [Vector2(x, y) for x, y in values]
+        elif kind == "rgba8":
+            values = [Color32.fromPacked(rgba) for rgba in values]
+            if plain:
+                values = [list(color.getColor()) for color in values]
+        if field["nullable"]:
+            nulls = sceneFile.array(f"n{table}.{field_index}", np.uint8).tolist()
+            values = [None if null else value for value, null in zip(values, nulls)]
+        return values
+
+    @staticmethod
+    def _encodeStrings(name: str, texts: list[str]) -> dict[str, bytes]:
+        offsets = np.zeros(len(texts) + 1, dtype=np.uint32)
+        np.cumsum([len(text) for text in texts], out=offsets[1:])
+        return {name: "".join(texts).encode("utf-8"), name + "#": offsets.tobytes()}
+
+    @staticmethod
+    def _pack(objectCount: int, sections: dict[str, bytes]) -> bytes:
+        alignment = SceneFile.ALIGNMENT
+        offset = SceneFile._HEADER.size + SceneFile._ENTRY.size * len(sections)
+        directory = []
+        for name, data in sections.items():
+            if len(name) > 16:
+                raise RuntimeError(f"Scene file section name {name} is longer than 16 bytes")
+            offset = -(-offset // alignment) * alignment
+            directory.append((name, offset, len(data)))
+            offset += len(data)
+
+        output = bytearray(offset)
+        SceneFile._HEADER.pack_into(output, 0, SceneFile.MAGIC, SceneFile.VERSION[0], SceneFile.VERSION[1], objectCount, len(sections))
+        for index, (name, start, size) in enumerate(directory):
+            SceneFile._ENTRY.pack_into(output, SceneFile._HEADER.size + index * SceneFile._ENTRY.size, name.encode("ascii"), start, size)
+            output[start:start + size] = sections[name]
+        return bytes(output)
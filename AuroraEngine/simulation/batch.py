@@ -0,0 +1,157 @@
+import os
+import random
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+from typing import Any, Callable, Iterable, Optional, Union
+
+import numpy as np
+
+from ..essentials import System, EngineSettings
+from ..scenes import Scene, SceneManager
+from ..timing import FixedTimestep
+from ..graphics.gl import opengl, NullGL
+from ..graphics.batch import SpriteBatch
+from ..graphics.particles import ParticleSystem
+from ..jobs import JobSystem
+
+
+class EpisodeResult:
+    """Outcome of one episode: whatever collect returned, or the formatted exception if the episode failed."""
+    __slots__ = ("index", "params", "result", "error", "steps", "duration", "worker")
+
+    def __init__(self, index: int, params: dict):
+        self.index = index
+        self.params = params
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.steps: int = 0
+        self.duration: float = 0.0  # Seconds, building the scene included
+        self.worker: int = os.getpid()
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def stepsPerSecond(self) -> float:
+        return self.steps / self.duration if self.duration > 0 else 0.0
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else "failed"
+        return f"EpisodeResult({self.index}, {status}, {self.steps} steps in {self.duration * 1000:.1f} ms)"
+
+
+class BatchRunner:
+    """
+    Runs many headless episodes of a scene, spread over a process pool. Each episode builds its scene with
+    factory(**params), steps it `steps` times with a fixed System.deltaTime and no rendering, then passes it to
+    collect(scene) for the result. until(scene), if given, ends an episode early when it returns True.
+
+    factory, collect and until are sent to the worker processes, so they must be picklable: module-level
+    functions, not lambdas or closures. Each worker binds GL calls to NullGL, so components touching GL run without
+    a context, and keeps the JobSystem on one thread, as the processes already use the cores.
+    """
+
+    def __init__(self, factory: Callable[..., Scene], steps: int = 600, deltaTime: float = 1 / 60,
+                 collect: Optional[Callable[[Scene], Any]] = None, until: Optional[Callable[[Scene], bool]] = None,
+                 workers: Optional[int] = None, seed: int = 0):
+        self.factory = factory
+        self.steps = steps
+        self.deltaTime = deltaTime
+        self.collect = collect
+        self.until = until
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.seed = seed  # Episode i seeds random, numpy.random and ParticleSystem with seed + i
+
+        # Timing of the last run
+        self.duration: float = 0.0
+        self.episodeCount: int = 0
+
+    def run(self, episodes: Union[int, Iterable[dict]], progress: Optional[Callable[[EpisodeResult], None]] = None) -> list[EpisodeResult]:
+        """
+        Runs the episodes and returns their results in episode order. episodes is a count, or one dict of factory
+        keyword arguments per episode. progress is called in this process as each episode finishes. A failing
+        episode is reported in its result and does not stop the batch.
+        """
+        params = [{} for _ in range(episodes)] if isinstance(episodes, int) else [dict(entry) for entry in episodes]
+        settings = (self.factory, self.steps, self.deltaTime, self.collect, self.until, self.seed)
+        results: list[Optional[EpisodeResult]] = [None] * len(params)
+        start = perf_counter()
+
+        if self.workers <= 1:
+            # In-process, e.g. for debugging an episode; the process's own GL target and settings are restored after
+            saved = (opengl.target, JobSystem.workers, EngineSettings.fps_limit, EngineSettings.deltaTimeOverheadWarning, System.rendering)
+            _initializeWorker()
+            try:
+                for index, entry in enumerate(params):
+                    results[index] = result = _runEpisode(settings, index, entry)
+                    if progress is not None:
+                        progress(result)
+            finally:
+                opengl.bind(saved[0])
+                JobSystem.workers, EngineSettings.fps_limit, EngineSettings.deltaTimeOverheadWarning, System.rendering = saved[1:]
+        else:
+            with ProcessPoolExecutor(self.workers, initializer=_initializeWorker) as executor:
+                futures = [executor.submit(_runEpisode, settings, index, entry) for index, entry in enumerate(params)]
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[result.index] = result
+                    if progress is not None:
+                        progress(result)
+
+        self.duration = perf_counter() - start
+        self.episodeCount = len(params)
+        return results  # type: ignore[return-value]
+
+    @property
+    def episodesPerSecond(self) -> float:
+        return self.episodeCount / self.duration if self.duration > 0 else 0.0
+
+    @staticmethod
+    def summary(results: list[EpisodeResult]) -> str:
+        failed = sum(1 for result in results if not result.ok)
+        steps = sum(result.steps for result in results)
+        busy = sum(result.duration for result in results)
+        workers = len({result.worker for result in results})
+        return (f"BatchRunner: {len(results)} episodes ({failed} failed) on {workers} processes, {steps} steps, "
+                f"{steps / busy if busy else 0:.0f} steps/s per process")
+
+
+def _initializeWorker() -> None:
+    opengl.bind(NullGL())
+    JobSystem.workers = 1
+    EngineSettings.fps_limit = 0
+    EngineSettings.deltaTimeOverheadWarning = False
+
+
+def _runEpisode(settings: tuple, index: int, params: dict) -> EpisodeResult:
+    factory, steps, deltaTime, collect, until, seed = settings
+    result = EpisodeResult(index, params)
+    start = perf_counter()
+    try:
+        # Headless steps draw nothing; drop whatever an earlier in-process frame queued and never flushed
+        SpriteBatch.clear()
+        random.seed(seed + index)
+        np.random.seed((seed + index) % 2 ** 32)
+        ParticleSystem.seed(seed + index)
+        fixedTimestep = FixedTimestep()
+        System.deltaTime = deltaTime
+        System.fixedSteps = 0
+
+        scene = factory(**params)
+        SceneManager.loadScene(scene)
+        for step in range(steps):
+            System.deltaTime = deltaTime
+            System.fixedSteps = fixedTimestep.advance(deltaTime, System.fixedDeltaTime, EngineSettings.maxFixedStepsPerFrame)
+            System.interpolationAlpha = fixedTimestep.alpha(System.fixedDeltaTime)
+            scene.updateScene(render=False)
+            result.steps = step + 1
+            if until is not None and until(scene):
+                break
+        if collect is not None:
+            result.result = collect(scene)
+    except Exception:
+        result.error = traceback.format_exc()
+    result.duration = perf_counter() - start
+    return result
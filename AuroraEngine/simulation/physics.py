@@ -1,7 +1,768 @@
-from ..scenes import SceneManager
-from ..essentials import Vector2
+from ..scenes import SceneManager, Scene
+from ..essentials import Vector2, Vector2Array, Component, GameObject
+from math import floor, inf
+from typing import Optional, Hashable, Any
+import numpy as np
+import weakref
+
+
+# Axis-aligned bounds as (min_x, min_y, max_x, max_y)
+Bounds = tuple[float, float, float, float]
+
+
+class SpatialHash:
+    """
+    Uniform-grid broadphase. Every key gets a row number and its AABB is stored at that row of one array, so
+    inserting, moving or removing a key only writes its own row. The grid itself, one entry per (cell, row) a key
+    covers sorted by cell, is rebuilt with whole-array operations by the first query after a change.
+    """
+
+    # Keys covering up to this many cells along both axes are expanded into grid entries one cell offset at a time
+    OFFSET_CELLS: int = 4
+
+    def __init__(self, cellSize: float = 1.0):
+        self.cellSize = cellSize
+        self._inverseCellSize = 1.0 / cellSize
+        self._rows: dict[Hashable, int] = {}
+        self._count = 0  # Rows [0, count) of _keys and of the _bounds columns are live
+        self._keys = np.empty(64, dtype=object)
+        self._bounds = np.empty((4, 64), dtype=np.float64)  # min x, min y, max x, max y of each row
+        self._dirty = False
+
+        # Grid of the last rebuild, valid while not _dirty
+        self._columns = self._bounds[:, :0]  # Bounds of the live rows
+        self._cellRanges = np.empty((4, 0), dtype=np.int64)  # Lowest and highest cell of each row along x and y
+        self._origin: tuple[int, int, int, int] = (0, 0, 0, 0)  # Lowest cell x and y, cells along x and y
+        self._entryCells = np.empty(0, dtype=np.int64)  # Sorted cell numbers, (x - origin x) * cells along y + y - origin y
+        self._entryRows = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    def keys(self) -> list[Hashable]:
+        """Every key, in the order updateAll() expects."""
+        return self._keys[:self._count].tolist()
+
+    def insert(self, key: Hashable, bounds: Bounds) -> None:
+        if key in self._rows:
+            self.update(key, bounds)
+            return
+        row = self._count
+        if row == len(self._keys):
+            self._keys = np.concatenate((self._keys, np.empty_like(self._keys)))
+            self._bounds = np.concatenate((self._bounds, np.empty_like(self._bounds)), axis=1)
+        self._keys[row] = key
+        self._bounds[:, row] = bounds
+        self._rows[key] = row
+        self._count += 1
+        self._dirty = True
+
+    def update(self, key: Hashable, bounds: Bounds) -> None:
+        self._bounds[:, self._rows[key]] = bounds
+        self._dirty = True
+
+    def updateAll(self, min_x: np.ndarray, min_y: np.ndarray, max_x: np.ndarray, max_y: np.ndarray) -> None:
+        """Replaces the bounds of every key at once, from one array per coordinate in the order of keys()."""
+        count = self._count
+        if len(min_x) != count:
+            raise ValueError(f"Expected bounds for {count} keys, got {len(min_x)}")
+        bounds = self._bounds
+        bounds[0, :count], bounds[1, :count], bounds[2, :count], bounds[3, :count] = min_x, min_y, max_x, max_y
+        self._dirty = True
+
+    def remove(self, key: Hashable) -> None:
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        # The last row moves into the hole
+        self._count -= 1
+        last = self._count
+        if row < last:
+            moved = self._keys[row] = self._keys[last]
+            self._rows[moved] = row
+            self._bounds[:, row] = self._bounds[:, last]
+        self._keys[last] = None
+        self._dirty = True
+
+    def getBounds(self, key: Hashable) -> Bounds:
+        min_x, min_y, max_x, max_y = self._bounds[:, self._rows[key]].tolist()
+        return (min_x, min_y, max_x, max_y)
+
+    def _rebuild(self) -> None:
+        self._dirty = False
+        count = self._count
+        columns = self._columns = self._bounds[:, :count]
+        ranges = self._cellRanges = np.floor(columns * self._inverseCellSize).astype(np.int64)
+        if not count:
+            self._entryCells = self._entryRows = np.empty(0, dtype=np.int64)
+            return
+        min_x, min_y, max_x, max_y = ranges
+        origin_x, origin_y = int(min_x.min()), int(min_y.min())
+        cells_x, cells_y = int(max_x.max()) - origin_x + 1, int(max_y.max()) - origin_y + 1
+        self._origin = (origin_x, origin_y, cells_x, cells_y)
+
+        # Each row covers the cells first + dx * cells_y + dy, for dx and dy up to its width and height in cells
+        first = (min_x - origin_x) * cells_y + (min_y - origin_y)
+        width, height = max_x - min_x, max_y - min_y
+        limit = SpatialHash.OFFSET_CELLS
+        small = (width < limit) & (height < limit)
+        allSmall = bool(small.all())
+        cells, rows = [], []
+        for dx in range(min(int(width.max()), limit - 1) + 1):
+            for dy in range(min(int(height.max()), limit - 1) + 1):
+                if dx == 0 and dy == 0:
+                    covered = np.arange(count) if allSmall else np.flatnonzero(small)
+                else:
+                    covered = np.flatnonzero(small & (width >= dx) & (height >= dy))
+                cells.append(first[covered] + (dx * cells_y + dy))
+                rows.append(covered)
+        if not allSmall:
+            large = np.flatnonzero(~small)
+            perColumn = height[large] + 1
+            counts = (width[large] + 1) * perColumn
+            local = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+            perColumn = np.repeat(perColumn, counts)
+            cells.append(np.repeat(first[large], counts) + local // perColumn * cells_y + local % perColumn)
+            rows.append(np.repeat(large, counts))
+        cells, rows = np.concatenate(cells), np.concatenate(rows)
+
+        bits = count.bit_length()
+        if cells_x * cells_y < 1 << (62 - bits):
+            # Row packed into the low bits, so a plain sort orders the entries by cell
+            packed = np.sort((cells << bits) | rows)
+            self._entryCells = packed >> bits
+            self._entryRows = packed & ((1 << bits) - 1)
+        else:
+            order = np.argsort(cells)
+            self._entryCells = cells[order]
+            self._entryRows = rows[order]
+
+    def queryPairs(self) -> list[tuple[Hashable, Hashable]]:
+        """Returns every pair of keys whose AABBs overlap, each pair exactly once."""
+        if self._dirty:
+            self._rebuild()
+        cells, rows = self._entryCells, self._entryRows
+        # Entries of one cell are consecutive; pass k pairs every entry with the one k places further in its cell
+        firsts, seconds, pairCells = [], [], []
+        index = np.flatnonzero(cells[:-1] == cells[1:])
+        offset = 1
+        while len(index):
+            firsts.append(rows[index])
+            seconds.append(rows[index + offset])
+            pairCells.append(cells[index])
+            offset += 1
+            index = index[index + offset < len(cells)]
+            index = index[cells[index] == cells[index + offset]]
+        if not firsts:
+            return []
+        a, b, pairCell = np.concatenate(firsts), np.concatenate(seconds), np.concatenate(pairCells)
+
+        # Report a pair only from the cell holding the overlap's lower-left corner
+        min_x, min_y = self._cellRanges[0], self._cellRanges[1]
+        origin_x, origin_y, _, cells_y = self._origin
+        owned = (np.maximum(min_x[a], min_x[b]) - origin_x) * cells_y + (np.maximum(min_y[a], min_y[b]) - origin_y) == pairCell
+        a, b = a[owned], b[owned]
+        left, bottom, right, top = self._columns
+        overlap = (np.maximum(left[a], left[b]) <= np.minimum(right[a], right[b])) & \
+                  (np.maximum(bottom[a], bottom[b]) <= np.minimum(top[a], top[b]))
+        return list(zip(self._keys[a[overlap]].tolist(), self._keys[b[overlap]].tolist()))
+
+    def _queryRows(self, bounds: Bounds) -> np.ndarray:
+        """Rows whose AABB overlaps bounds."""
+        if self._dirty:
+            self._rebuild()
+        count = self._count
+        if not count:
+            return np.empty(0, dtype=np.int64)
+        min_x, min_y, max_x, max_y = bounds
+        inv = self._inverseCellSize
+        origin_x, origin_y, cells_x, cells_y = self._origin
+        # Query cells, clipped to the grid
+        x0, x1 = max(floor(min_x * inv) - origin_x, 0), min(floor(max_x * inv) - origin_x, cells_x - 1)
+        y0, y1 = max(floor(min_y * inv) - origin_y, 0), min(floor(max_y * inv) - origin_y, cells_y - 1)
+        if x0 > x1 or y0 > y1:
+            return np.empty(0, dtype=np.int64)
+        # The query's cells of one grid column are consecutive cell numbers
+        columns = np.arange(x0, x1 + 1) * cells_y
+        starts = np.searchsorted(self._entryCells, columns + y0).tolist()
+        ends = np.searchsorted(self._entryCells, columns + y1, "right").tolist()
+        if sum(ends) - sum(starts) >= count:
+            candidates = np.arange(count)
+        else:
+            rows = self._entryRows
+            candidates = np.unique(np.concatenate([rows[start:end] for start, end in zip(starts, ends)]))
+        left, bottom, right, top = self._columns[:, candidates]
+        return candidates[(left <= max_x) & (min_x <= right) & (bottom <= max_y) & (min_y <= top)]
+
+    def queryBox(self, bounds: Bounds) -> list[Hashable]:
+        """Returns every key whose AABB overlaps bounds."""
+        return self._keys[self._queryRows(bounds)].tolist()
+
+    def queryCircle(self, center_x: float, center_y: float, radius: float) -> list[Hashable]:
+        """Returns every key whose AABB intersects the circle."""
+        rows = self._queryRows((center_x - radius, center_y - radius, center_x + radius, center_y + radius))
+        left, bottom, right, top = self._columns[:, rows]
+        dx = center_x - np.maximum(left, np.minimum(center_x, right))
+        dy = center_y - np.maximum(bottom, np.minimum(center_y, top))
+        return self._keys[rows[dx * dx + dy * dy <= radius * radius]].tolist()
+
+    def queryPoint(self, x: float, y: float) -> list[Hashable]:
+        """Returns every key whose AABB contains the point."""
+        return self._keys[self._queryRows((x, y, x, y))].tolist()
+
+
+def _union(a: Bounds, b: Bounds) -> Bounds:
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _perimeter(bounds: Bounds) -> float:
+    return 2.0 * ((bounds[2] - bounds[0]) + (bounds[3] - bounds[1]))
+
+
+def _raySlab(origin_x: float, origin_y: float, inv_x: float, inv_y: float, bounds: Bounds) -> tuple[float, float, int]:
+    """Entry distance, exit distance and entry axis (0 = x, 1 = y) of a ray through bounds. inv_* is inf on a zero axis."""
+    if inv_x == inf:
+        if origin_x < bounds[0] or origin_x > bounds[2]:
+            return inf, -inf, 0
+        tx_min, tx_max = -inf, inf
+    else:
+        t1 = (bounds[0] - origin_x) * inv_x
+        t2 = (bounds[2] - origin_x) * inv_x
+        tx_min, tx_max = (t1, t2) if t1 < t2 else (t2, t1)
+    if inv_y == inf:
+        if origin_y < bounds[1] or origin_y > bounds[3]:
+            return inf, -inf, 1
+        ty_min, ty_max = -inf, inf
+    else:
+        t1 = (bounds[1] - origin_y) * inv_y
+        t2 = (bounds[3] - origin_y) * inv_y
+        ty_min, ty_max = (t1, t2) if t1 < t2 else (t2, t1)
+    if tx_min > ty_min:
+        return tx_min, min(tx_max, ty_max), 0
+    return ty_min, min(tx_max, ty_max), 1
+
+
+class AABBTree:
+    """
+    Dynamic bounding-volume hierarchy over AABBs. Leaves store fattened bounds so that small movements don't
+    restructure the tree; nodes are kept balanced with AVL-style rotations. Node data lives in parallel lists.
+    """
+
+    NULL = -1
+
+    def __init__(self, margin: float = 0.1):
+        self.margin = margin
+        self.root = AABBTree.NULL
+        self._bounds: list[Bounds] = []
+        self._tight: list[Bounds] = []
+        self._parent: list[int] = []
+        self._child1: list[int] = []
+        self._child2: list[int] = []
+        self._height: list[int] = []
+        self._data: list[Any] = []
+        self._free: list[int] = []
+        self._leafCount = 0
+
+    def __len__(self) -> int:
+        return self._leafCount
+
+    def _allocate(self) -> int:
+        if self._free:
+            node = self._free.pop()
+        else:
+            node = len(self._bounds)
+            self._bounds.append((0.0, 0.0, 0.0, 0.0))
+            self._tight.append((0.0, 0.0, 0.0, 0.0))
+            self._parent.append(AABBTree.NULL)
+            self._child1.append(AABBTree.NULL)
+            self._child2.append(AABBTree.NULL)
+            self._height.append(0)
+            self._data.append(None)
+        self._parent[node] = self._child1[node] = self._child2[node] = AABBTree.NULL
+        self._height[node] = 0
+        return node
+
+    def _release(self, node: int) -> None:
+        self._data[node] = None
+        self._height[node] = -1
+        self._free.append(node)
+
+    def isLeaf(self, node: int) -> bool:
+        return self._child1[node] == AABBTree.NULL
+
+    def getData(self, proxy: int) -> Any:
+        return self._data[proxy]
+
+    def getBounds(self, proxy: int) -> Bounds:
+        """The exact bounds a proxy was last inserted or moved with."""
+        return self._tight[proxy]
+
+    def insert(self, data: Any, bounds: Bounds) -> int:
+        """Adds a leaf and returns its proxy id."""
+        proxy = self._allocate()
+        m = self.margin
+        self._tight[proxy] = bounds
+        self._bounds[proxy] = (bounds[0] - m, bounds[1] - m, bounds[2] + m, bounds[3] + m)
+        self._data[proxy] = data
+        self._insertLeaf(proxy)
+        self._leafCount += 1
+        return proxy
+
+    def remove(self, proxy: int) -> None:
+        self._removeLeaf(proxy)
+        self._release(proxy)
+        self._leafCount -= 1
+
+    def move(self, proxy: int, bounds: Bounds) -> bool:
+        """Updates a leaf's bounds. The tree is only restructured (and True returned) if they left the fat bounds."""
+        self._tight[proxy] = bounds
+        fat = self._bounds[proxy]
+        if fat[0] <= bounds[0] and fat[1] <= bounds[1] and bounds[2] <= fat[2] and bounds[3] <= fat[3]:
+            return False
+        self._removeLeaf(proxy)
+        m = self.margin
+        self._bounds[proxy] = (bounds[0] - m, bounds[1] - m, bounds[2] + m, bounds[3] + m)
+        self._insertLeaf(proxy)
+        return True
+
+    def _insertLeaf(self, leaf: int) -> None:
+        if self.root == AABBTree.NULL:
+            self.root = leaf
+            self._parent[leaf] = AABBTree.NULL
+            return
+
+        bounds, child1, child2 = self._bounds, self._child1, self._child2
+        leaf_bounds = bounds[leaf]
+
+        # Descend towards the sibling with the cheapest perimeter increase
+        index = self.root
+        while child1[index] != AABBTree.NULL:
+            area = _perimeter(bounds[index])
+            combined_area = _perimeter(_union(bounds[index], leaf_bounds))
+            cost = 2.0 * combined_area
+            inheritance_cost = 2.0 * (combined_area - area)
+
+            costs = []
+            for child in (child1[index], child2[index]):
+                child_cost = _perimeter(_union(leaf_bounds, bounds[child])) + inheritance_cost
+                if child1[child] != AABBTree.NULL:
+                    child_cost -= _perimeter(bounds[child])
+                costs.append(child_cost)
+
+            if cost < costs[0] and cost < costs[1]:
+                break
+            index = child1[index] if costs[0] < costs[1] else child2[index]
+
+        sibling = index
+        old_parent = self._parent[sibling]
+        new_parent = self._allocate()
+        self._parent[new_parent] = old_parent
+        bounds[new_parent] = _union(leaf_bounds, bounds[sibling])
+        self._height[new_parent] = self._height[sibling] + 1
+
+        if old_parent != AABBTree.NULL:
+            if child1[old_parent] == sibling:
+                child1[old_parent] = new_parent
+            else:
+                child2[old_parent] = new_parent
+        else:
+            self.root = new_parent
+        child1[new_parent] = sibling
+        child2[new_parent] = leaf
+        self._parent[sibling] = new_parent
+        self._parent[leaf] = new_parent
+
+        self._refitFrom(self._parent[leaf])
+
+    def _removeLeaf(self, leaf: int) -> None:
+        if leaf == self.root:
+            self.root = AABBTree.NULL
+            return
+
+        parent = self._parent[leaf]
+        grand_parent = self._parent[parent]
+        sibling = self._child2[parent] if self._child1[parent] == leaf else self._child1[parent]
+
+        if grand_parent != AABBTree.NULL:
+            if self._child1[grand_parent] == parent:
+                self._child1[grand_parent] = sibling
+            else:
+                self._child2[grand_parent] = sibling
+            self._parent[sibling] = grand_parent
+            self._release(parent)
+            self._refitFrom(grand_parent)
+        else:
+            self.root = sibling
+            self._parent[sibling] = AABBTree.NULL
+            self._release(parent)
+
+    def _refitFrom(self, index: int) -> None:
+        """Rebalances and refits every ancestor from index up to the root."""
+        bounds, height = self._bounds, self._height
+        while index != AABBTree.NULL:
+            index = self._balance(index)
+            child1, child2 = self._child1[index], self._child2[index]
+            height[index] = 1 + max(height[child1], height[child2])
+            bounds[index] = _union(bounds[child1], bounds[child2])
+            index = self._parent[index]
+
+    def _replaceChild(self, parent: int, old: int, new: int) -> None:
+        if parent == AABBTree.NULL:
+            self.root = new
+        elif self._child1[parent] == old:
+            self._child1[parent] = new
+        else:
+            self._child2[parent] = new
+
+    def _balance(self, a: int) -> int:
+        """Rotates the taller child of a up if the subtree is unbalanced; returns the subtree's new root."""
+        child1, child2, parent, height, bounds = self._child1, self._child2, self._parent, self._height, self._bounds
+        if child1[a] == AABBTree.NULL or height[a] < 2:
+            return a
+
+        b, c = child1[a], child2[a]
+        balance = height[c] - height[b]
+
+        if balance > 1:
+            f, g = child1[c], child2[c]
+            child1[c] = a
+            parent[c] = parent[a]
+            parent[a] = c
+            self._replaceChild(parent[c], a, c)
+            if height[f] > height[g]:
+                child2[c] = f
+                child2[a] = g
+                parent[g] = a
+                bounds[a] = _union(bounds[b], bounds[g])
+                bounds[c] = _union(bounds[a], bounds[f])
+                height[a] = 1 + max(height[b], height[g])
+                height[c] = 1 + max(height[a], height[f])
+            else:
+                child2[c] = g
+                child2[a] = f
+                parent[f] = a
+                bounds[a] = _union(bounds[b], bounds[f])
+                bounds[c] = _union(bounds[a], bounds[g])
+                height[a] = 1 + max(height[b], height[f])
+                height[c] = 1 + max(height[a], height[g])
+            return c
+
+        if balance < -1:
+            d, e = child1[b], child2[b]
+            child1[b] = a
+            parent[b] = parent[a]
+            parent[a] = b
+            self._replaceChild(parent[b], a, b)
+            if height[d] > height[e]:
+                child2[b] = d
+                child1[a] = e
+                parent[e] = a
+                bounds[a] = _union(bounds[c], bounds[e])
+                bounds[b] = _union(bounds[a], bounds[d])
+                height[a] = 1 + max(height[c], height[e])
+                height[b] = 1 + max(height[a], height[d])
+            else:
+                child2[b] = e
+                child1[a] = d
+                parent[d] = a
+                bounds[a] = _union(bounds[c], bounds[d])
+                bounds[b] = _union(bounds[a], bounds[e])
+                height[a] = 1 + max(height[c], height[d])
+                height[b] = 1 + max(height[a], height[e])
+            return b
+
+        return a
+
+    def query(self, query_bounds: Bounds) -> list[Any]:
+        """Returns the data of every leaf whose exact bounds overlap query_bounds."""
+        result = []
+        if self.root == AABBTree.NULL:
+            return result
+        min_x, min_y, max_x, max_y = query_bounds
+        bounds, tight, child1, child2 = self._bounds, self._tight, self._child1, self._child2
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            b = bounds[node]
+            if b[0] > max_x or min_x > b[2] or b[1] > max_y or min_y > b[3]:
+                continue
+            if child1[node] == AABBTree.NULL:
+                t = tight[node]
+                if t[0] <= max_x and min_x <= t[2] and t[1] <= max_y and min_y <= t[3]:
+                    result.append(self._data[node])
+            else:
+                stack.append(child1[node])
+                stack.append(child2[node])
+        return result
+
+    def raycast(self, origin_x: float, origin_y: float, direction_x: float, direction_y: float,
+                max_distance: float = inf, all_hits: bool = False) -> list[tuple[int, float, int]]:
+        """
+        Casts a ray with a normalized direction. Returns (proxy, distance, entry axis) for the closest hit, or for
+        every hit (closest first) when all_hits is set. A ray starting inside a box hits it at distance 0.
+        """
+        if self.root == AABBTree.NULL:
+            return []
+        inv_x = 1.0 / direction_x if direction_x != 0 else inf
+        inv_y = 1.0 / direction_y if direction_y != 0 else inf
+        if not all_hits:
+            hit = self._raycastFrom(self.root, origin_x, origin_y, inv_x, inv_y, max_distance)
+            return [hit] if hit is not None else []
+
+        hits = []
+        bounds, tight, child1, child2 = self._bounds, self._tight, self._child1, self._child2
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            leaf = child1[node] == AABBTree.NULL
+            t_min, t_max, axis = _raySlab(origin_x, origin_y, inv_x, inv_y, tight[node] if leaf else bounds[node])
+            if t_max < 0 or t_min > t_max or t_min > max_distance:
+                continue
+            if leaf:
+                hits.append((node, max(t_min, 0.0), axis))
+            else:
+                stack.append(child1[node])
+                stack.append(child2[node])
+        hits.sort(key=lambda hit: hit[1])
+        return hits
+
+
+    # Rays per packet below which raycastMany falls back to one traversal per ray
+    PACKET_MIN_RAYS = 64
+
+    def raycastMany(self, origins: np.ndarray, directions: np.ndarray, max_distance: float = inf) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Closest hit of every ray in (N, 2) origins/normalized directions. Rays are traversed together as packets,
+        one vectorized slab test per node. Returns (proxy or -1, distance, entry axis) arrays.
+        """
+        count = len(origins)
+        hit_proxy = np.full(count, AABBTree.NULL, dtype=np.int64)
+        hit_distance = np.full(count, max_distance, dtype=np.float64)
+        hit_axis = np.zeros(count, dtype=np.int8)
+        if self.root == AABBTree.NULL or count == 0:
+            return hit_proxy, hit_distance, hit_axis
+
+        origins = np.asarray(origins, dtype=np.float64)
+        directions = np.asarray(directions, dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            inverse = 1.0 / directions
+
+        def slab(rays: np.ndarray, b: Bounds) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+            o = origins[rays]
+            inv = inverse[rays]
+            with np.errstate(invalid="ignore"):
+                t1 = (np.array(b[:2]) - o) * inv
+                t2 = (np.array(b[2:]) - o) * inv
+            # A zero direction component gives nan (0 * inf) when the origin lies on the slab; treat it as inside
+            near = np.where(np.isnan(t1), -inf, np.minimum(t1, t2))
+            far = np.where(np.isnan(t2), inf, np.maximum(t1, t2))
+            axis = near[:, 1] > near[:, 0]
+            return near.max(axis=1), far.min(axis=1), axis
+
+        bounds, tight, child1, child2 = self._bounds, self._tight, self._child1, self._child2
+        stack = [(self.root, np.arange(count))]
+        while stack:
+            node, rays = stack.pop()
+            if len(rays) < AABBTree.PACKET_MIN_RAYS:
+                for ray in rays.tolist():
+                    direction_x, direction_y = directions[ray]
+                    hit = self._raycastFrom(node, float(origins[ray, 0]), float(origins[ray, 1]),
+                                            1.0 / direction_x if direction_x != 0 else inf,
+                                            1.0 / direction_y if direction_y != 0 else inf, float(hit_distance[ray]))
+                    if hit is not None:
+                        hit_proxy[ray], hit_distance[ray], hit_axis[ray] = hit
+                continue
+
+            t_min, t_max, axis = slab(rays, bounds[node] if child1[node] != AABBTree.NULL else tight[node])
+            mask = (t_max >= 0) & (t_min <= t_max) & (np.maximum(t_min, 0.0) <= hit_distance[rays])
+            rays = rays[mask]
+            if len(rays) == 0:
+                continue
+            if child1[node] != AABBTree.NULL:
+                stack.append((child1[node], rays))
+                stack.append((child2[node], rays))
+                continue
+            distance = np.maximum(t_min[mask], 0.0)
+            closer = distance < hit_distance[rays]
+            rays = rays[closer]
+            hit_proxy[rays] = node
+            hit_distance[rays] = distance[closer]
+            hit_axis[rays] = axis[mask][closer]
+        return hit_proxy, hit_distance, hit_axis
+
+    def _raycastFrom(self, start: int, origin_x: float, origin_y: float, inv_x: float, inv_y: float,
+                     best: float) -> Optional[tuple[int, float, int]]:
+        """Closest leaf hit below start, visiting the nearer child first so that best shrinks early."""
+        bounds, tight, child1, child2 = self._bounds, self._tight, self._child1, self._child2
+        result = None
+        t_min, t_max, _ = _raySlab(origin_x, origin_y, inv_x, inv_y, bounds[start])
+        if t_max < 0 or t_min > t_max or t_min > best:
+            return None
+        stack = [(start, t_min)]
+        while stack:
+            node, entry = stack.pop()
+            if entry > best:
+                continue
+            if child1[node] == AABBTree.NULL:
+                t_min, t_max, axis = _raySlab(origin_x, origin_y, inv_x, inv_y, tight[node])
+                if t_max < 0 or t_min > t_max:
+                    continue
+                distance = max(t_min, 0.0)
+                if distance < best:
+                    best = distance
+                    result = (node, distance, axis)
+                continue
+
+            near = []
+            for child in (child1[node], child2[node]):
+                t_min, t_max, _ = _raySlab(origin_x, origin_y, inv_x, inv_y, bounds[child])
+                if t_max >= 0 and t_min <= t_max and t_min <= best:
+                    near.append((child, t_min))
+            if len(near) == 2 and near[0][1] < near[1][1]:
+                near.reverse()
+            stack.extend(near)
+        return result
+
+
+class PhysicsWorld:
+    """
+    Per-scene collision state: every BoxCollider of the scene is registered in the spatial-hash broadphase
+    (pairs and overlap queries) and in the bounding-volume hierarchy (raycasts).
+    """
+
+    def __init__(self, cellSize: float = 1.0, treeMargin: float = 0.1):
+        self.broadphase = SpatialHash(cellSize)
+        self.tree = AABBTree(treeMargin)
+        self._proxies: dict["BoxCollider", int] = {}
+
+    def register(self, collider: "BoxCollider") -> None:
+        bounds = collider.getBounds()
+        self.broadphase.insert(collider, bounds)
+        self._proxies[collider] = self.tree.insert(collider, bounds)
+
+    def unregister(self, collider: "BoxCollider") -> None:
+        self.broadphase.remove(collider)
+        proxy = self._proxies.pop(collider, None)
+        if proxy is not None:
+            self.tree.remove(proxy)
+
+    def refresh(self, collider: "BoxCollider", bounds: Bounds) -> None:
+        self.broadphase.update(collider, bounds)
+        self.tree.move(self._proxies[collider], bounds)
+
+    def _makeHit(self, proxy: int, origin_x: float, origin_y: float, direction_x: float, direction_y: float,
+                 distance: float, axis: int) -> "RaycastHit":
+        if distance == 0.0:
+            normal = Vector2(-direction_x, -direction_y)
+        elif axis == 0:
+            normal = Vector2(-1.0 if direction_x > 0 else 1.0, 0.0)
+        else:
+            normal = Vector2(0.0, -1.0 if direction_y > 0 else 1.0)
+        point = Vector2(origin_x + direction_x * distance, origin_y + direction_y * distance)
+        return RaycastHit(self.tree.getData(proxy), point, normal, distance)
+
+    def raycast(self, origin: Vector2, direction: Vector2, maxDistance: float = inf, allHits: bool = False) -> list["RaycastHit"]:
+        direction = direction.normalized()
+        return [self._makeHit(proxy, origin.x, origin.y, direction.x, direction.y, distance, axis)
+                for proxy, distance, axis in self.tree.raycast(origin.x, origin.y, direction.x, direction.y, maxDistance, allHits)]
+
+
+class RaycastHit:
+    __slots__ = ("collider", "gameObject", "point", "normal", "distance")
+
+    def __init__(self, collider: "BoxCollider", point: Vector2, normal: Vector2, distance: float):
+        self.collider = collider
+        self.gameObject: GameObject = collider.gameObject
+        self.point = point
+        self.normal = normal
+        self.distance = distance
+
+    def __str__(self) -> str:
+        return f"RaycastHit({self.gameObject.name}, {self.point}, {self.normal}, {self.distance})"
+
+
+class BoxCollider(Component):
+    """Axis-aligned box around the GameObject. size is in local units, so the default (1, 1) matches a sprite's quad."""
+    serializedFields = ("size", "offset")
+
+    def __init__(self, gameObject: GameObject, size: Optional[Vector2] = None, offset: Optional[Vector2] = None):
+        super().__init__(gameObject)
+        self.size: Vector2 = size if size is not None else Vector2(1, 1)
+        self.offset: Vector2 = offset if offset is not None else Vector2(0, 0)
+        self._world: Optional[PhysicsWorld] = None
+        self._bounds: Optional[Bounds] = None
+
+    def getBounds(self) -> Bounds:
+        """World-space AABB of the (possibly rotated) box."""
+        a, b, tx, c, d, ty = self.gameObject.transform.getAffine()
+        half_w = 0.5 * self.size.x
+        half_h = 0.5 * self.size.y
+        center_x = tx + a * self.offset.x + b * self.offset.y
+        center_y = ty + c * self.offset.x + d * self.offset.y
+        extent_x = abs(a) * half_w + abs(b) * half_h
+        extent_y = abs(c) * half_w + abs(d) * half_h
+        return (center_x - extent_x, center_y - extent_y, center_x + extent_x, center_y + extent_y)
+
+    def update(self):
+        scene = self.gameObject.scene
+        if scene is None:
+            return
+        bounds = self.getBounds()
+        if self._world is None:
+            self._world = Physics.getWorld(scene)
+            self._world.register(self)
+        elif bounds != self._bounds:
+            self._world.refresh(self, bounds)
+        self._bounds = bounds
+
+    def onDisable(self):
+        # Despawned: leave the world, the next update after a spawn registers again
+        self.onDestroy()
+
+    def onDestroy(self):
+        if self._world is not None:
+            self._world.unregister(self)
+            self._world = None
+            self._bounds = None
+
 
 class Physics:
+    _worlds: "weakref.WeakKeyDictionary[Scene, PhysicsWorld]" = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def getWorld(scene: Optional[Scene] = None) -> PhysicsWorld:
+        """Returns the collision world of scene, defaulting to the currently loaded scene."""
+        if scene is None:
+            scene = SceneManager.getScene()
+            if scene is None:
+                raise RuntimeError("No scene is loaded; load one with SceneManager.loadScene or pass it explicitly.")
+        world = Physics._worlds.get(scene)
+        if world is None:
+            world = Physics._worlds[scene] = PhysicsWorld()
+        return world
+
+    @staticmethod
+    def getOverlappingPairs(scene: Optional[Scene] = None) -> list[tuple[BoxCollider, BoxCollider]]:
+        """Every pair of colliders whose AABBs currently overlap."""
+        return Physics.getWorld(scene).broadphase.queryPairs()  # type: ignore[return-value]
+
+    @staticmethod
+    def overlapBox(center: Vector2, size: Vector2, scene: Optional[Scene] = None) -> list[BoxCollider]:
+        half_w, half_h = abs(size.x) * 0.5, abs(size.y) * 0.5
+        return Physics.getWorld(scene).broadphase.queryBox(
+            (center.x - half_w, center.y - half_h, center.x + half_w, center.y + half_h))  # type: ignore[return-value]
+
+    @staticmethod
+    def overlapCircle(center: Vector2, radius: float, scene: Optional[Scene] = None) -> list[BoxCollider]:
+        return Physics.getWorld(scene).broadphase.queryCircle(center.x, center.y, radius)  # type: ignore[return-value]
+
+    @staticmethod
+    def overlapPoint(point: Vector2, scene: Optional[Scene] = None) -> list[BoxCollider]:
+        return Physics.getWorld(scene).broadphase.queryPoint(point.x, point.y)  # type: ignore[return-value]
+
     class Collisions:
         @staticmethod
         def boxColission(pos1: Vector2, scale1: Vector2, pos2: Vector2, scale2: Vector2):
@@ -10,4 +771,32 @@ class Physics:
                 abs(pos1.y - pos2.y) * 2 < (scale1.y + scale2.y)
             )
     class Raycast:
-        pass 
\ No newline at end of file
+        @staticmethod
+        def cast(origin: Vector2, direction: Vector2, maxDistance: float = inf, scene: Optional[Scene] = None) -> Optional[RaycastHit]:
+            """Returns the first collider hit by the ray, or None."""
+            hits = Physics.getWorld(scene).raycast(origin, direction, maxDistance)
+            return hits[0] if hits else None
+
+        @staticmethod
+        def castAll(origin: Vector2, direction: Vector2, maxDistance: float = inf, scene: Optional[Scene] = None) -> list[RaycastHit]:
+            """Returns every collider hit by the ray, closest first."""
+            return Physics.getWorld(scene).raycast(origin, direction, maxDistance, allHits=True)
+
+        @staticmethod
+        def raycastMany(origins: "Vector2Array | np.ndarray", directions: "Vector2Array | np.ndarray",
+                        maxDistance: float = inf, scene: Optional[Scene] = None) -> list[Optional[RaycastHit]]:
+            """First hit of every ray, given (N, 2) arrays of origins and directions. Misses are None."""
+            world = Physics.getWorld(scene)
+            origins = origins.data if isinstance(origins, Vector2Array) else np.asarray(origins)
+            directions = directions.data if isinstance(directions, Vector2Array) else np.asarray(directions)
+            directions = np.asarray(directions, dtype=np.float64)
+            lengths = np.sqrt(np.einsum("ij,ij->i", directions, directions))
+            directions = directions / np.where(lengths == 0, 1.0, lengths)[:, None]
+
+            proxies, distances, axes = world.tree.raycastMany(origins, directions, maxDistance)
+            results: list[Optional[RaycastHit]] = [None] * len(proxies)
+            for ray in np.flatnonzero(proxies != AABBTree.NULL).tolist():
+                results[ray] = world._makeHit(int(proxies[ray]), float(origins[ray][0]), float(origins[ray][1]),
+                                              float(directions[ray][0]), float(directions[ray][1]),
+                                              float(distances[ray]), int(axes[ray]))
+            return results
@@ -0,0 +1,105 @@
+from collections import deque
+from time import perf_counter, sleep
+
+
+class FrameStats:
+    """Rolling window of recent frame times, in seconds."""
+
+    def __init__(self, capacity: int = 240):
+        self.frameTimes: deque[float] = deque(maxlen=capacity)
+
+    def add(self, frameTime: float) -> None:
+        self.frameTimes.append(frameTime)
+
+    def clear(self) -> None:
+        self.frameTimes.clear()
+
+    @property
+    def count(self) -> int:
+        return len(self.frameTimes)
+
+    @property
+    def mean(self) -> float:
+        return sum(self.frameTimes) / len(self.frameTimes) if self.frameTimes else 0.0
+
+    @property
+    def max(self) -> float:
+        return max(self.frameTimes, default=0.0)
+
+    @property
+    def p99(self) -> float:
+        """99th percentile frame time."""
+        if not self.frameTimes:
+            return 0.0
+        ordered = sorted(self.frameTimes)
+        return ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]
+
+    @property
+    def jitter(self) -> float:
+        """Standard deviation of the frame time."""
+        count = len(self.frameTimes)
+        if count < 2:
+            return 0.0
+        mean = self.mean
+        return (sum((t - mean) ** 2 for t in self.frameTimes) / (count - 1)) ** 0.5
+
+    @property
+    def fps(self) -> float:
+        mean = self.mean
+        return 1.0 / mean if mean > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (f"FrameStats(mean={self.mean * 1000:.2f}ms, p99={self.p99 * 1000:.2f}ms, "
+                f"jitter={self.jitter * 1000:.3f}ms, fps={self.fps:.1f})")
+
+
+class FixedTimestep:
+    """Accumulates frame time and hands it out in whole fixed steps."""
+
+    def __init__(self):
+        self.accumulator = 0.0
+
+    def advance(self, deltaTime: float, step: float, maxSteps: int) -> int:
+        """Adds deltaTime and returns how many fixed steps are due. Time beyond maxSteps is dropped, not carried."""
+        self.accumulator += deltaTime
+        steps = int(self.accumulator // step)
+        if steps > maxSteps:
+            steps = maxSteps
+            self.accumulator = step * maxSteps + self.accumulator % step
+        self.accumulator -= steps * step
+        return steps
+
+    def alpha(self, step: float) -> float:
+        """How far the simulation is into the next fixed step, for interpolating rendered state."""
+        return self.accumulator / step
+
+
+class FramePacer:
+    """
+    Holds frames to a target duration against absolute deadlines, so time spent inside the frame counts towards
+    it. Sleeps until spinThreshold before the deadline, then spins on the clock for the remainder.
+    """
+
+    def __init__(self, spinThreshold: float = 0.002):
+        self.spinThreshold = spinThreshold
+        self._deadline = 0.0
+
+    def reset(self) -> None:
+        self._deadline = 0.0
+
+    def wait(self, frameTime: float) -> None:
+        if frameTime <= 0:
+            self._deadline = 0.0
+            return
+
+        now = perf_counter()
+        deadline = self._deadline + frameTime
+        if self._deadline == 0.0 or deadline < now - frameTime:
+            # First frame, or more than a frame behind: resynchronize instead of rushing to catch up
+            deadline = now
+        remaining = deadline - now
+        if remaining > self.spinThreshold:
+            sleep(remaining - self.spinThreshold)
+        while perf_counter() < deadline:
+            pass
+        self._deadline = deadline
@@ -1,5 +1,6 @@
 from ..essentials import Vector2
 from OpenGL.GL import *
+from ..graphics.glstate import GLState
 
 class UIElement:
     def __init__(self, position: Vector2, size: Vector2):
@@ -29,6 +30,7 @@ class UIManager:
         self.elements.append(element)
 
     def draw(self):
+        GLState.useFixedFunction()
         for element in self.elements:
             element.draw()
 
@@ -0,0 +1,5 @@
+"""
+Engine benchmarks. `python -m benchmarks run` times the registered suites and can write a JSON report,
+`python -m benchmarks compare base.json head.json` flags regressions between two reports. The standalone scripts
+(vector_ops, broadphase, raycast) compare an optimized path against its naive baseline.
+"""
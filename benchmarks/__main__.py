@@ -0,0 +1,61 @@
+import argparse
+import sys
+
+from . import harness
+
+
+def run(arguments) -> int:
+    from . import suites  # noqa: F401  (registers the cases)
+
+    if arguments.list:
+        for case in harness.CASES:
+            print(f"{case.name:<44} {case.group}{'  (heavy)' if case.heavy else ''}")
+        return 0
+
+    report = harness.run(arguments.filter, arguments.quick, arguments.warmup, arguments.repeats)
+    if arguments.output:
+        harness.save(report, arguments.output)
+        print(f"wrote {len(report['results'])} results to {arguments.output}")
+    return 0
+
+
+def compare(arguments) -> int:
+    base, head = harness.load(arguments.base), harness.load(arguments.head)
+    rows = harness.compare(base, head, arguments.threshold)
+    print(f"{'benchmark':<44}{'base':>14}{'head':>14}{'ratio':>8}  status")
+    for row in rows:
+        print(f"{row['name']:<44}{harness.format_time(row['base']):>14}{harness.format_time(row['head']):>14}"
+              f"{row['ratio']:>8.2f}  {row['status']}")
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {arguments.threshold:.0%}")
+        return 1 if arguments.fail_on_regression else 0
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="AuroraEngine benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="time the benchmark cases")
+    run_parser.add_argument("-k", "--filter", help="only cases whose name contains this text")
+    run_parser.add_argument("--quick", action="store_true", help="skip the heavy (100k object) cases")
+    run_parser.add_argument("--warmup", type=int, default=2, help="untimed samples before measuring")
+    run_parser.add_argument("--repeats", type=int, default=10, help="timed samples per case")
+    run_parser.add_argument("-o", "--output", help="write the JSON report here")
+    run_parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="compare two JSON reports")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("head")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown that counts as a regression")
+    compare_parser.add_argument("--fail-on-regression", action="store_true", help="exit with status 1 on any regression")
+    compare_parser.set_defaults(handler=compare)
+
+    arguments = parser.parse_args()
+    return arguments.handler(arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Benchmark registry, timing and comparison shared by the suite modules and the command line in __main__.
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+
+class SkipBenchmark(Exception):
+    """Raised by a case's setup when it cannot run here, e.g. no offscreen GL context."""
+
+
+@dataclass
+class Case:
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], None]]  # Builds the state and returns the function to time
+    number: int = 1  # Calls of the timed function per sample
+    heavy: bool = False  # Left out of --quick runs
+    params: dict = field(default_factory=dict)
+
+
+CASES: list[Case] = []
+
+
+def register(name: str, group: str, setup: Callable[[], Callable[[], None]], number: int = 1, heavy: bool = False, **params) -> None:
+    if any(case.name == name for case in CASES):
+        raise ValueError(f"Benchmark {name} is registered twice")
+    CASES.append(Case(name, group, setup, number, heavy, params))
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Linearly interpolated percentile of an already sorted list."""
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def measure(function: Callable[[], None], number: int, warmup: int, repeats: int) -> dict:
+    """Seconds per call over `repeats` samples of `number` calls each, after `warmup` untimed samples."""
+    for _ in range(warmup):
+        for _ in range(number):
+            function()
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()  # Collections triggered by earlier samples' garbage would land on random later ones
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            samples.append((time.perf_counter() - start) / number)
+            gc.collect()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    ordered = sorted(samples)
+    return {
+        "median": statistics.median(ordered),
+        "p95": percentile(ordered, 0.95),
+        "mean": statistics.fmean(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "repeats": repeats,
+        "number": number,
+    }
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "numpy": numpy_version,
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def run(pattern: Optional[str] = None, quick: bool = False, warmup: int = 2, repeats: int = 10,
+        log: Callable[[str], None] = print) -> dict:
+    """Runs every registered case whose name contains pattern and returns the JSON-ready report."""
+    results = {}
+    for case in CASES:
+        if pattern and pattern not in case.name:
+            continue
+        if quick and case.heavy:
+            continue
+        try:
+            function = case.setup()
+        except SkipBenchmark as reason:
+            log(f"{case.name:<44} skipped: {reason}")
+            continue
+        stats = measure(function, case.number, warmup, repeats)
+        stats.update(group=case.group, params=case.params)
+        results[case.name] = stats
+        log(f"{case.name:<44} median {format_time(stats['median'])}  p95 {format_time(stats['p95'])}")
+    return {"environment": environment(), "settings": {"warmup": warmup, "repeats": repeats, "quick": quick}, "results": results}
+
+
+def compare(base: dict, head: dict, threshold: float = 0.10) -> list[dict]:
+    """
+    Pairs up the cases of two reports. A case regresses when its median slowed down by more than threshold and the
+    new median is also above the old p95, so run-to-run noise within the old spread is not reported.
+    """
+    rows = []
+    for name, new in head["results"].items():
+        old = base["results"].get(name)
+        if old is None:
+            continue
+        ratio = new["median"] / old["median"] if old["median"] else float("inf")
+        if ratio > 1 + threshold and new["median"] > old["p95"]:
+            status = "regression"
+        elif ratio < 1 - threshold and new["p95"] < old["median"]:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        rows.append({"name": name, "base": old["median"], "head": new["median"], "ratio": ratio, "status": status})
+    return rows
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.3f} {unit}"
+    return f"{seconds / 1e-9:8.1f} ns"
+
+
+def save(report: dict, path: str) -> None:
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+
+
+def load(path: str) -> dict:
+    with open(path) as file:
+        return json.load(file)
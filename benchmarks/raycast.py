@@ -0,0 +1,81 @@
+"""
+Raycast benchmark: first-hit queries against a field of static BoxColliders through the bounding-volume
+hierarchy, one ray at a time and batched with raycastMany, compared to testing every collider per ray.
+
+Run from the repository root: python -m benchmarks.raycast
+"""
+
+import random
+import time
+from math import inf
+
+import numpy as np
+
+from AuroraEngine.essentials import GameObject, Transform, Vector2
+from AuroraEngine.scenes import Scene
+from AuroraEngine.simulation.physics import BoxCollider, Physics, _raySlab
+
+
+def build_scene(count: int, world_size: float, seed: int = 1) -> Scene:
+    rng = random.Random(seed)
+    scene = Scene("Raycast Benchmark")
+    for index in range(count):
+        transform = Transform(Vector2(rng.uniform(0, world_size), rng.uniform(0, world_size)), rng.uniform(0, 90),
+                              Vector2(rng.uniform(0.2, 2), rng.uniform(0.2, 2)))
+        gameObject = GameObject(f"Box{index}", transform)
+        gameObject.addComponent(BoxCollider)
+        scene.instantiate(gameObject)
+    scene.updateScene()
+    return scene
+
+
+def brute_force(colliders: list[BoxCollider], origin: np.ndarray, direction: np.ndarray) -> float:
+    inv_x = 1.0 / direction[0] if direction[0] != 0 else inf
+    inv_y = 1.0 / direction[1] if direction[1] != 0 else inf
+    best = inf
+    for collider in colliders:
+        t_min, t_max, _ = _raySlab(origin[0], origin[1], inv_x, inv_y, collider.getBounds())
+        if t_max >= 0 and t_min <= t_max:
+            best = min(best, max(t_min, 0.0))
+    return best
+
+
+def main(colliders: int = 5_000, rays: int = 500) -> None:
+    world_size = (colliders * 8) ** 0.5
+    start = time.perf_counter()
+    scene = build_scene(colliders, world_size)
+    print(f"built {colliders} colliders in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    rng = np.random.default_rng(2)
+    angles = rng.uniform(0, 2 * np.pi, rays)
+    scattered = (rng.uniform(0, world_size, (rays, 2)), np.stack([np.cos(angles), np.sin(angles)], axis=1))
+    fan_angles = np.linspace(0, np.pi / 6, rays)
+    fan = (np.full((rays, 2), world_size / 2), np.stack([np.cos(fan_angles), np.sin(fan_angles)], axis=1))
+
+    for name, (origins, directions) in (("scattered", scattered), ("fan", fan)):
+        start = time.perf_counter()
+        single = [Physics.Raycast.cast(Vector2(*origin), Vector2(*direction), scene=scene)
+                  for origin, direction in zip(origins, directions)]
+        single_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        batched = Physics.Raycast.raycastMany(origins, directions, scene=scene)
+        batched_ms = (time.perf_counter() - start) * 1000
+
+        checked = min(rays, 50)
+        all_colliders = [gameObject.getComponent(BoxCollider) for gameObject in scene.gameObjects]
+        start = time.perf_counter()
+        expected = [brute_force(all_colliders, origins[ray], directions[ray]) for ray in range(checked)]
+        brute_ms = (time.perf_counter() - start) * 1000 * rays / checked
+        for ray in range(checked):
+            for hits in (single, batched):
+                distance = hits[ray].distance if hits[ray] else inf
+                assert abs(distance - expected[ray]) < 1e-6 or distance == expected[ray]
+
+        hits = sum(hit is not None for hit in batched)
+        print(f"{name:>10}: {rays} rays, {hits} hits | cast {single_ms:.1f} ms | raycastMany {batched_ms:.1f} ms"
+              f" | brute force ~{brute_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""Benchmark cases, grouped by engine area. Importing this package registers all of them with the harness."""
+
+from . import scene, rendering, particles, primitives, collisions, serialization, simulation
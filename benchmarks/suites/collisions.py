@@ -0,0 +1,54 @@
+"""Collision pair tests: the brute-force Physics.Collisions.boxColission loop and the scene broadphase."""
+
+import random
+
+from AuroraEngine.essentials import GameObject, Transform, Vector2
+from AuroraEngine.scenes import Scene
+from AuroraEngine.simulation.physics import BoxCollider, Physics
+
+from ..harness import register
+
+
+def setup_brute_force(count: int):
+    def setup():
+        rng = random.Random(count)
+        side = (count * 4) ** 0.5
+        boxes = [(Vector2(rng.uniform(0, side), rng.uniform(0, side)), Vector2(rng.uniform(0.2, 1), rng.uniform(0.2, 1)))
+                 for _ in range(count)]
+        collide = Physics.Collisions.boxColission
+
+        def pairs():
+            for i in range(count):
+                position, size = boxes[i]
+                for j in range(i + 1, count):
+                    collide(position, size, *boxes[j])
+        return pairs
+    return setup
+
+
+def setup_broadphase(count: int):
+    def setup():
+        rng = random.Random(count)
+        side = (count * 4) ** 0.5
+        scene = Scene(f"Collisions {count}")
+        scene.culling = False
+        for index in range(count):
+            transform = Transform(Vector2(rng.uniform(0, side), rng.uniform(0, side)), 0, Vector2(rng.uniform(0.2, 1), rng.uniform(0.2, 1)))
+            gameObject = GameObject(f"Box{index}", transform)
+            gameObject.addComponent(BoxCollider)
+            scene.instantiate(gameObject)
+        scene.updateScene()
+        transforms = [gameObject.transform for gameObject in scene.gameObjects]
+
+        def frame():
+            for transform in transforms:
+                transform.position.x += 0.01
+            scene.updateScene()
+            Physics.getOverlappingPairs(scene)
+        return frame
+    return setup
+
+
+register("collisions.brute_force[500]", "collisions", setup_brute_force(500), boxes=500)
+for count in (1_000, 10_000):
+    register(f"collisions.broadphase[{count}]", "collisions", setup_broadphase(count), heavy=count > 1_000, boxes=count)
@@ -0,0 +1,37 @@
+"""ParticleSystem simulation and instance building at steady state for several max_particles."""
+
+from AuroraEngine.essentials import GameObject, System
+from AuroraEngine.graphics.gl import opengl, NullGL
+from AuroraEngine.graphics.batch import SpriteBatch
+from AuroraEngine.graphics.particles import ParticleSystem
+
+from ..harness import register, SkipBenchmark
+from .rendering import offscreen_window
+
+
+def setup_particles(max_particles: int):
+    def setup():
+        # The emitter's renderer sets up the batch's GL resources, which needs some GL target even though nothing is drawn
+        try:
+            offscreen_window()
+        except SkipBenchmark:
+            opengl.bind(NullGL())
+        gameObject = GameObject("Emitter")
+        # Lifetimes of 1-3 s at this rate keep the system full once warmed up
+        system = gameObject.addComponent(ParticleSystem, max_particles=max_particles, emission_rate=max_particles)
+        System.deltaTime = 1 / 60
+        for _ in range(240):
+            system.update()
+            SpriteBatch._groups.clear()
+
+        def frame():
+            system.update()
+            # Drop the queued instances instead of drawing them, this case measures the CPU side only
+            SpriteBatch._groups.clear()
+        return frame
+    return setup
+
+
+for max_particles in (1_000, 10_000, 100_000):
+    register(f"particles.update[{max_particles}]", "particles", setup_particles(max_particles), number=5,
+             heavy=max_particles > 10_000, max_particles=max_particles)
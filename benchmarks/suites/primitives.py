@@ -0,0 +1,42 @@
+"""Micro-benchmarks of the value types every component leans on: Vector2, Mathf and Color32."""
+
+from AuroraEngine.essentials import Vector2, Mathf, Color32
+
+from ..harness import register
+
+LOOPS = 10_000
+
+
+def setup_statement(statement: str, env: dict):
+    # One compiled loop per sample keeps the harness's per-call overhead out of nanosecond-scale operations
+    code = compile(f"for _ in range({LOOPS}):\n    {statement}", f"<{statement}>", "exec")
+
+    def setup():
+        scope = dict(env)
+        return lambda: exec(code, scope)
+    return setup
+
+
+def vectors() -> dict:
+    return {"a": Vector2(1.5, -2.0), "b": Vector2(3.0, 4.0), "out": Vector2(0, 0), "Vector2": Vector2}
+
+
+CASES = [
+    ("vector2.add", "a + b", vectors),
+    ("vector2.iadd", "a += b", vectors),
+    ("vector2.magnitude", "b.magnitude()", vectors),
+    ("vector2.normalized", "b.normalized()", vectors),
+    ("vector2.normalizedInto", "b.normalizedInto(out)", vectors),
+    ("vector2.distanceTo", "a.distanceTo(b)", vectors),
+    ("vector2.lerpInto", "Vector2.lerpInto(out, a, b, 0.25)", vectors),
+    ("mathf.lerp", "Mathf.lerp(0.0, 10.0, 0.3)", lambda: {"Mathf": Mathf}),
+    ("mathf.clamp", "Mathf.clamp(12.0, 0.0, 10.0)", lambda: {"Mathf": Mathf}),
+    ("color32.new", "Color32(255, 128, 0, 1)", lambda: {"Color32": Color32}),
+    ("color32.hex", "Color32('#ff8000')", lambda: {"Color32": Color32}),
+    ("color32.lerp", "Color32.lerp(c1, c2, 0.5)", lambda: {"Color32": Color32, "c1": Color32(255, 0, 0), "c2": Color32(0, 0, 255)}),
+    ("color32.lerpInto", "Color32.lerpInto(out, c1, c2, 0.5)",
+     lambda: {"Color32": Color32, "c1": Color32(255, 0, 0), "c2": Color32(0, 0, 255), "out": Color32(0, 0, 0)}),
+]
+
+for name, statement, env in CASES:
+    register(f"{name}[x{LOOPS}]", "primitives", setup_statement(statement, env()), statement=statement, loops=LOOPS)
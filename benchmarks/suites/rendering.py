@@ -0,0 +1,61 @@
+"""
+Draw throughput of VBO_SpriteRenderer (instanced SpriteBatch) against SpriteRenderer (immediate mode) on the
+offscreen backend. glFinish is part of each frame so GPU work is counted, not just command submission.
+"""
+
+import random
+from typing import Optional
+
+from AuroraEngine.essentials import GameObject, Transform, Vector2, Color32, System
+from AuroraEngine.scenes import Scene
+from AuroraEngine.graphics.gl import opengl, NullGL
+from AuroraEngine.graphics.batch import SpriteBatch
+from AuroraEngine.components.VBOSpriteRenderer import VBO_SpriteRenderer
+from AuroraEngine.components.SpriteRenderer import SpriteRenderer
+
+from ..harness import register, SkipBenchmark
+
+_window = None
+_window_error: Optional[str] = None
+
+
+def offscreen_window():
+    global _window, _window_error
+    if _window is None and _window_error is None:
+        if isinstance(opengl.target, NullGL):
+            _window_error = "GL calls are bound to the null backend"
+        else:
+            try:
+                from AuroraEngine.graphics.window import Window
+                _window = Window((512, 512), "Benchmark", backend="offscreen")
+            except Exception as error:
+                _window_error = str(error)
+    if _window is None:
+        raise SkipBenchmark(f"no offscreen context ({_window_error})")
+    return _window
+
+
+def setup_frame(renderer: type, count: int):
+    def setup():
+        window = offscreen_window()
+        rng = random.Random(count)
+        scene = Scene(f"{renderer.__name__} {count}")
+        for index in range(count):
+            transform = Transform(Vector2(rng.uniform(-1, 1), rng.uniform(-1, 1)), rng.uniform(0, 360), Vector2(0.05, 0.05))
+            gameObject = GameObject(f"Sprite{index}", transform)
+            gameObject.addComponent(renderer, "rectangle", Color32(rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)))
+            scene.instantiate(gameObject)
+        System.fixedSteps = 0
+
+        def frame():
+            window.refresh()
+            scene.updateScene()
+            SpriteBatch.flush()
+            opengl.glFinish()
+        return frame
+    return setup
+
+
+for count in (1_000, 10_000):
+    register(f"render.vbo_sprite[{count}]", "rendering", setup_frame(VBO_SpriteRenderer, count), heavy=count > 1_000, sprites=count)
+    register(f"render.sprite[{count}]", "rendering", setup_frame(SpriteRenderer, count), heavy=count > 1_000, sprites=count)
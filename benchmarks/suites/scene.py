@@ -0,0 +1,49 @@
+"""Scene.updateScene over many GameObjects with cheap scripted components: the per-object Python overhead."""
+
+import random
+
+from AuroraEngine.essentials import GameObject, Component, Transform, Vector2, System
+from AuroraEngine.scenes import Scene
+
+from ..harness import register
+
+
+class Spin(Component):
+    def update(self):
+        self.gameObject.transform.rotation += 90 * System.deltaTime
+
+
+class Drift(Component):
+    def __init__(self, gameObject: GameObject, velocity: Vector2):
+        super().__init__(gameObject)
+        self.velocity = velocity
+
+    def update(self):
+        position = self.gameObject.transform.position
+        position.x += self.velocity.x * System.deltaTime
+        position.y += self.velocity.y * System.deltaTime
+
+
+def build_scene(count: int, seed: int = 1) -> Scene:
+    rng = random.Random(seed)
+    scene = Scene(f"Benchmark {count}")
+    scene.culling = False
+    for index in range(count):
+        gameObject = GameObject(f"Object{index}", Transform(Vector2(rng.uniform(-50, 50), rng.uniform(-50, 50)), 0, Vector2(1, 1)))
+        gameObject.addComponent(Spin)
+        gameObject.addComponent(Drift, Vector2(rng.uniform(-1, 1), rng.uniform(-1, 1)))
+        scene.instantiate(gameObject)
+    return scene
+
+
+def setup_update(count: int):
+    def setup():
+        scene = build_scene(count)
+        System.deltaTime = 1 / 60
+        System.fixedSteps = 0
+        return scene.updateScene
+    return setup
+
+
+for count in (1_000, 10_000, 100_000):
+    register(f"scene.update[{count}]", "scene", setup_update(count), heavy=count > 10_000, objects=count)
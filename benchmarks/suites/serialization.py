@@ -0,0 +1,90 @@
+"""Loading a level from a binary scene file against building the same level in code."""
+
+import os
+import random
+import tempfile
+from typing import Optional
+
+from AuroraEngine.essentials import GameObject, Component, Transform, Vector2, Color32
+from AuroraEngine.scenes import Scene
+from AuroraEngine.graphics.gl import opengl, NullGL
+from AuroraEngine.components.VBOSpriteRenderer import VBO_SpriteRenderer
+from AuroraEngine.graphics.particles import ParticleSystem
+from AuroraEngine.simulation.physics import BoxCollider
+from AuroraEngine.serialization import SceneSerializer
+
+from ..harness import register, SkipBenchmark
+from .rendering import offscreen_window
+
+
+class Patrol(Component):
+    serializedFields = ("speed", "waypoint")
+
+    def __init__(self, gameObject: GameObject, speed: float = 1.0, waypoint: Optional[Vector2] = None):
+        super().__init__(gameObject)
+        self.speed = speed
+        self.waypoint = waypoint
+
+
+def build_level(count: int, seed: int = 1) -> Scene:
+    rng = random.Random(seed)
+    scene = Scene(f"Level {count}")
+    for index in range(count):
+        gameObject = GameObject(f"Object{index}", Transform(Vector2(rng.uniform(-50, 50), rng.uniform(-50, 50)), rng.uniform(0, 360), Vector2(1, 1)))
+        gameObject.addComponent(VBO_SpriteRenderer, "rectangle" if index % 2 else "triangle",
+                                Color32(rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)))
+        if index % 4 == 0:
+            gameObject.addComponent(Patrol, rng.uniform(1, 3), Vector2(rng.uniform(-50, 50), rng.uniform(-50, 50)))
+        scene.instantiate(gameObject)
+    return scene
+
+
+def bind_gl() -> None:
+    # Renderers set up the batch's GL resources on creation; nothing is drawn
+    try:
+        offscreen_window()
+    except SkipBenchmark:
+        opengl.bind(NullGL())
+
+
+def check_round_trip() -> None:
+    # Components that look up their siblings in start() must find the loaded ones, not add their own
+    scene = Scene("Round trip")
+    gameObject = GameObject("Emitter")
+    gameObject.addComponent(ParticleSystem)  # Adds its VBO_SpriteRenderer in start(), after itself
+    gameObject.getComponent(VBO_SpriteRenderer).color = Color32(255, 128, 0)
+    scene.instantiate(gameObject)
+    wall = GameObject("Wall")
+    wall.addComponent(BoxCollider, Vector2(2.5, 0.5), Vector2(0, -1.25))
+    scene.instantiate(wall)
+    expected = SceneSerializer.toDict(scene)
+    for _ in range(3):
+        scene = SceneSerializer.loads(SceneSerializer.dumps(scene))
+        assert SceneSerializer.toDict(scene) == expected, SceneSerializer.toDict(scene)
+    loaded = scene.gameObjects[0]
+    assert [type(component) for component in loaded.components] == [ParticleSystem, VBO_SpriteRenderer]
+    assert loaded.getComponent(ParticleSystem).sprite_renderer is loaded.getComponent(VBO_SpriteRenderer)
+    collider = scene.gameObjects[1].getComponent(BoxCollider)
+    assert (tuple(collider.size), tuple(collider.offset)) == ((2.5, 0.5), (0, -1.25))
+
+
+def setup_build(count: int):
+    def setup():
+        bind_gl()
+        return lambda: build_level(count)
+    return setup
+
+
+def setup_load(count: int):
+    def setup():
+        bind_gl()
+        check_round_trip()
+        path = os.path.join(tempfile.gettempdir(), f"aurora_benchmark_level_{count}.aus")
+        SceneSerializer.save(build_level(count), path)
+        return lambda: SceneSerializer.load(path)
+    return setup
+
+
+for count in (10_000, 100_000):
+    register(f"scene.build_code[{count}]", "serialization", setup_build(count), heavy=count > 10_000, objects=count)
+    register(f"scene.load_binary[{count}]", "serialization", setup_load(count), heavy=count > 10_000, objects=count)
@@ -0,0 +1,92 @@
+"""
+Micro-benchmark for Vector2 operations: per-op time and bytes allocated, before (allocating operators on a
+dict-backed vector) and after (slotted vector with in-place and *Into variants).
+
+Run from the repository root: python -m benchmarks.vector_ops
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from AuroraEngine.essentials import Vector2
+
+
+class LegacyVector2:
+    """The pre-__slots__ Vector2 layout and operators, kept here as the 'before' reference."""
+
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+
+    def magnitude(self) -> float:
+        return (self.x**2 + self.y**2)**0.5
+
+    def __add__(self, other: "LegacyVector2") -> "LegacyVector2":
+        return LegacyVector2(self.x + other.x, self.y + other.y)
+
+    def __mul__(self, scalar) -> "LegacyVector2":
+        return LegacyVector2(self.x * scalar, self.y * scalar)
+
+    def distanceTo(self, other: "LegacyVector2") -> float:
+        return LegacyVector2(abs(self.x - other.x), abs(self.y - other.y)).magnitude()
+
+    def normalized(self) -> "LegacyVector2":
+        mag = self.magnitude()
+        return LegacyVector2(self.x / mag, self.y / mag)
+
+    @staticmethod
+    def lerp(vec1: "LegacyVector2", vec2: "LegacyVector2", t: float) -> "LegacyVector2":
+        return LegacyVector2(vec1.x + (vec2.x - vec1.x) * t, vec1.y + (vec2.y - vec1.y) * t)
+
+
+def instance_size(vector) -> int:
+    size = sys.getsizeof(vector)
+    if hasattr(vector, "__dict__"):
+        size += sys.getsizeof(vector.__dict__)
+    return size
+
+
+def measure(statement, setup: dict, number: int) -> tuple[float, float]:
+    """Returns (nanoseconds per op, bytes allocated per op) for a statement run in a loop."""
+    seconds = min(timeit.repeat(statement, globals=setup, number=number, repeat=5))
+
+    # Keep every result alive so that allocations show up in the traced peak
+    keep = []
+    setup = dict(setup, keep=keep)
+    loop = compile(f"for _ in range({number}):\n    keep.append({statement})", "<bench>", "exec")
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    exec(loop, setup)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list itself grows by one pointer per op in both cases
+    allocated = (after - before) / number - 8
+    return seconds / number * 1e9, max(allocated, 0.0)
+
+
+def main(number: int = 200_000) -> None:
+    a, b = Vector2(1.5, -2.0), Vector2(3.0, 4.0)
+    la, lb = LegacyVector2(1.5, -2.0), LegacyVector2(3.0, 4.0)
+    out = Vector2(0, 0)
+    env = {"a": a, "b": b, "la": la, "lb": lb, "out": out, "Vector2": Vector2, "LegacyVector2": LegacyVector2}
+
+    cases = [
+        ("add",          "la + lb",                          "a.__iadd__(b)"),
+        ("scale",        "la * 0.5",                         "a.__imul__(1.0)"),
+        ("distance",     "la.distanceTo(lb)",                "a.distanceTo(b)"),
+        ("distance^2",   "la.distanceTo(lb)",                "a.distanceSquaredTo(b)"),
+        ("normalized",   "lb.normalized()",                  "b.normalizedInto(out)"),
+        ("lerp",         "LegacyVector2.lerp(la, lb, 0.25)", "Vector2.lerpInto(out, a, b, 0.25)"),
+    ]
+
+    print(f"instance size: before {instance_size(la)} B, after {instance_size(a)} B")
+    print(f"{'op':<12}{'before ns':>12}{'after ns':>12}{'before B/op':>14}{'after B/op':>13}")
+    for name, before, after in cases:
+        before_ns, before_bytes = measure(before, env, number)
+        after_ns, after_bytes = measure(after, env, number)
+        print(f"{name:<12}{before_ns:>12.1f}{after_ns:>12.1f}{before_bytes:>14.1f}{after_bytes:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
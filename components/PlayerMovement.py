@@ -2,6 +2,7 @@ from AuroraEngine import *
 from AuroraEngine.essentials import GameObject
 
 class PlayerMovement(Component):
+    serializedFields = ("speed", "rotationSpeed")
     def __init__(self, gameObject: GameObject, speed: float, rotationSpeed: float):
         super().__init__(gameObject)
         self.rotationSpeed: float = rotationSpeed